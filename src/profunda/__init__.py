@@ -4,6 +4,7 @@ from importlib.metadata import version
 
 from profunda.compare_reports import compare
 from profunda.controller import pandas_decorator
+from profunda.merge_reports import merge, merge_descriptions
 from profunda.profile_report import ProfileReport
 
 __version__ = version("profunda")
@@ -13,4 +14,6 @@ __all__ = [
     "ProfileReport",
     "__version__",
     "compare",
+    "merge",
+    "merge_descriptions",
 ]
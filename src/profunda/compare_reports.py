@@ -148,6 +148,10 @@ def _compare_profile_report_preprocess(
     return labels, descriptions
 
 
+# Fields of the description about the profiling run rather than the data.
+_RUN_METADATA = ("context", "queries", "performance")
+
+
 def _compare_dataset_description_preprocess(
     reports: List[BaseDescription],
 ) -> Tuple[List[str], List[BaseDescription]]:
@@ -350,6 +354,10 @@ def compare(
     _placeholders(descriptions)
 
     descriptions_dict = [asdict(_apply_config(d, _config)) for d in descriptions]
+    # The metadata of the profiling runs is not compared.
+    for description in descriptions_dict:
+        for key in _RUN_METADATA:
+            description.pop(key, None)
 
     res: dict = _update_merge(None, descriptions_dict[0])
     for r in descriptions_dict[1:]:
@@ -69,6 +69,8 @@ class CatVars(BaseModel):
     redact: bool = False
     histogram_largest: int = 50
     stop_words: List[str] = []
+    # Keep the counts of at most this many words, set to zero to keep every word
+    words_top_k: int = 0
     dirty_categories: bool = False
     dirty_categories_threshold: float = 0.85
 
@@ -232,6 +234,9 @@ class Html(BaseModel):
 
     full_width: bool = False
 
+    # Show the wall time, CPU time and memory use of each profiling stage
+    performance_show: bool = False
+
 
 class Duplicates(BaseModel):
     head: int = 10
@@ -286,11 +291,124 @@ class Notebook(BaseModel):
     iframe: Iframe = Iframe()
 
 
+class HeavyHitters(BaseModel):
+    # Only count the most frequent values of high-cardinality columns, instead of
+    # counting every distinct value. Columns at or below the distinct ratio, and
+    # columns not longer than the sample, are always counted in full.
+    enabled: bool = True
+
+    # The number of most frequent values to keep
+    k: int = 200
+
+    # A column is high-cardinality when its estimated ratio of distinct values to
+    # values exceeds this threshold
+    distinct_ratio: float = 0.5
+
+    # The number of leading values used to estimate the ratio of distinct values
+    # (pandas). Shorter columns are always counted in full.
+    sample_size: int = 10000
+
+
+class Partial(BaseModel):
+    # Record a mergeable summary of each column, to merge the descriptions of the
+    # partitions of a dataset with `merge_descriptions`
+    enabled: bool = False
+
+    # The number of most frequent values kept per column. Columns with more
+    # distinct values in a partition are merged approximately.
+    top_k: int = 1000
+
+    # The number of points of the quantile sketch of numeric and date columns
+    sketch_size: int = 2000
+
+    # The precision of the distinct count sketch (2^precision registers)
+    hll_precision: int = 14
+
+    # Bin edges shared by all partitions, per column, to merge the histograms
+    # exactly. Other histograms are rebuilt from the quantile sketch.
+    bin_edges: Dict[str, List[float]] = {}
+
+
+class TypeInference(BaseModel):
+    # If positive, infer the type of string columns with more distinct values
+    # than this on a sample of this many distinct values, then verify it over
+    # all distinct values. Zero infers on every value.
+    sample_size: int = 0
+
+    # Cache the inferred types on disk, keyed by the name, dtype and distinct
+    # values of the columns, to reuse them when the columns are profiled again
+    cache: bool = False
+
+    # The directory of the cache, `~/.cache/profunda` by default
+    cache_dir: Optional[str] = None
+
+    # The maximum number of columns in the cache, the least recently used are
+    # evicted
+    cache_size: int = 10000
+
+
 class Report(BaseModel):
     # Numeric precision for displaying statistics
     precision: int = 8
 
 
+class IbisApproximate(BaseModel):
+    """Families of statistics to estimate with approximate aggregates"""
+
+    # The number of distinct values (e.g. HyperLogLog), and of unique values from
+    # it, without querying the value counts beyond the most frequent values
+    distinct: bool = False
+
+    # The quantiles, the median and the median absolute deviation
+    quantiles: bool = False
+
+
+class Backend(BaseModel):
+    """Settings of the backend profiling pandas DataFrames"""
+
+    # "pandas" to profile pandas DataFrames natively, "ibis" to load them in DuckDB
+    # first, or "auto" to choose by their size and the requested features.
+    engine: str = "auto"
+
+    # With "auto", DataFrames with more cells (rows x columns) than this are
+    # profiled with DuckDB and the Ibis defaults, unless the caller enables a
+    # feature only the pandas backend supports (time series, dtype inference, type
+    # schema, text statistics). The threshold bounds the memory of the run: pandas
+    # peaks at about twice the size of the DataFrame, DuckDB at less than half of
+    # that, and scales with the cores.
+    max_pandas_cells: int = 10_000_000
+
+
+class Ibis(BaseModel):
+    """Settings specific to the Ibis backend"""
+
+    # Describe the columns, and run the independent stages of the profiling run,
+    # concurrently using `pool_size` workers. Each worker queries the backend
+    # through its own connection where needed (e.g. DuckDB).
+    concurrent: bool = False
+
+    # Compute the rank correlations on a random sample of about this many rows.
+    # None to use the full table.
+    correlation_sample_size: Optional[int] = None
+
+    # Use the approximate aggregates of the backend for these statistics. Exact
+    # aggregates are used when the backend does not support them.
+    approximate: IbisApproximate = IbisApproximate()
+
+    # The value counts of a column are cached in the backend while the column is
+    # described. Columns with more (estimated) distinct values than this are not
+    # cached, but recomputed when needed. None to cache all columns.
+    cache_max_distinct: Optional[int] = None
+
+    # The maximum number of rows of value counts cached at the same time. None for
+    # no limit.
+    cache_max_rows: Optional[int] = None
+
+    # Record the queries issued by the profiling run (stage, column, SQL, wall time
+    # and rows) in the description.
+    trace: bool = False
+
+
 class Settings(BaseSettings):
     # Default prefix to avoid collisions with environment variables
     class Config:
@@ -302,6 +420,7 @@ class Settings(BaseSettings):
     dataset: Dataset = Dataset()
     variables: Variables = Variables()
     infer_dtypes: bool = True
+    type_inference: TypeInference = TypeInference()
 
     # Show the description at each variable (in addition to the overview tab)
     show_variable_description: bool = True
@@ -309,6 +428,11 @@ class Settings(BaseSettings):
     # Number of workers (0=multiprocessing.cpu_count())
     pool_size: int = 0
 
+    # Run the independent stages of the profiling run of pandas DataFrames (table
+    # statistics, correlations, duplicates, ...) concurrently with `pool_size`
+    # workers. Ibis tables use `ibis.concurrent` instead.
+    concurrent_stages: bool = False
+
     # Show the progress bar
     progress_bar: bool = True
 
@@ -351,11 +475,20 @@ class Settings(BaseSettings):
     n_freq_table_max: int = 10
     n_extreme_obs: int = 10
 
+    # Top-k value counts for high-cardinality columns
+    heavy_hitters: HeavyHitters = HeavyHitters()
+
+    # Mergeable summaries of partitions
+    partial: Partial = Partial()
+
     # Report rendering
     report: Report = Report()
     html: Html = Html()
     notebook: Notebook = Notebook()
 
+    backend: Backend = Backend()
+    ibis: Ibis = Ibis()
+
     def update(self, updates: dict) -> "Settings":
         update = _merge_dictionaries(self.dict(), updates)
         return self.parse_obj(self.copy(update=update))
@@ -423,6 +556,7 @@ class IbisSettings(Settings):
     infer_dtypes: bool = False
 
     correlations: Dict[str, Correlation] = {
+        "spearman": Correlation(key="spearman", calculate=True),
         "pearson": Correlation(key="pearson", calculate=True),
     }
 
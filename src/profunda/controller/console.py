@@ -5,7 +5,13 @@ from pathlib import Path
 from typing import Any, List, Optional
 
 from profunda.__init__ import ProfileReport, __version__
-from profunda.utils.dataframe import read_pandas
+from profunda.utils.dataframe import uncompressed_extension
+
+# The file types scanned directly by DuckDB, the others are read with pandas.
+SCANNED_FILES = [".csv", ".tsv", ".json", ".jsonl", ".parquet"]
+
+# The number of rows read at once in streaming mode, unless `--chunksize` is given.
+STREAMING_CHUNKSIZE = 100_000
 
 
 def parse_args(args: Optional[List[Any]] = None) -> argparse.Namespace:
@@ -81,6 +87,20 @@ def parse_args(args: Optional[List[Any]] = None) -> argparse.Namespace:
         help="Specify a yaml config file. Have a look at the 'config_default.yaml' as a starting point.",
     )
 
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Read the file in chunks of this number of rows, to profile files larger than memory",
+    )
+
+    parser.add_argument(
+        "--streaming",
+        default=False,
+        action="store_true",
+        help=f"Read the file in chunks ({STREAMING_CHUNKSIZE} rows unless --chunksize is given)",
+    )
+
     parser.add_argument(
         "input_file",
         type=str,
@@ -115,12 +135,18 @@ def main(args: Optional[List[Any]] = None) -> None:
 
     silent = kwargs.pop("silent")
 
-    # read the DataFrame
-    df = read_pandas(input_file)
-
-    # Generate the profiling report
-    p = ProfileReport(
-        df,
-        **kwargs,
-    )
+    chunksize = kwargs.pop("chunksize")
+    if kwargs.pop("streaming") and chunksize is None:
+        chunksize = STREAMING_CHUNKSIZE
+
+    # Scan the file with DuckDB if possible, otherwise read it at once or in
+    # chunks, and generate the profiling report
+    if chunksize is None and uncompressed_extension(input_file) in SCANNED_FILES:
+        p = ProfileReport.from_file(input_file, **kwargs)
+    else:
+        p = ProfileReport.from_path(
+            input_file,
+            chunksize=chunksize,
+            **kwargs,
+        )
     p.to_file(Path(output_file), silent=silent)
@@ -0,0 +1,237 @@
+import json
+from collections import Counter
+from dataclasses import replace
+from functools import reduce
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from profunda.config import Settings
+from profunda.model import BaseAnalysis, BaseDescription
+from profunda.model.alerts import get_alerts
+from profunda.model.partial import PartialSummary, describe_partial
+from profunda.model.summary_algorithms import mark_approximated
+from profunda.profile_report import ProfileReport
+
+
+def _merge_table(
+    config: Settings, descriptions: Sequence[BaseDescription], variables: dict
+) -> dict:
+    n = sum(d.table["n"] for d in descriptions)
+
+    table = {
+        "n": n,
+        "n_var": len(variables),
+        "n_cells_missing": sum(v["n_missing"] for v in variables.values()),
+        "n_vars_with_missing": sum(v["n_missing"] > 0 for v in variables.values()),
+        "n_vars_all_missing": sum(
+            v["n_missing"] == n and n > 0 for v in variables.values()
+        ),
+        "types": dict(Counter(v["type"] for v in variables.values())),
+    }
+    table["p_cells_missing"] = (
+        table["n_cells_missing"] / (n * table["n_var"])
+        if n > 0 and table["n_var"] > 0
+        else 0
+    )
+
+    # Not all backends measure the memory size of the table.
+    if all("memory_size" in d.table for d in descriptions):
+        table["memory_size"] = sum(d.table["memory_size"] for d in descriptions)
+        table["record_size"] = float(table["memory_size"]) / n if n > 0 else 0
+
+    # The duplicates are counted within each partition only, so rows duplicated
+    # across partitions are not detected: the merged count is a lower bound.
+    if all("n_duplicates" in d.table for d in descriptions):
+        table["n_duplicates"] = sum(d.table["n_duplicates"] for d in descriptions)
+        table["p_duplicates"] = table["n_duplicates"] / n if n > 0 else 0.0
+        if sum(d.table["n"] > 0 for d in descriptions) > 1:
+            mark_approximated(table, "n_duplicates", "p_duplicates")
+
+    return table
+
+
+def _merge_duplicates(
+    config: Settings, descriptions: Sequence[BaseDescription]
+) -> Optional[pd.DataFrame]:
+    frames = [d.duplicates for d in descriptions if d.duplicates is not None]
+    if len(frames) == 0:
+        return None
+
+    key = config.duplicates.key
+    columns = [c for c in frames[0].columns if c != key]
+    duplicates = (
+        pd.concat(frames)
+        .groupby(columns, dropna=False, observed=True)[key]
+        .sum()
+        .reset_index()
+    )
+    return duplicates.nlargest(config.duplicates.head, key)
+
+
+def _merge_sample(descriptions: Sequence[BaseDescription]) -> list:
+    # The partitions are in order: the first rows are those of the first
+    # partition, and the last rows those of the last one.
+    last = {sample.id: sample for sample in descriptions[-1].sample}
+    return [
+        last[sample.id] if sample.id == "tail" and "tail" in last else sample
+        for sample in descriptions[0].sample
+    ]
+
+
+def merge_descriptions(
+    descriptions: Sequence[BaseDescription], config: Optional[Settings] = None
+) -> BaseDescription:
+    """Merge the descriptions of the partitions of a dataset into one description.
+
+    Each partition is profiled separately (e.g. in another process or on another
+    machine) with `config.partial.enabled`, which records a mergeable summary of
+    each column. The descriptions must be given in the order of the partitions.
+
+    The variables and the table statistics are merged from the summaries. The
+    statistics that cannot be merged exactly are estimated and marked as
+    approximated (see `profunda.model.partial`). The correlations, interactions
+    and missing value diagrams require the whole dataset and are left out. The
+    duplicate rows are those found within each partition, rows duplicated across
+    partitions are not counted: `n_duplicates` is a lower bound, marked as
+    approximated.
+
+    Args:
+        descriptions: the descriptions of the partitions, in order
+        config: the settings of the merged description, those of the first
+            partition by default
+
+    Returns:
+        The description of the whole dataset.
+
+    Raises:
+        ValueError: if there are no descriptions, if the partitions have different
+            columns, or were profiled without `config.partial.enabled`.
+    """
+    if len(descriptions) == 0:
+        raise ValueError("No descriptions available for merging.")
+
+    if config is None:
+        config = Settings().update(
+            json.loads(descriptions[0].package["profunda_config"])
+        )
+
+    columns = list(descriptions[0].variables)
+    for description in descriptions[1:]:
+        if list(description.variables) != columns:
+            raise ValueError("The partitions must have the same columns.")
+
+    variables: Dict[str, dict] = {}
+    for column in columns:
+        partials: List[PartialSummary] = [
+            d.variables[column].get("partial") for d in descriptions
+        ]
+        if any(partial is None for partial in partials):
+            raise ValueError(
+                f"Column '{column}' has no mergeable summary, profile the partitions "
+                "with `config.partial.enabled`."
+            )
+        summary = next(
+            (
+                d.variables[column]
+                for d, partial in zip(descriptions, partials)
+                if partial.count > 0
+            ),
+            descriptions[0].variables[column],
+        )
+        variables[column] = describe_partial(
+            config, reduce(PartialSummary.merge, partials), summary
+        )
+
+    table = _merge_table(config, descriptions, variables)
+
+    analysis = BaseAnalysis(
+        config.title,
+        min(d.analysis.date_start for d in descriptions),
+        max(d.analysis.date_end for d in descriptions),
+    )
+    package = {
+        **descriptions[0].package,
+        "profunda_config": config.json(),
+    }
+    context = dict(sum((Counter(d.context) for d in descriptions), Counter()))
+
+    return BaseDescription(
+        analysis=analysis,
+        time_index_analysis=None,
+        table=table,
+        variables=variables,
+        scatter={},
+        correlations={},
+        missing={},
+        alerts=get_alerts(config, table, variables, {}),
+        package=package,
+        sample=_merge_sample(descriptions),
+        duplicates=_merge_duplicates(config, descriptions),
+        context=context,
+        queries=[q for d in descriptions for q in d.queries],
+        performance=[p for d in descriptions for p in d.performance],
+    )
+
+
+def append_description(
+    description: BaseDescription,
+    appended: BaseDescription,
+    config: Optional[Settings] = None,
+) -> BaseDescription:
+    """Update the description of an append-only table with that of the new rows.
+
+    The mergeable summaries recorded in `description` stand for the rows profiled
+    before, which are not scanned again: only the new rows are profiled, and their
+    summaries are merged into the existing ones (see `merge_descriptions`). The
+    duplicates found within the new rows are added to those found before, and the
+    counts of the most frequent duplicates are summed. A new row that duplicates a
+    row profiled before is not detected, as the earlier rows are not kept, so
+    `n_duplicates` is a lower bound, marked as approximated.
+
+    The queries, metrics and context counters are those of the last run, so that
+    the description does not grow with each update.
+
+    Args:
+        description: the description of the rows profiled before
+        appended: the description of the new rows
+        config: the settings of the updated description, those of `description`
+            by default
+
+    Returns:
+        The description of the whole table.
+    """
+    merged = merge_descriptions([description, appended], config)
+    return replace(
+        merged,
+        context=appended.context,
+        queries=appended.queries,
+        performance=appended.performance,
+    )
+
+
+def merge(
+    reports: Union[List[ProfileReport], List[BaseDescription]],
+    config: Optional[Settings] = None,
+) -> ProfileReport:
+    """Merge the profile reports of the partitions of a dataset.
+
+    Args:
+        reports: the reports, or their descriptions, of the partitions in order
+        config: the settings of the merged report, those of the first partition
+            by default
+
+    Returns:
+        The profile report of the whole dataset.
+    """
+    descriptions = [
+        r.get_description() if isinstance(r, ProfileReport) else r for r in reports
+    ]
+    description = merge_descriptions(descriptions, config)
+
+    profile = ProfileReport(
+        None,
+        config=Settings().update(json.loads(description.package["profunda_config"])),
+    )
+    profile._description_set = description
+    return profile
@@ -0,0 +1,125 @@
+"""Table-level facts shared by the stages of a profiling run."""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, TypeVar
+
+from profunda.model.trace import QueryTrace
+
+T = TypeVar("T")
+
+
+class ProfilingContext:
+    """Memoizes the table-level facts of a profiling run.
+
+    The stages of `describe` need the same facts about the table, such as its row
+    count, its schema, or the null counts and extremes of its columns. Instead of
+    computing them again, each stage looks them up in the context of the run, which
+    computes every fact once. Facts already known from an earlier stage, such as the
+    planned column aggregates, are recorded with `seed`.
+
+    The hit and miss counters are reported in the description, to verify which
+    facts were reused. The context also collects the metrics of the stages of the
+    run, and the trace of its queries if they are recorded.
+
+    Example:
+        >>> context = ProfilingContext()
+        >>> n = context.get(("n", key), lambda: df.count().execute())
+    """
+
+    def __init__(
+        self, trace: Optional[QueryTrace] = None, n_rows: Optional[int] = None
+    ) -> None:
+        self.trace = trace
+        # The number of rows of the profiled table, if known upfront.
+        self.n_rows = n_rows
+        self.performance: List[Dict[str, Any]] = []
+        # The cache of the intermediate tables of the run (e.g. the value counts of
+        # Ibis columns), set while the columns are described.
+        self.table_cache: Optional[Any] = None
+
+        self.hits = 0
+        self.misses = 0
+
+        self._facts: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Look up a fact, computing it on the first request.
+
+        Args:
+            key: The key of the fact.
+            compute: Computes the fact if it is not known yet.
+
+        Returns:
+            The fact.
+        """
+        with self._lock:
+            if key in self._facts:
+                self.hits += 1
+                return self._facts[key]
+
+        value = compute()
+
+        with self._lock:
+            self.misses += 1
+            return self._facts.setdefault(key, value)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Look up a fact without computing it, nor counting the lookup."""
+        with self._lock:
+            return self._facts.get(key, default)
+
+    def seed(self, key: Hashable, value: Any) -> None:
+        """Record a fact computed elsewhere. Known facts are not replaced."""
+        with self._lock:
+            self._facts.setdefault(key, value)
+
+    def update(self, key: Hashable, update: Callable[[Any], Any]) -> None:
+        """Replace a fact by a function of its current value (None if unknown).
+
+        The update is atomic. Pass a function that returns a new value rather than
+        mutating the current one, so lookups that already returned it are safe.
+        """
+        with self._lock:
+            self._facts[key] = update(self._facts.get(key))
+
+    def stats(self) -> Dict[str, int]:
+        """The number of facts, and of the lookups that reused or computed one."""
+        return {
+            "n_facts": len(self._facts),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_active_context: ContextVar[Optional[ProfilingContext]] = ContextVar(
+    "profiling_context", default=None
+)
+
+
+@contextmanager
+def profiling_context(
+    context: Optional[ProfilingContext] = None,
+) -> Iterator[ProfilingContext]:
+    """Make a context the active context of the stages run within the block.
+
+    Args:
+        context: The context to activate. A new context if None.
+
+    Yields:
+        The active context.
+    """
+    context = ProfilingContext() if context is None else context
+    token = _active_context.set(context)
+    try:
+        yield context
+    finally:
+        _active_context.reset(token)
+
+
+def get_context() -> ProfilingContext:
+    """The active context, or a new one that is not shared outside a profiling run."""
+    context = _active_context.get()
+    return ProfilingContext() if context is None else context
@@ -1,6 +1,7 @@
 """Organize the calculation of statistics for each series in this DataFrame."""
 
 from datetime import datetime
+from functools import partial
 from importlib.metadata import version
 from typing import Any, Dict, Optional, Union
 
@@ -11,18 +12,22 @@ from visions import VisionsTypeset
 from profunda.config import Settings
 from profunda.model import BaseAnalysis, BaseDescription
 from profunda.model.alerts import get_alerts
+from profunda.model.context import ProfilingContext, profiling_context
 from profunda.model.correlations import calculate_correlation, get_active_correlations
 from profunda.model.dataframe import ibisDataFrame, preprocess, sparkDataFrame
 from profunda.model.description import TimeIndexAnalysis
 from profunda.model.duplicates import get_duplicates
 from profunda.model.missing import get_missing_active, get_missing_diagram
 from profunda.model.pairwise import get_scatter_plot, get_scatter_tasks
+from profunda.model.performance import measure_stage
 from profunda.model.sample import get_custom_sample, get_sample
+from profunda.model.scheduler import TaskGraph, get_stage_frames
 from profunda.model.summarizer import BaseSummarizer
 from profunda.model.summary import get_series_descriptions
 from profunda.model.table import get_table_stats
 from profunda.model.timeseries_index import get_time_index_description
-from profunda.utils.progress_bar import progress
+from profunda.model.trace import QueryTrace, query_labels, trace_queries
+from profunda.utils.progress_bar import progress, update_bar
 
 __version__ = version("profunda")
 
@@ -69,19 +74,30 @@ def describe(
 
     number_of_tasks = 5
 
-    with tqdm(
-        total=number_of_tasks,
-        desc="Summarize dataset",
-        disable=not config.progress_bar,
-        position=0,
-    ) as pbar:
+    trace = QueryTrace() if config.ibis.trace else None
+    n_rows = len(df) if isinstance(df, pd.DataFrame) else None
+
+    with (
+        profiling_context(ProfilingContext(trace, n_rows=n_rows)) as context,
+        trace_queries(df, trace),
+        tqdm(
+            total=number_of_tasks,
+            desc="Summarize dataset",
+            disable=not config.progress_bar,
+            position=0,
+        ) as pbar,
+    ):
         date_start = datetime.utcnow()
 
         # Variable-specific
         pbar.total += len(df.columns)
-        series_description = get_series_descriptions(
-            config, df, summarizer, typeset, pbar
-        )
+        with (
+            query_labels(stage="Describe variables"),
+            measure_stage("Describe variables"),
+        ):
+            series_description = get_series_descriptions(
+                config, df, summarizer, typeset, pbar
+            )
 
         pbar.set_postfix_str("Get variable types")
         pbar.total += 1
@@ -101,80 +117,163 @@ def describe(
         ]
         pbar.update()
 
+        # The remaining stages only depend on the variable descriptions and on each
+        # other, independent stages run concurrently.
+        pool_size, get_df = get_stage_frames(config, df)
+        correlation_names = get_active_correlations(config)
+        scatter_tasks = get_scatter_tasks(config, interval_columns)
+        pbar.total += len(scatter_tasks)
+
+        graph = TaskGraph()
+
         # Table statistics
-        table_stats = progress(get_table_stats, pbar, "Get dataframe statistics")(
-            config, df, series_description
-        )
+        def table_task(_: dict) -> dict:
+            table_stats = progress(get_table_stats, pbar, "Get dataframe statistics")(
+                config, get_df(), series_description
+            )
+            if table_stats["n"] != 0:
+                update_bar(pbar, total=len(correlation_names))
+            return table_stats
 
-        # Get correlations
-        if table_stats["n"] != 0:
-            correlation_names = get_active_correlations(config)
-            pbar.total += len(correlation_names)
+        graph.add("table", table_task)
 
-            correlations = {
-                correlation_name: progress(
-                    calculate_correlation,
-                    pbar,
-                    f"Calculate {correlation_name} correlation",
-                )(config, df, correlation_name, series_description)
-                for correlation_name in correlation_names
-            }
+        # Get correlations
+        def correlation_task(correlation_name: str, results: dict) -> Any:
+            if results["table"]["n"] == 0:
+                return None
+            return progress(
+                calculate_correlation,
+                pbar,
+                f"Calculate {correlation_name} correlation",
+            )(config, get_df(), correlation_name, series_description)
 
-            # make sure correlations is not None
-            correlations = {
-                key: value for key, value in correlations.items() if value is not None
-            }
-        else:
-            correlations = {}
+        for correlation_name in correlation_names:
+            graph.add(
+                f"correlation {correlation_name}",
+                partial(correlation_task, correlation_name),
+                depends_on=["table"],
+            )
 
         # Scatter matrix
-        pbar.set_postfix_str("Get scatter matrix")
-        scatter_tasks = get_scatter_tasks(config, interval_columns)
-        pbar.total += len(scatter_tasks)
-        scatter_matrix: Dict[Any, Dict[Any, Any]] = {
-            x: {y: None} for x, y in scatter_tasks
-        }
         for x, y in scatter_tasks:
-            scatter_matrix[x][y] = progress(
-                get_scatter_plot, pbar, f"scatter {x}, {y}"
-            )(config, df, x, y, interval_columns)
+            graph.add(
+                f"scatter {x}, {y}",
+                lambda _, x=x, y=y: progress(
+                    get_scatter_plot, pbar, f"scatter {x}, {y}"
+                )(config, get_df(), x, y, interval_columns),
+                exclusive=True,
+            )
 
         # missing diagrams
-        missing_map = get_missing_active(config, table_stats)
-        pbar.total += len(missing_map)
-        missing = {
-            name: progress(get_missing_diagram, pbar, f"Missing diagram {name}")(
-                config, df, settings
-            )
-            for name, settings in missing_map.items()
-        }
-        missing = {name: value for name, value in missing.items() if value is not None}
+        def missing_task(results: dict) -> dict:
+            missing_map = get_missing_active(config, results["table"])
+            update_bar(pbar, total=len(missing_map))
+            missing = {
+                name: progress(get_missing_diagram, pbar, f"Missing diagram {name}")(
+                    config, get_df(), settings
+                )
+                for name, settings in missing_map.items()
+            }
+            return {name: value for name, value in missing.items() if value is not None}
+
+        graph.add("missing", missing_task, depends_on=["table"], exclusive=True)
 
         # Sample
-        pbar.set_postfix_str("Take sample")
-        if sample is None:
-            samples = get_sample(config, df)
-        else:
-            samples = get_custom_sample(sample)
-        pbar.update()
+        def sample_task(_: dict) -> Any:
+            update_bar(pbar, postfix="Take sample")
+            if sample is None:
+                with query_labels(stage="Take sample"), measure_stage("Take sample"):
+                    samples = get_sample(config, get_df())
+            else:
+                samples = get_custom_sample(sample)
+            update_bar(pbar, n=1)
+            return samples
+
+        graph.add("sample", sample_task)
 
         # Duplicates
-        metrics, duplicates = progress(get_duplicates, pbar, "Detecting duplicates")(
-            config, df, supported_columns
+        graph.add(
+            "duplicates",
+            lambda _: progress(get_duplicates, pbar, "Detecting duplicates")(
+                config, get_df(), supported_columns
+            ),
         )
-        table_stats.update(metrics)
 
-        alerts = progress(get_alerts, pbar, "Get alerts")(
-            config, table_stats, series_description, correlations
+        def alerts_task(results: dict) -> list:
+            metrics, _ = results["duplicates"]
+            correlations = {
+                correlation_name: results[f"correlation {correlation_name}"]
+                for correlation_name in correlation_names
+            }
+            return progress(get_alerts, pbar, "Get alerts")(
+                config,
+                {**results["table"], **metrics},
+                series_description,
+                {
+                    key: value
+                    for key, value in correlations.items()
+                    if value is not None
+                },
+            )
+
+        graph.add(
+            "alerts",
+            alerts_task,
+            depends_on=[
+                "table",
+                "duplicates",
+                *(f"correlation {name}" for name in correlation_names),
+            ],
         )
 
+        def time_index_task(results: dict) -> dict:
+            metrics, _ = results["duplicates"]
+            with (
+                query_labels(stage="Get time index description"),
+                measure_stage("Get time index description"),
+            ):
+                return get_time_index_description(
+                    config, get_df(), {**results["table"], **metrics}
+                )
+
         if config.vars.timeseries.active:
-            tsindex_description = get_time_index_description(config, df, table_stats)
+            graph.add("time index", time_index_task, depends_on=["table", "duplicates"])
+
+        results = graph.run(pool_size)
+
+        metrics, duplicates = results["duplicates"]
+        table_stats = results["table"]
+        table_stats.update(metrics)
+        correlations = {
+            correlation_name: results[f"correlation {correlation_name}"]
+            for correlation_name in correlation_names
+        }
+        # make sure correlations is not None
+        correlations = {
+            key: value for key, value in correlations.items() if value is not None
+        }
+        scatter_matrix: Dict[Any, Dict[Any, Any]] = {
+            x: {y: None} for x, y in scatter_tasks
+        }
+        for x, y in scatter_tasks:
+            scatter_matrix[x][y] = results[f"scatter {x}, {y}"]
+        missing = results["missing"]
+        samples = results["sample"]
+        alerts = results["alerts"]
+        tsindex_description = results.get("time index")
 
         pbar.set_postfix_str("Get reproduction details")
         package = {
             "profunda_version": __version__,
             "profunda_config": config.json(),
+            # The backend that profiled the data, see `config.backend`.
+            "backend": (
+                "ibis"
+                if isinstance(df, ibisDataFrame)
+                else "spark"
+                if isinstance(df, sparkDataFrame)
+                else "pandas"
+            ),
         }
         pbar.update()
 
@@ -199,5 +298,8 @@ def describe(
         package=package,
         sample=samples,
         duplicates=duplicates,
+        context=context.stats(),
+        queries=[] if trace is None else trace.records,
+        performance=context.performance,
     )
     return description
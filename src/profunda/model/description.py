@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
@@ -93,6 +93,9 @@ class BaseDescription:
         package (Dict[str, Any]): Contains version of ydata-profiling and config.
         sample (Any): Sample of data.
         duplicates (Any): Description of duplicates.
+        context (Dict[str, int]): Lookups of the table-level facts shared by the stages of the run (hits, misses).
+        queries (List[Dict[str, Any]]): Queries issued by the run (stage, column, sql, start, duration, rows, thread), if `ibis.trace` is set.
+        performance (List[Dict[str, Any]]): Metrics of the stages of the run (stage, column, wall_time, cpu_time, peak_rss_delta, rows).
     """
 
     analysis: BaseAnalysis
@@ -106,3 +109,6 @@ class BaseDescription:
     package: Dict[str, Any]
     sample: Any
     duplicates: Any
+    context: Dict[str, int] = field(default_factory=dict)
+    queries: List[Dict[str, Any]] = field(default_factory=list)
+    performance: List[Dict[str, Any]] = field(default_factory=list)
@@ -60,6 +60,18 @@ class Handler:
         summary = op(*args)[-1]
         return summary
 
+    def plan(self, dtype: str, *args) -> None:
+        """Call the planning hooks of the functions for the given dtype.
+
+        Functions can expose a `plan` attribute to register the work they need
+        ahead of execution (see `profunda.model.ibis.planner_ibis.plans`).
+        Functions without a hook are skipped.
+        """
+        for func in self.mapping.get(dtype, []):
+            plan = getattr(func, "plan", None)
+            if plan is not None:
+                plan(*args)
+
 
 def get_render_map() -> Dict[str, Callable]:
     import profunda.report.structure.variables as render_algorithms
@@ -2,7 +2,11 @@ import importlib
 
 # Dynamically import all modules inside the Ibis folder
 IBIS_MODULES = [
+    "arrow_ibis",
+    "cache_ibis",
+    "context_ibis",
     "correlations_ibis",
+    "cursor_ibis",
     "dataframe_ibis",
     "describe_boolean_ibis",
     "describe_categorical_ibis",
@@ -13,11 +17,15 @@ IBIS_MODULES = [
     "describe_supported_ibis",
     "describe_text_ibis",
     "duplicates_ibis",
+    "file_ibis",
     "missing_ibis",
+    "planner_ibis",
     "sample_ibis",
+    "scheduler_ibis",
     "summary_ibis",
     "table_ibis",
     "timeseries_index_ibis",
+    "trace_ibis",
 ]
 
 
@@ -46,4 +54,5 @@ __all__: list[str] = [
     "get_table_stats_ibis",
     "get_time_index_description_ibis",
     "get_series_descriptions_ibis",
+    "get_stage_frames_ibis",
 ]
@@ -1,14 +1,50 @@
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Type
 
 import ibis
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
 import numpy as np
 from ibis import Table, _
 
 from profunda.config import Settings
+from profunda.model.ibis.context_ibis import row_count
+from profunda.model.ibis.trace_ibis import execute_traced
+
+
+def use_approximation(
+    config: Settings, table: Table, family: str, operation: Type[ops.Node]
+) -> bool:
+    """Whether to estimate a family of statistics with an approximate aggregate.
+
+    Args:
+        config: The settings object.
+        table: The Ibis table that will be aggregated.
+        family: The family of statistics in `config.ibis.approximate`.
+        operation: The approximate operation that would be used.
+
+    Returns:
+        True if the approximation is enabled and supported by the backend.
+    """
+    if not getattr(config.ibis.approximate, family):
+        return False
+
+    backend = table._find_backend(use_default=True)
+    return backend.has_operation(operation)
+
+
+def distinct_estimate(table: Table, column_name: str) -> ir.IntegerScalar:
+    """An (approximate, if supported by the backend) count of distinct values."""
+    col = table[column_name]
+    if table._find_backend(use_default=True).has_operation(ops.ApproxCountDistinct):
+        return col.approx_nunique()
+    return col.nunique()
 
 
 def histogram_compute(
-    config: Settings, series: Table, column_name: Optional[str] = None
+    config: Settings,
+    series: Table,
+    column_name: Optional[str] = None,
+    stats: Optional[dict] = None,
 ) -> Tuple[np.array, np.array]:
     """Calculate the histogram bins and values for a the given column.
 
@@ -22,6 +58,8 @@ def histogram_compute(
         series: The Ibis table used to compute the histogram.
         column_name: The name of the column to use in the histogram operation.
             If None, will use the first column of the table.
+        stats: Optional precomputed `min_val`, `max_val` and `n` of the finite,
+            non-null values. Saves a query when the caller already has them.
 
     Returns:
         A tuple containing the histogram bins and values.
@@ -40,13 +78,12 @@ def histogram_compute(
     if hasattr(clean[column_name], "isinf"):
         clean = clean.filter(~_[column_name].isinf())
 
-    stats = (
-        clean.aggregate(
-            min_val=_[column_name].min(), max_val=_[column_name].max(), n=_.count()
-        )
-        .execute()
-        .to_dict("records")[0]
-    )
+    if stats is None:
+        stats = execute_traced(
+            clean.aggregate(
+                min_val=_[column_name].min(), max_val=_[column_name].max(), n=_.count()
+            )
+        ).to_dict("records")[0]
     min_val = stats["min_val"]
     max_val = stats["max_val"]
     n = stats["n"]
@@ -62,14 +99,13 @@ def histogram_compute(
     # https://numpy.org/doc/stable/reference/generated/numpy.histogram.html
     bin_edges = np.linspace(min_val, max_val, bins + 1)
 
-    hist_df = (
+    hist_df = execute_traced(
         clean.mutate(histogram=_[column_name].bucket(bin_edges, closed="left"))
         .group_by("histogram")
         .aggregate(
             hist=_.count(),
         )
         .order_by("histogram")
-        .execute()
     )
 
     hist_counts = np.zeros(bins, dtype=int)
@@ -93,7 +129,7 @@ def length_summary(series: Table) -> dict:
     """
     column_name = series.columns[0]
 
-    n = series.count().execute()
+    n = row_count(series)
 
     if n == 0:
         return {
@@ -103,17 +139,14 @@ def length_summary(series: Table) -> dict:
             "min_length": np.nan,
         }
 
-    return (
-        series.mutate(length=series[column_name].length())
-        .aggregate(
+    return execute_traced(
+        series.mutate(length=series[column_name].length()).aggregate(
             max_length=_.length.max(),
             mean_length=_.length.mean(),
             median_length=_.length.median(),
             min_length=_.length.min(),
         )
-        .execute()
-        .to_dict("records")[0]
-    )
+    ).to_dict("records")[0]
 
 
 def entropy(table: Table, column_name: str, base: int = None) -> float:
@@ -133,17 +166,20 @@ def entropy(table: Table, column_name: str, base: int = None) -> float:
     # Most backends will ignore nans in the calculations, so we need to handle them here.
     if (
         hasattr(table[column_name], "isnan")
-        and table.aggregate(
-            null_or_nan=(table[column_name].isnan() | table[column_name].isnull()).any()
+        and execute_traced(
+            table.aggregate(
+                null_or_nan=(
+                    table[column_name].isnan() | table[column_name].isnull()
+                ).any()
+            )
         )
-        .execute()
         .iloc[0]
         .item()
     ):
         s = np.nan
 
     else:
-        s = (
+        s = execute_traced(
             table.mutate(pk=table[column_name] / table[column_name].sum())
             .mutate(
                 summand=ibis.cases(
@@ -153,9 +189,7 @@ def entropy(table: Table, column_name: str, base: int = None) -> float:
                 )
             )
             .aggregate(s=_["summand"].sum())
-            .execute()
-            .to_dict("records")[0]["s"]
-        )
+        ).to_dict("records")[0]["s"]
 
         if base is not None:
             s = (s / np.log(base)).item()
@@ -173,7 +207,7 @@ def column_imbalance_score(table: Table, column_name: str) -> float:
     Returns:
         The imbalance score for the column.
     """
-    n_classes = table.count().execute()
+    n_classes = execute_traced(table.count())
     return (
         1 - (entropy(table, "count", base=2) / np.log2(n_classes))
         if n_classes > 1
@@ -0,0 +1,128 @@
+"""Arrow hand-off between pandas, pyarrow and the Ibis backend."""
+
+from typing import Any, Dict, Iterator, Union
+
+import ibis
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from ibis import Table
+
+from profunda.model.ibis.trace_ibis import (
+    execute_traced,
+    to_pyarrow_batches_traced,
+    to_pyarrow_traced,
+)
+
+
+def to_memtable(df: Union[pd.DataFrame, pa.Table]) -> Table:
+    """An in-memory Ibis table of a pandas DataFrame or an Arrow table.
+
+    The data is handed to the backend as an Arrow table, which DuckDB scans
+    without copying it. Arrow tables and the Arrow-backed columns of pandas
+    DataFrames (e.g. `dtype_backend="pyarrow"`) are not copied, the other columns
+    of pandas DataFrames are converted once, instead of each time the table is
+    registered with a connection of the backend.
+
+    Args:
+        df: a pandas DataFrame or an Arrow table
+
+    Returns:
+        The Ibis table.
+    """
+    if isinstance(df, pd.DataFrame):
+        df = pa.Table.from_pandas(df, preserve_index=False)
+    return ibis.memtable(df)
+
+
+def _to_python(scalar: pa.Scalar) -> Any:
+    """A scalar of an Arrow result, as returned by `execute`."""
+    if not scalar.is_valid:
+        if pa.types.is_floating(scalar.type):
+            return np.nan
+        if pa.types.is_temporal(scalar.type):
+            return pd.NaT
+        return None
+
+    value = scalar.as_py()
+    if pa.types.is_date(scalar.type) or pa.types.is_timestamp(scalar.type):
+        return pd.Timestamp(value)
+    return value
+
+
+def fetch_record(query: Table) -> Dict[str, Any]:
+    """The first row of a query, fetched as an Arrow record batch.
+
+    The results of aggregations are not converted to a pandas DataFrame.
+
+    Args:
+        query: an Ibis query, usually an aggregation with a single row
+
+    Returns:
+        The values of the first row, by column name.
+    """
+    batch = to_pyarrow_traced(query.limit(1))
+    return {
+        name: _to_python(column[0])
+        for name, column in zip(batch.column_names, batch.columns)
+    }
+
+
+def fetch_value_counts(query: Table, column_name: str) -> pd.Series:
+    """The value counts of a column, fetched as Arrow.
+
+    String values are kept as Arrow strings in the index, instead of being
+    converted to Python objects.
+
+    Args:
+        query: the values of the column and their `count`
+        column_name: the name of the column
+
+    Returns:
+        The counts, indexed by value.
+    """
+    schema = query.schema()
+    if not schema[column_name].is_string():
+        return execute_traced(query).set_index(column_name)["count"]
+    return _value_counts(to_pyarrow_traced(query), column_name)
+
+
+def fetch_value_count_batches(
+    query: Table, column_name: str, chunk_size: int = 100_000
+) -> Iterator[pd.Series]:
+    """The value counts of a column, streamed as Arrow record batches.
+
+    Only one batch of counts is held at a time, for columns with too many
+    distinct values to fetch at once.
+
+    Args:
+        query: the values of the column and their `count`
+        column_name: the name of the column
+        chunk_size: the maximum number of values per batch
+
+    Yields:
+        The counts of each batch, indexed by value.
+    """
+    reader = to_pyarrow_batches_traced(query, chunk_size=chunk_size)
+    try:
+        for batch in reader:
+            yield _value_counts(batch, column_name)
+    finally:
+        reader.close()
+
+
+def _value_counts(
+    counts: Union[pa.Table, pa.RecordBatch], column_name: str
+) -> pd.Series:
+    """The counts of an Arrow result, indexed by value. Strings stay Arrow strings."""
+    column = counts.column(column_name)
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        values = pd.arrays.ArrowExtensionArray(column)
+    else:
+        values = column.to_pandas()
+    return pd.Series(
+        counts.column("count").to_numpy(),
+        index=pd.Index(values, name=column_name),
+        name="count",
+        copy=False,
+    )
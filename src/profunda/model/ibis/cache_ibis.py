@@ -0,0 +1,120 @@
+"""Lifecycle management of intermediate tables cached in the backend."""
+
+import threading
+from typing import Dict, Optional
+
+from ibis import Table
+
+
+class _Entry:
+    def __init__(self, table: Table, n_rows: int):
+        self.table = table
+        self.n_rows = n_rows
+        self.references = 1
+
+
+class TableCache:
+    """Reference-counted cache of intermediate tables, such as value counts.
+
+    Caching an expression materializes it in the backend. Caching the same
+    expression again returns the existing table and adds a reference. The table is
+    dropped from the backend as soon as every reference is released, instead of
+    when the expression is garbage collected.
+
+    A row budget bounds the number of rows cached at the same time. Expressions
+    that would exceed it are not cached and are returned as is, so the backend
+    recomputes them on every use.
+
+    Example:
+        >>> cache = TableCache(max_rows=1_000_000)
+        >>> value_counts = cache.cache(expr, n_rows=estimated_rows)
+        >>> ...
+        >>> cache.release(value_counts)
+    """
+
+    def __init__(self, max_rows: Optional[int] = None):
+        self.max_rows = max_rows
+
+        self.hits = 0
+        self.skipped = 0
+
+        self._entries: Dict[object, _Entry] = {}
+        # The cache entry of each cached table, by the cached table's operation.
+        self._keys: Dict[object, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def n_tables(self) -> int:
+        """The number of tables currently cached."""
+        return len(self._entries)
+
+    @property
+    def n_rows(self) -> int:
+        """The (estimated) number of rows currently cached."""
+        return sum(entry.n_rows for entry in self._entries.values())
+
+    def cache(self, table: Table, n_rows: Optional[int] = None) -> Table:
+        """Cache a table expression, or add a reference if it is already cached.
+
+        Args:
+            table: The expression to cache.
+            n_rows: The (estimated) number of rows of the result, for the budget.
+                If None, the table is cached regardless of the budget.
+
+        Returns:
+            The cached table, or the expression itself if it does not fit in the
+            budget. Pass it to `release` once it is no longer needed.
+        """
+        key = table.op()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.references += 1
+                self.hits += 1
+                return entry.table
+
+            if (
+                self.max_rows is not None
+                and n_rows is not None
+                and self.n_rows + n_rows > self.max_rows
+            ):
+                self.skipped += 1
+                return table
+
+            cached = table.cache()
+            self._entries[key] = _Entry(cached, n_rows or 0)
+            self._keys[cached.op()] = key
+
+        return cached
+
+    def release(self, table: Table) -> None:
+        """Release a reference to a table returned by `cache`.
+
+        The table is dropped from the backend when its last reference is
+        released. Tables that were not cached are ignored.
+        """
+        with self._lock:
+            key = self._keys.get(table.op())
+            if key is None:
+                return
+
+            entry = self._entries[key]
+            entry.references -= 1
+            if entry.references > 0:
+                return
+
+            del self._entries[key]
+            del self._keys[table.op()]
+
+        entry.table.release()
+
+    def clear(self) -> None:
+        """Drop all cached tables, regardless of their references."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._keys.clear()
+
+        for entry in entries:
+            entry.table.release()
@@ -0,0 +1,87 @@
+"""Table-level facts of Ibis tables, memoized in the profiling context."""
+
+from typing import Any, Dict, Hashable, Tuple
+
+from ibis import Schema, Table
+
+from profunda.model.context import get_context
+from profunda.model.ibis.trace_ibis import execute_traced
+
+
+def table_key(df: Table) -> Hashable:
+    """Key the facts of a table by its expression.
+
+    Tables bound to another connection of the backend (see `bind_table`) refer to
+    the facts of the table they were bound from.
+    """
+    bindings = get_context().peek(("bindings",))
+    if not bindings:
+        return df.op()
+    return df.op().replace(bindings)
+
+
+def _column_key(df: Table, column_name: str) -> Hashable:
+    """Key the facts of a column by its single column table.
+
+    The describers receive single column tables, while other stages receive the
+    full table: both refer to the same facts this way.
+    """
+    if df.columns == (column_name,):
+        return table_key(df)
+    return table_key(df.select(column_name))
+
+
+def bind_table(bound: Table, table: Table) -> None:
+    """Share the facts of a table with its copy bound to another connection."""
+    get_context().update(
+        ("bindings",), lambda bindings: {**(bindings or {}), bound.op(): table.op()}
+    )
+
+
+def row_count(df: Table) -> int:
+    """The number of rows of the table."""
+    return get_context().get(("n", table_key(df)), lambda: execute_traced(df.count()))
+
+
+def schema(df: Table) -> Schema:
+    """The schema of the table."""
+    return get_context().get(("schema", table_key(df)), df.schema)
+
+
+def null_count(df: Table, column_name: str) -> int:
+    """The number of null values in a column of the table."""
+    return get_context().get(
+        ("n_missing", _column_key(df, column_name)),
+        lambda: execute_traced(df[column_name].isnull().sum()),
+    )
+
+
+def extremes(df: Table, column_name: str) -> Tuple[Any, Any]:
+    """The minimum and maximum of a column of the table."""
+    return get_context().get(
+        ("extremes", _column_key(df, column_name)),
+        lambda: tuple(
+            execute_traced(
+                df.aggregate(min=df[column_name].min(), max=df[column_name].max())
+            ).iloc[0]
+        ),
+    )
+
+
+def seed_summaries(df: Table, summaries: Dict[str, dict]) -> None:
+    """Record the facts known from the planned aggregates of each column.
+
+    Args:
+        df: The Ibis Table.
+        summaries: The seeded summary of each column.
+    """
+    context = get_context()
+    for column_name, summary in summaries.items():
+        key = _column_key(df, column_name)
+        if "n" in summary:
+            context.seed(("n", table_key(df)), summary["n"])
+            context.seed(("n", key), summary["n"])
+        if "n_missing" in summary:
+            context.seed(("n_missing", key), summary["n_missing"])
+        if "min" in summary and "max" in summary:
+            context.seed(("extremes", key), (summary["min"], summary["max"]))
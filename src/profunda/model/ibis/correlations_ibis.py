@@ -1,12 +1,268 @@
 """Correlations between variables."""
 
-from typing import Optional
+import itertools
+from typing import Dict, List, Optional, Tuple
 
+import ibis
 import numpy as np
 import pandas as pd
-from ibis import Table
+from ibis import Column, Table
 
 from profunda.config import Settings
+from profunda.model.ibis.context_ibis import row_count
+from profunda.model.ibis.planner_ibis import MAX_METRICS_PER_QUERY, MetricPlanner
+from profunda.model.ibis.trace_ibis import execute_traced
+from profunda.model.pandas.correlations_pandas import _cramers_corrected_stat
+
+# Maximum number of column pairs whose contingency tables are computed in a query.
+MAX_PAIRS_PER_QUERY = 50
+
+
+def _is_valid(c: Column) -> Column:
+    """Determine if the values of a column are neither null nor nan."""
+    out = c.notnull()
+    if hasattr(c, "isnan"):
+        out &= ~c.isnan()
+    return out
+
+
+def _and(masks: List[Column]) -> Optional[Column]:
+    """Combine boolean masks, None if there are none."""
+    combined = None
+    for mask in masks:
+        combined = mask if combined is None else combined & mask
+    return combined
+
+
+def _column_moments(
+    df: Table, columns: List[str], max_metrics_per_query: int
+) -> Tuple[int, Dict[str, dict]]:
+    """Count the valid values and compute the mean of each column."""
+    planner = MetricPlanner(df, max_metrics_per_query=max_metrics_per_query)
+    planner.request("", "n", df.count())
+    for c in columns:
+        col = df[c].cast("float64")
+        valid = _is_valid(col)
+        planner.request(c, "n_valid", valid.sum())
+        planner.request(c, "mean", col.mean(where=valid))
+
+    results = planner.execute()
+    return int(results[""]["n"]), {c: results[c] for c in columns}
+
+
+def _pearson_pairs(
+    df: Table,
+    pairs: List[Tuple[Column, Column, Optional[Column]]],
+    max_metrics_per_query: int,
+) -> List[float]:
+    """Correlate pairs of columns from their sums and cross-products.
+
+    Args:
+        df: The Ibis Table.
+        pairs: The pairs to correlate, as `(x, y, where)`. The columns should be
+            shifted close to their mean for numerical stability. Only the rows where
+            `where` holds are used, or all rows if it is None.
+        max_metrics_per_query: The maximum number of aggregates per query.
+
+    Returns:
+        The correlation of each pair, nan if it is undefined.
+    """
+    planner = MetricPlanner(df, max_metrics_per_query=max_metrics_per_query)
+    for i, (x, y, where) in enumerate(pairs):
+        pair = str(i)
+        planner.request(pair, "n", df.count() if where is None else where.sum())
+        planner.request(pair, "sx", x.sum(where=where))
+        planner.request(pair, "sy", y.sum(where=where))
+        planner.request(pair, "sxx", (x * x).sum(where=where))
+        planner.request(pair, "syy", (y * y).sum(where=where))
+        planner.request(pair, "sxy", (x * y).sum(where=where))
+
+    sums = planner.execute()
+
+    correlations = []
+    for i in range(len(pairs)):
+        pair = {k: np.nan if pd.isna(v) else float(v) for k, v in sums[str(i)].items()}
+        correlation = np.nan
+
+        if pair["n"]:
+            cov = pair["sxy"] - pair["sx"] * pair["sy"] / pair["n"]
+            var_x = pair["sxx"] - pair["sx"] ** 2 / pair["n"]
+            var_y = pair["syy"] - pair["sy"] ** 2 / pair["n"]
+
+            if var_x > 0 and var_y > 0:
+                correlation = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+
+        correlations.append(correlation)
+
+    return correlations
+
+
+def _to_matrix(columns: List[str], correlations: List[float]) -> pd.DataFrame:
+    """Fill a symmetric matrix from the correlations of the pairs `i <= j`."""
+    matrix = np.full([len(columns), len(columns)], np.nan)
+    matrix[np.triu_indices(len(columns))] = correlations
+    matrix.T[np.triu_indices(len(columns))] = correlations
+    return pd.DataFrame(matrix, index=columns, columns=columns)
+
+
+def pearson_matrix(
+    df: Table, columns: List[str], max_metrics_per_query: int = MAX_METRICS_PER_QUERY
+) -> pd.DataFrame:
+    """Compute the Pearson correlation matrix of the given columns.
+
+    Like pandas' `DataFrame.corr`, each pair of columns is correlated over the rows
+    where both values are present (pairwise-complete observations). The matrix is
+    derived from the counts, sums, sums of squares and cross-products of the mean
+    centered columns, which are batched into aggregation queries instead of one
+    query per pair. Sums that do not depend on the pair, e.g. for columns without
+    missing values, are computed once and shared between pairs. The cross-products
+    still grow with the square of the number of columns: k columns need about
+    k²/2 aggregates, split over queries of at most `max_metrics_per_query`.
+
+    Args:
+        df: The Ibis Table.
+        columns: The numeric (or boolean) columns to correlate.
+        max_metrics_per_query: The maximum number of aggregates per query. Wide
+            tables are split over several queries.
+
+    Returns:
+        The correlation matrix.
+    """
+    if not columns:
+        return pd.DataFrame()
+
+    n, moments = _column_moments(df, columns, max_metrics_per_query)
+
+    # Center the columns to keep the cross-products numerically stable.
+    centered = {}
+    valid = {}
+    for c in columns:
+        col = df[c].cast("float64")
+        centered[c] = col - (moments[c]["mean"] if moments[c]["n_valid"] else 0.0)
+        # Columns without missing values do not restrict the pairs they are in.
+        valid[c] = _is_valid(col) if moments[c]["n_valid"] < n else None
+
+    pairs = []
+    for i, x in enumerate(columns):
+        for y in columns[i:]:
+            where = _and(
+                [valid[c] for c in dict.fromkeys((x, y)) if valid[c] is not None]
+            )
+            pairs.append((centered[x], centered[y], where))
+
+    return _to_matrix(columns, _pearson_pairs(df, pairs, max_metrics_per_query))
+
+
+def _average_rank(col: Column, mask: Optional[Column]) -> Column:
+    """Rank the values of a column, giving ties their average rank.
+
+    Only the rows where `mask` holds are ranked, the others are null. The rank is
+    the number of ranked values up to and including the value, minus half of the
+    other values tied with it, like `pd.Series.rank(method="average")`.
+    """
+    up_to = ibis.window(order_by=col, range=(None, 0))
+    tied = ibis.window(group_by=col)
+
+    if mask is None:
+        return col.count().over(up_to) - (col.count().over(tied) - 1) / 2
+
+    included = mask.cast("int64")
+    rank = included.sum().over(up_to) - (included.sum().over(tied) - 1) / 2
+    return ibis.ifelse(mask, rank, ibis.null())
+
+
+def spearman_matrix(
+    df: Table,
+    columns: List[str],
+    max_metrics_per_query: int = MAX_METRICS_PER_QUERY,
+    sample_size: Optional[int] = None,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Compute the Spearman rank correlation matrix of the given columns.
+
+    The values are ranked in the backend with window functions and the ranks are
+    correlated with the batched Pearson computation, so only the matrix comes back.
+    Like pandas' `DataFrame.corr`, each pair is ranked and correlated over the rows
+    where both values are present. Columns without missing values are ranked once;
+    pairs involving columns with missing values need their own ranking.
+
+    Args:
+        df: The Ibis Table.
+        columns: The numeric columns to correlate.
+        max_metrics_per_query: The maximum number of aggregates per query.
+        sample_size: If set, the correlation is computed on a random sample of
+            about this many rows (`TABLESAMPLE`), instead of on the full table.
+        seed: The seed of the sample.
+
+    Returns:
+        The correlation matrix.
+    """
+    if not columns:
+        return pd.DataFrame()
+
+    sample = None
+    if sample_size is not None:
+        n = row_count(df)
+        if sample_size < n:
+            # Materialize the sample, so all queries see the same rows.
+            sample = df.sample(sample_size / n, seed=seed).cache()
+
+    try:
+        return _rank_correlations(
+            df if sample is None else sample, columns, max_metrics_per_query
+        )
+    finally:
+        # Drop the sample from the backend, instead of when it is garbage collected.
+        if sample is not None:
+            sample.release()
+
+
+def _rank_correlations(
+    df: Table, columns: List[str], max_metrics_per_query: int
+) -> pd.DataFrame:
+    """Rank the columns and correlate the ranks, see `spearman_matrix`."""
+    n, moments = _column_moments(df, columns, max_metrics_per_query)
+
+    cols = {c: df[c].cast("float64") for c in columns}
+    incomplete = [c for c in columns if moments[c]["n_valid"] < n]
+    valid = {c: _is_valid(cols[c]) for c in incomplete}
+
+    # The rank of column x over the rows where the columns in `subset` are valid.
+    rank_names: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+    ranks = {}
+
+    def rank(x: str, subset: Tuple[str, ...]) -> str:
+        key = (x, subset)
+        if key not in rank_names:
+            name = rank_names[key] = f"r{len(rank_names)}"
+            ranks[name] = _average_rank(cols[x], _and([valid[c] for c in subset]))
+        return rank_names[key]
+
+    pair_ranks = []
+    for i, x in enumerate(columns):
+        for y in columns[i:]:
+            subset = tuple(c for c in incomplete if c in (x, y))
+            pair_ranks.append(((x, rank(x, subset)), (y, rank(y, subset)), subset))
+
+    # Own ranks, which tell where each column is valid in the ranked table.
+    own_ranks = {c: rank(c, (c,)) for c in incomplete}
+    ranked = df.select(**ranks)
+
+    def centered(column: str, name: str) -> Column:
+        # Shift the ranks by about their mean.
+        return ranked[name] - (moments[column]["n_valid"] + 1) / 2
+
+    pairs = [
+        (
+            centered(*x),
+            centered(*y),
+            _and([ranked[own_ranks[c]].notnull() for c in subset]),
+        )
+        for x, y, subset in pair_ranks
+    ]
+
+    correlations = _pearson_pairs(ranked, pairs, max_metrics_per_query)
+    return _to_matrix(columns, correlations)
 
 
 def pearson_compute(
@@ -17,35 +273,28 @@ def pearson_compute(
     """
     num_cols = [col for col, desc in summary.items() if desc.get("type") == "Numeric"]
 
-    if not num_cols or len(num_cols) < 2:
-        matrix = np.array([])
-        num_cols = []
-
-    else:
-        numeric_table = df[num_cols]
+    if len(num_cols) < 2:
+        return pd.DataFrame()
 
-        matrix = np.empty([len(num_cols), len(num_cols)], dtype=float)
-
-        # TODO: Likely a way to speed this up by writing everything in a single query.
-        for i, col1 in enumerate(num_cols):
-            for j, col2 in enumerate(num_cols):
-                if i <= j:
-                    corr_value = (
-                        numeric_table[col1]
-                        # TODO: Implement with raw math operations for maximal Ibis backend compatibility.
-                        .corr(numeric_table[col2], how="pop")
-                        .execute()
-                    )
-                    matrix[i, j] = corr_value
-                    matrix[j, i] = corr_value
-
-    return pd.DataFrame(matrix, index=num_cols, columns=num_cols)
+    return pearson_matrix(df, num_cols)
 
 
 def spearman_compute(
     config: Settings, df: Table, summary: dict
 ) -> Optional[pd.DataFrame]:
-    raise NotImplementedError()
+    """
+    Compute Spearman correlation matrix for numeric columns.
+
+    Set `config.ibis.correlation_sample_size` to rank a sample of the table only.
+    """
+    num_cols = [col for col, desc in summary.items() if desc.get("type") == "Numeric"]
+
+    if len(num_cols) < 2:
+        return pd.DataFrame()
+
+    return spearman_matrix(
+        df, num_cols, sample_size=config.ibis.correlation_sample_size
+    )
 
 
 def kendall_compute(
@@ -54,10 +303,90 @@ def kendall_compute(
     raise NotImplementedError()
 
 
+def contingency_tables(
+    df: Table,
+    pairs: List[Tuple[str, str]],
+    max_pairs_per_query: int = MAX_PAIRS_PER_QUERY,
+) -> List[pd.DataFrame]:
+    """Compute the contingency tables of pairs of columns.
+
+    The tables are computed by grouped counts in the backend, combined into a
+    single union query per batch of pairs, so only the counts are fetched. Like
+    `pd.crosstab`, rows with a missing value in either column are left out.
+
+    Args:
+        df: The Ibis Table.
+        pairs: The pairs of columns.
+        max_pairs_per_query: The maximum number of pairs per query.
+
+    Returns:
+        The contingency table of each pair, with the values of the first column as
+        the index and the values of the second column as the columns.
+    """
+    counts = []
+    for start in range(0, len(pairs), max_pairs_per_query):
+        queries = []
+        for i, (a, b) in enumerate(
+            pairs[start : start + max_pairs_per_query], start=start
+        ):
+            valid = df.filter(_is_valid(df[a]) & _is_valid(df[b]))
+            queries.append(
+                valid.group_by(x=valid[a].cast("string"), y=valid[b].cast("string"))
+                .aggregate(count=valid.count())
+                .mutate(pair=ibis.literal(i, type="int64"))
+            )
+        counts.append(execute_traced(ibis.union(*queries)))
+
+    grouped = dict(list(pd.concat(counts).groupby("pair"))) if counts else {}
+
+    # Pairs without any complete row have an empty table, like `pd.crosstab`.
+    return [
+        grouped[i].pivot(index="x", columns="y", values="count").fillna(0)
+        if i in grouped
+        else pd.DataFrame()
+        for i in range(len(pairs))
+    ]
+
+
 def cramers_compute(
     config: Settings, df: Table, summary: dict
 ) -> Optional[pd.DataFrame]:
-    raise NotImplementedError()
+    """
+    Compute Cramér's V matrix for categorical and boolean columns.
+
+    The contingency tables are computed in the backend, the chi-squared statistic
+    and its bias correction are computed from the fetched counts.
+    """
+    threshold = config.categorical_maximum_correlation_distinct
+
+    categoricals = sorted(
+        key
+        for key, value in summary.items()
+        if value["type"] in {"Categorical", "Boolean"}
+        and 1 < value["n_distinct"] <= threshold
+    )
+
+    if len(categoricals) <= 1:
+        return None
+
+    matrix = np.zeros((len(categoricals), len(categoricals)))
+    np.fill_diagonal(matrix, 1.0)
+    correlation_matrix = pd.DataFrame(
+        matrix,
+        index=categoricals,
+        columns=categoricals,
+    )
+
+    pairs = list(itertools.combinations(categoricals, 2))
+    for (name1, name2), confusion_matrix in zip(pairs, contingency_tables(df, pairs)):
+        if confusion_matrix.empty:
+            correlation_matrix.loc[name2, name1] = np.nan
+        else:
+            correlation_matrix.loc[name2, name1] = _cramers_corrected_stat(
+                confusion_matrix, correction=True
+            )
+        correlation_matrix.loc[name1, name2] = correlation_matrix.loc[name2, name1]
+    return correlation_matrix
 
 
 def phi_k_compute(config: Settings, df: Table, summary: dict) -> Optional[pd.DataFrame]:
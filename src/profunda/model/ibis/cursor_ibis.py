@@ -0,0 +1,64 @@
+"""Per-thread connections for running Ibis queries concurrently."""
+
+import threading
+
+import ibis
+import ibis.expr.operations as ops
+from ibis import Table
+
+from profunda.model.ibis.context_ibis import bind_table
+
+# Backends whose connections may not be shared between threads. Each thread gets
+# its own cursor on the same database instead.
+CURSOR_BACKENDS = ("duckdb",)
+
+
+def _bind_to_cursor(table: Table, backend: ibis.BaseBackend) -> Table:
+    """Rebind a table expression to a new cursor of the given backend.
+
+    Database tables are pointed at the cursor. In-memory tables are registered on
+    the cursor's connection first, as registrations are local to a connection.
+    """
+    cursor = ibis.duckdb.from_connection(backend.con.cursor())
+
+    op = table.op()
+    replacements = {
+        node: node.copy(source=cursor) for node in op.find(ops.DatabaseTable)
+    }
+    for node in op.find(ops.InMemoryTable):
+        # Executing any query registers the in-memory data on the connection.
+        cursor.execute(node.to_expr().limit(0))
+        replacements[node] = cursor.table(node.name).op()
+
+    return op.replace(replacements).to_expr()
+
+
+class ThreadLocalTable:
+    """Hands out a copy of a table that is safe to query from the calling thread.
+
+    For backends listed in `CURSOR_BACKENDS`, every thread gets the table bound to
+    its own cursor on the same database. Other backends are assumed to handle
+    concurrent queries and get the table as is.
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        self.backend = ibis.get_backend(table)
+        self._local = threading.local()
+
+    @property
+    def requires_cursors(self) -> bool:
+        """Whether each thread needs its own cursor."""
+        return self.backend.name in CURSOR_BACKENDS
+
+    def get(self) -> Table:
+        """The table bound to the current thread's connection."""
+        if not self.requires_cursors:
+            return self.table
+
+        table = getattr(self._local, "table", None)
+        if table is None:
+            table = self._local.table = _bind_to_cursor(self.table, self.backend)
+            bind_table(table, self.table)
+
+        return table
@@ -7,6 +7,7 @@ from ibis import Table
 
 from profunda.config import Settings
 from profunda.model.ibis.algorithms_ibis import column_imbalance_score
+from profunda.model.ibis.trace_ibis import execute_traced
 
 
 def describe_boolean_1d_ibis(
@@ -24,10 +25,10 @@ def describe_boolean_1d_ibis(
     """
     value_counts = summary["value_counts"].drop_null()
 
-    empty = value_counts.count().execute() == 0
+    empty = execute_traced(value_counts.count()) == 0
 
     if not empty:
-        top, freq = value_counts.head(1).to_pandas().iloc[0].to_list()
+        top, freq = execute_traced(value_counts.head(1)).iloc[0].to_list()
         summary.update({"top": top, "freq": freq})
         summary["imbalance"] = column_imbalance_score(value_counts, "count")
 
@@ -7,10 +7,15 @@ from ibis import Table
 from profunda.config import Settings
 from profunda.model.ibis.algorithms_ibis import column_imbalance_score
 from profunda.model.ibis.describe_text_ibis import describe_text_1d_ibis
-from profunda.model.summary_algorithms import describe_categorical_1d
+from profunda.model.ibis.planner_ibis import plans
+from profunda.model.summary_algorithms import (
+    describe_categorical_1d,
+    mark_approximated,
+)
 
 
 @describe_categorical_1d.register
+@plans(describe_text_1d_ibis.plan)
 def describe_categorical_1d_ibis(
     config: Settings, series: Table, summary: dict
 ) -> Tuple[Settings, Table, dict]:
@@ -29,5 +34,7 @@ def describe_categorical_1d_ibis(
 
     value_counts = summary["value_counts"].drop_null()
     summary["imbalance"] = column_imbalance_score(value_counts, "count")
+    if summary.get("heavy_hitters", False):
+        mark_approximated(summary, "imbalance")
 
     return config, series, summary
@@ -1,16 +1,95 @@
 """Ibis counts."""
 
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
 
 import ibis
 import pandas as pd
 from ibis import Table, _  # noqa
 
 from profunda.config import Settings
-from profunda.model.summary_algorithms import describe_counts
+from profunda.model.context import get_context
+from profunda.model.ibis.algorithms_ibis import distinct_estimate
+from profunda.model.ibis.arrow_ibis import (
+    fetch_value_count_batches,
+    fetch_value_counts,
+)
+from profunda.model.ibis.cache_ibis import TableCache
+from profunda.model.ibis.context_ibis import null_count, row_count
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
+from profunda.model.ibis.trace_ibis import execute_traced
+from profunda.model.partial import partial_value_count_batches, partial_value_counts
+from profunda.model.summary_algorithms import (
+    HEAVY_HITTERS_TYPES,
+    describe_counts,
+    mark_approximated,
+)
+
+
+def _plan_counts_ibis(
+    config: Settings, table: Table, column_name: str, planner: MetricPlanner
+) -> None:
+    col = table[column_name]
+    planner.request(column_name, "n_missing", col.isnull().sum())
+
+    # The size of the value counts decides whether they are cached, and whether
+    # only the most frequent values are counted.
+    if (
+        config.ibis.cache_max_distinct is not None
+        or config.ibis.cache_max_rows is not None
+        or config.heavy_hitters.enabled
+    ):
+        planner.request(
+            column_name, "n_distinct_estimate", distinct_estimate(table, column_name)
+        )
+
+
+def _cache_value_counts(
+    config: Settings,
+    value_counts: Table,
+    cache: Optional[TableCache],
+    n_distinct: Optional[int],
+) -> Table:
+    """Cache the value counts, unless they are too large for the cache settings."""
+    if cache is None:
+        return value_counts.cache()
+
+    if n_distinct is None:
+        return cache.cache(value_counts)
+
+    max_distinct = config.ibis.cache_max_distinct
+    if max_distinct is not None and n_distinct > max_distinct:
+        return value_counts
+
+    # Add one row for the missing values.
+    return cache.cache(value_counts, n_rows=int(n_distinct) + 1)
+
+
+def _is_high_cardinality(
+    config: Settings, series: Table, summary: dict, n_missing: int
+) -> bool:
+    """Whether only the most frequent values of the column should be counted."""
+    if (
+        not config.heavy_hitters.enabled
+        or summary.get("type") not in HEAVY_HITTERS_TYPES
+    ):
+        return False
+
+    column_name = series.columns[0]
+    n = summary["n"] if "n" in summary else row_count(series)
+    count = n - n_missing
+    if count <= config.heavy_hitters.sample_size:
+        return False
+
+    n_distinct = summary.get("n_distinct_estimate")
+    if n_distinct is None:
+        n_distinct = execute_traced(distinct_estimate(series, column_name))
+        summary["n_distinct_estimate"] = n_distinct
+
+    return n_distinct / count > config.heavy_hitters.distinct_ratio
 
 
 @describe_counts.register
+@plans(_plan_counts_ibis)
 def describe_counts_ibis(
     config: Settings, series: Table, summary: dict
 ) -> Tuple[Settings, Table, dict]:
@@ -32,17 +111,34 @@ def describe_counts_ibis(
         .order_by(ibis.desc("count"))
     )
 
-    n_missing = series[column_name].isnull().sum().execute()
+    # The null count may already be known from the planned aggregates.
+    n_missing = summary.get("n_missing")
     if n_missing is None:
+        n_missing = null_count(series, column_name)
+    if pd.isna(n_missing):
         n_missing = 0
 
     value_counts_no_nan = value_counts.filter(value_counts[column_name].notnull())
 
-    def top_200_to_pandas(t: Table) -> pd.DataFrame:
-        return t.limit(200).to_pandas().set_index(column_name)["count"]
+    def top_200_to_pandas(t: Table) -> pd.Series:
+        return fetch_value_counts(t.limit(200), column_name)
 
     summary["n_missing"] = n_missing
-    summary["value_counts"] = value_counts.cache()
+    high_cardinality = _is_high_cardinality(config, series, summary, n_missing)
+    n_distinct = summary.pop("n_distinct_estimate", None)
+    if high_cardinality:
+        # Only keep the most frequent values, the distinct count is estimated.
+        value_counts = value_counts_no_nan = value_counts_no_nan.limit(
+            config.heavy_hitters.k
+        )
+        summary["heavy_hitters"] = True
+        summary["n_distinct"] = int(n_distinct)
+        mark_approximated(summary, "value_counts_without_nan")
+        n_distinct = config.heavy_hitters.k
+
+    summary["value_counts"] = _cache_value_counts(
+        config, value_counts, get_context().table_cache, n_distinct
+    )
     summary["value_counts_index_sorted"] = top_200_to_pandas(value_counts)
     summary["value_counts_without_nan"] = top_200_to_pandas(value_counts_no_nan)
 
@@ -56,3 +152,50 @@ def describe_counts_ibis(
     summary["ordering"] = True
 
     return config, series, summary
+
+
+def _partial_counts_complete(summary: dict) -> bool:
+    """Whether the counts of the description hold every value of the column, or
+    the column is a heavy hitter that is not counted again."""
+    value_counts = summary["value_counts_without_nan"]
+    return (
+        summary.get("heavy_hitters", False)
+        or value_counts.sum() >= summary["n"] - summary["n_missing"]
+    )
+
+
+def _partial_counts_query(series: Table) -> Table:
+    column_name = series.columns[0]
+    return (
+        series.filter(series[column_name].notnull())
+        .group_by(column_name)
+        .aggregate(count=_.count())
+    )
+
+
+@partial_value_counts.register
+def partial_value_counts_ibis(
+    config: Settings, series: Table, summary: dict
+) -> pd.Series:
+    """The `config.partial.top_k + 1` most frequent values of the column, the
+    description keeps the 200 most frequent only."""
+    if _partial_counts_complete(summary):
+        return summary["value_counts_without_nan"]
+
+    return fetch_value_counts(
+        _partial_counts_query(series)
+        .order_by(ibis.desc("count"))
+        .limit(config.partial.top_k + 1),
+        series.columns[0],
+    )
+
+
+@partial_value_count_batches.register
+def partial_value_count_batches_ibis(
+    config: Settings, series: Table, summary: dict
+) -> Iterable[pd.Series]:
+    """The value counts of the column, streamed in batches."""
+    if _partial_counts_complete(summary):
+        return [summary["value_counts_without_nan"]]
+
+    return fetch_value_count_batches(_partial_counts_query(series), series.columns[0])
@@ -5,10 +5,20 @@ from ibis import Table
 
 from profunda.config import Settings
 from profunda.model.ibis.algorithms_ibis import histogram_compute
+from profunda.model.ibis.context_ibis import extremes
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
 from profunda.model.summary_algorithms import describe_date_1d
 
 
+def _plan_date_ibis(
+    config: Settings, table: Table, column_name: str, planner: MetricPlanner
+) -> None:
+    planner.request(column_name, "min", table[column_name].min())
+    planner.request(column_name, "max", table[column_name].max())
+
+
 @describe_date_1d.register
+@plans(_plan_date_ibis)
 def describe_date_1d_ibis(
     config: Settings, series: Table, summary: dict
 ) -> Tuple[Settings, Table, dict]:
@@ -24,18 +34,16 @@ def describe_date_1d_ibis(
     """
     column_name = series.columns[0]
 
-    if series[column_name].isnull().all().execute():
+    # Nulls are the only invalid dates in a temporal column.
+    n_invalid = summary["n_missing"]
+
+    if n_invalid == summary["n"]:
         summary.update({"min": pd.NaT, "max": pd.NaT, "range": 0, "histogram": []})
 
     else:
-        summary.update(
-            **series.aggregate(
-                min=series[column_name].min(),
-                max=series[column_name].max(),
-            )
-            .execute()
-            .to_dict("records")[0]
-        )
+        # The extremes may already be known from the planned aggregates.
+        if "min" not in summary or "max" not in summary:
+            summary["min"], summary["max"] = extremes(series, column_name)
 
         if pd.isna(summary["min"]) or pd.isna(summary["max"]):
             summary["range"] = 0
@@ -49,11 +57,9 @@ def describe_date_1d_ibis(
 
         summary.update({"histogram": (hist, bin_edges)})
 
-    invalid_dates = series.filter(series[column_name].isnull())
-    n_invalid = invalid_dates.count().execute()
     summary.update(
         {
-            "invalid_dates": invalid_dates.distinct().count().execute(),
+            "invalid_dates": int(n_invalid > 0),
             "n_invalid_dates": n_invalid,
             "p_invalid_dates": n_invalid / summary["n"] if summary["n"] > 0 else 0,
         }
@@ -3,10 +3,19 @@ from typing import Tuple
 import ibis
 
 from profunda.config import Settings
+from profunda.model.ibis.context_ibis import row_count
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
 from profunda.model.summary_algorithms import describe_generic
 
 
+def _plan_generic_ibis(
+    config: Settings, table: ibis.Table, column_name: str, planner: MetricPlanner
+) -> None:
+    planner.request(column_name, "n", table.count())
+
+
 @describe_generic.register
+@plans(_plan_generic_ibis)
 def describe_generic_ibis(
     config: Settings, series: ibis.Table, summary: dict
 ) -> Tuple[Settings, ibis.Table, dict]:
@@ -22,7 +31,7 @@ def describe_generic_ibis(
     """
 
     # number of observations in the Series
-    length = series.count().execute()
+    length = summary["n"] if "n" in summary else row_count(series)
 
     summary.update(
         {
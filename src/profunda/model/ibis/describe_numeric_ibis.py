@@ -1,97 +1,131 @@
 """Numeric description functions for Ibis."""
 
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
 
+import ibis.expr.operations as ops
 import numpy as np
-from ibis import Table, _
+import pandas as pd
+from ibis import Column, Table
+from ibis.expr.types import Scalar
 
 from profunda.config import Settings
-from profunda.model.ibis.algorithms_ibis import histogram_compute
-from profunda.model.summary_algorithms import describe_numeric_1d
+from profunda.model.ibis.algorithms_ibis import histogram_compute, use_approximation
+from profunda.model.ibis.arrow_ibis import fetch_record
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
+from profunda.model.summary_algorithms import (
+    central_moments,
+    describe_numeric_1d,
+    kurtosis_from_moments,
+    mark_approximated,
+    skewness_from_moments,
+)
+
+_SHIFT = "__profunda_shift"
+
+# Metrics that can be taken from the summary instead of being queried.
+_SEEDED_METRICS = (
+    "count",
+    "min",
+    "max",
+    "mean",
+    "sum",
+    "n_zeros",
+    "n_negative",
+    "n_infinite",
+)
+
+
+def _as_count(value: Any) -> int:
+    """Convert a backend count to an int. Sums over empty inputs come back as null."""
+    return 0 if pd.isna(value) else int(value)
+
+
+def _numeric_aggregates(
+    series: Table, quantiles: List[float], summary: dict, approximate: bool = False
+) -> Dict[str, Any]:
+    """Compute all statistics of a numeric column in a single backend query.
+
+    The central moments are obtained from power sums of the values shifted by the
+    median, which is also needed for the MAD. This keeps the recombination of the
+    moments numerically stable while every statistic is answered in one scan.
 
+    Args:
+        series: The single column table to describe.
+        quantiles: The quantiles to compute.
+        summary: The series description so far. Statistics already present (e.g.
+            seeded by the planned aggregates) are not queried again.
+        approximate: Estimate the quantiles, the median and the MAD with the
+            approximate aggregates of the backend.
 
-def _kurtosis(t: Table) -> float:
-    """Calculate the kurtosis of a numeric column."""
-    # TODO: performance optimization: combine with skewness and reuse values from value_counts.
-    column_name = t.columns[0]
-
-    t_no_nan = t.filter(~t[column_name].isnull())
-    count = t_no_nan.count().execute()
-
-    if count < 4:
-        return np.nan
-
-    mean = t[column_name].sum().execute() / count
+    Returns:
+        A dict with the raw aggregation results.
+    """
+    column_name = series.columns[0]
+
+    def median(col: Column) -> Scalar:
+        return col.approx_median() if approximate else col.median()
+
+    def quantile(col: Column, q: float) -> Scalar:
+        return col.approx_quantile(q) if approximate else col.quantile(q)
+
+    clean = series.filter(series[column_name].notnull())
+    clean = clean.mutate(**{_SHIFT: median(clean[column_name])})
+
+    col = clean[column_name]
+    shifted = col - clean[_SHIFT]
+
+    metrics = {
+        "count": col.count(),
+        "min": col.min(),
+        "max": col.max(),
+        "mean": col.mean(),
+        "sum": col.sum(),
+        "shift": clean[_SHIFT].max(),
+        "s1": shifted.sum(),
+        "s2": (shifted**2).sum(),
+        "s3": (shifted**3).sum(),
+        "s4": (shifted**4).sum(),
+        "n_zeros": (col == 0).sum(),
+        "n_negative": (col < 0).sum(),
+        "mad": median(shifted.abs()),
+    }
 
-    moments = (
-        t_no_nan.mutate(adjusted=t[column_name] - mean)
-        .mutate(
-            adjusted2=_.adjusted**2,
-            adjusted4=_.adjusted**4,
+    if hasattr(col, "isinf"):
+        finite = ~col.isinf()
+        metrics.update(
+            {
+                "n_infinite": col.isinf().sum(),
+                "finite_min": col.min(where=finite),
+                "finite_max": col.max(where=finite),
+                "n_finite": col.count(where=finite),
+            }
         )
-        .aggregate(m2=_.adjusted2.sum(), m4=_.adjusted4.sum())
-        .execute()
-    ).to_dict("records")[0]
-
-    m2, m4 = moments["m2"], moments["m4"]
-
-    # Copying behavior of pandas nankurt.
-    # https://github.com/pandas-dev/pandas/blob/main/pandas/core/nanops.py
-    with np.errstate(invalid="ignore", divide="ignore"):
-        adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
-        numerator = count * (count + 1) * (count - 1) * m4
-        denominator = (count - 2) * (count - 3) * m2**2
-
-    if denominator < 1e-14:
-        denominator = 0
-
-    if denominator == 0:
-        return 0.0
-
-    with np.errstate(invalid="ignore", divide="ignore"):
-        result = numerator / denominator - adj
-
-    return result
-
-
-def _skewness(t: Table) -> float:
-    """Calculate the skewness of a numeric column."""
-    # TODO: performance optimization: combine with kurtosis and reuse values from value_counts.
-    column_name = t.columns[0]
-
-    t_no_nan = t.filter(~t[column_name].isnull())
-
-    count = t_no_nan.count().execute()
-
-    if count < 3:
-        return np.nan
 
-    mean = t[column_name].sum().execute() / count
+    metrics.update({f"q_{i}": quantile(col, q) for i, q in enumerate(quantiles)})
 
-    moments = (
-        t_no_nan.mutate(adjusted=t[column_name] - mean)
-        .mutate(
-            adjusted2=_.adjusted**2,
-            adjusted3=_.adjusted**3,
-        )
-        .aggregate(m2=_.adjusted2.sum(), m3=_.adjusted3.sum())
-        .execute()
-    ).to_dict("records")[0]
+    known = {key: summary[key] for key in _SEEDED_METRICS if key in summary}
+    metrics = {key: expr for key, expr in metrics.items() if key not in known}
 
-    m2, m3 = moments["m2"], moments["m3"]
+    return {**known, **fetch_record(clean.aggregate(**metrics))}
 
-    # Copying behavior of pandas nanskew.
-    # https://github.com/pandas-dev/pandas/blob/main/pandas/core/nanops.py
-    if m2 == 0:
-        return 0.0
 
-    with np.errstate(invalid="ignore", divide="ignore"):
-        result = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5)
+def _plan_numeric_ibis(
+    config: Settings, table: Table, column_name: str, planner: MetricPlanner
+) -> None:
+    col = table[column_name]
 
-    return result
+    planner.request(column_name, "min", col.min())
+    planner.request(column_name, "max", col.max())
+    planner.request(column_name, "mean", col.mean())
+    planner.request(column_name, "sum", col.sum())
+    planner.request(column_name, "n_zeros", (col == 0).sum())
+    planner.request(column_name, "n_negative", (col < 0).sum())
+    if hasattr(col, "isinf"):
+        planner.request(column_name, "n_infinite", col.isinf().sum())
 
 
 @describe_numeric_1d.register
+@plans(_plan_numeric_ibis)
 def describe_numeric_1d_ibis(
     config: Settings, series: Table, summary: dict
 ) -> Tuple[Settings, Table, dict]:
@@ -105,74 +139,61 @@ def describe_numeric_1d_ibis(
     Returns:
         A dict containing calculated series description values.
     """
-    col = series[series.columns[0]]
-
-    stats = (
-        series.aggregate(
-            min=col.min(),
-            max=col.max(),
-            mean=col.mean(),
-            sum=col.sum(),
-        )
-        .execute()
-        .to_dict("records")[0]
+    quantiles = list(config.vars.num.quantiles)
+    if not {0.25, 0.75}.issubset(quantiles):
+        quantiles += [0.25, 0.75]
+
+    approximate = use_approximation(config, series, "quantiles", ops.ApproxQuantile)
+    stats = _numeric_aggregates(series, quantiles, summary, approximate)
+
+    count = _as_count(stats["count"])
+    n_infinite = _as_count(stats.get("n_infinite", 0))
+
+    summary.update(
+        {
+            "min": stats["min"],
+            "max": stats["max"],
+            "mean": stats["mean"],
+            "sum": stats["sum"],
+        }
     )
-    summary.update(**stats)
-
-    has_inf = False
-    if hasattr(col, "isinf"):
-        has_inf = col.isinf().any().execute()
 
-    # Follow pandas behavior for inf values in std and variance calculations.
-    if has_inf:
-        summary["std"] = np.nan
-        summary["variance"] = np.nan
-
-    else:
-        stats = (
-            (series.filter(~col.isinf()) if has_inf else series)
-            .aggregate(
-                std=col.std(),
-                variance=col.var(),
-            )
-            .execute()
-            .to_dict("records")[0]
+    # Follow pandas behavior for inf values in the moment calculations.
+    if n_infinite > 0:
+        summary.update(
+            {"std": np.nan, "variance": np.nan, "kurtosis": np.nan, "skewness": np.nan}
         )
 
-        summary.update(**stats)
-
-    summary["kurtosis"] = _kurtosis(series)
-    summary["skewness"] = _skewness(series)
-
-    if hasattr(col, "isinf"):
-        n_infinite = col.isinf().sum().execute()
     else:
-        n_infinite = 0
+        _, m2, m3, m4 = central_moments(
+            count,
+            (stats["s1"], stats["s2"], stats["s3"], stats["s4"]),
+            shift=stats["shift"],
+        )
+        variance = m2 / (count - 1) if count > 1 else np.nan
+
+        summary.update(
+            {
+                "std": np.sqrt(variance),
+                "variance": variance,
+                "kurtosis": kurtosis_from_moments(count, m2, m4),
+                "skewness": skewness_from_moments(count, m2, m3),
+            }
+        )
 
     summary["n_infinite"] = n_infinite
     summary["p_infinite"] = summary["n_infinite"] / summary["n"]
-    summary["n_zeros"] = (col == 0).sum().execute()
+    summary["n_zeros"] = _as_count(stats["n_zeros"])
     summary["p_zeros"] = summary["n_zeros"] / summary["n"]
-    summary["n_negative"] = (col < 0).sum().execute()
+    summary["n_negative"] = _as_count(stats["n_negative"])
     summary["p_negative"] = summary["n_negative"] / summary["n"]
 
-    mad = (
-        series.mutate(absolute_diff=(col - col.median()).abs())
-        .aggregate(mad=_.absolute_diff.median())
-        .execute()
-        .to_dict("records")[0]["mad"]
-    )
-
-    summary["mad"] = mad
+    summary["mad"] = stats["mad"]
 
     summary["range"] = summary["max"] - summary["min"]
 
     percentiles = {
-        f"{percentile:.0%}": value
-        for percentile, value in zip(
-            config.vars.num.quantiles,
-            col.quantile(config.vars.num.quantiles).execute(),
-        )
+        f"{percentile:.0%}": stats[f"q_{i}"] for i, percentile in enumerate(quantiles)
     }
 
     # Copy pandas behavior and swap infinities for nans.
@@ -180,14 +201,23 @@ def describe_numeric_1d_ibis(
         if np.isinf(value):
             percentiles[key] = np.nan
 
-    summary.update(**percentiles)
+    summary["iqr"] = percentiles["75%"] - percentiles["25%"]
 
-    if "75%" in summary and "25%" in summary:
-        summary["iqr"] = summary["75%"] - summary["25%"]
-    else:
-        q_25, q_75 = col.quantile([0.25, 0.75]).execute()
+    # Only expose the configured quantiles.
+    summary.update(
+        {
+            f"{percentile:.0%}": percentiles[f"{percentile:.0%}"]
+            for percentile in config.vars.num.quantiles
+        }
+    )
 
-        summary["iqr"] = q_75 - q_25
+    if approximate:
+        mark_approximated(
+            summary,
+            "mad",
+            "iqr",
+            *(f"{percentile:.0%}" for percentile in config.vars.num.quantiles),
+        )
 
     summary["cv"] = summary["std"] / summary["mean"] if summary["mean"] else np.nan
 
@@ -195,6 +225,13 @@ def describe_numeric_1d_ibis(
     # This would need an ordinal column to enforce ordering. Similar to Spark's limitation.
     summary["monotonic"] = 0
 
-    summary.update({"histogram": histogram_compute(config, series)})
+    histogram_stats = {
+        "min_val": stats.get("finite_min", stats["min"]),
+        "max_val": stats.get("finite_max", stats["max"]),
+        "n": _as_count(stats.get("n_finite", count)),
+    }
+    summary.update(
+        {"histogram": histogram_compute(config, series, stats=histogram_stats)}
+    )
 
     return config, series, summary
@@ -1,12 +1,28 @@
 from typing import Tuple
 
+import ibis.expr.operations as ops
 from ibis import Table
 
 from profunda.config import Settings
-from profunda.model.summary_algorithms import describe_supported
+from profunda.model.ibis.algorithms_ibis import use_approximation
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
+from profunda.model.ibis.trace_ibis import execute_traced
+from profunda.model.summary_algorithms import (
+    describe_supported,
+    estimate_distinct_counts,
+    mark_approximated,
+)
+
+
+def _plan_supported_ibis(
+    config: Settings, table: Table, column_name: str, planner: MetricPlanner
+) -> None:
+    if use_approximation(config, table, "distinct", ops.ApproxCountDistinct):
+        planner.request(column_name, "n_distinct", table[column_name].approx_nunique())
 
 
 @describe_supported.register
+@plans(_plan_supported_ibis)
 def describe_supported_ibis(
     config: Settings, series: Table, summary: dict
 ) -> Tuple[Settings, Table, dict]:
@@ -20,8 +36,39 @@ def describe_supported_ibis(
     count = summary["count"]
     value_counts = summary["value_counts"]
 
-    distinct_count = value_counts.drop_null().count().execute()
-    unique_count = value_counts.filter(value_counts["count"] == 1).count().execute()
+    if summary.get("heavy_hitters", False):
+        # Only the most frequent values were counted, estimate from them and from
+        # the distinct count estimate.
+        distinct_count, unique_count = estimate_distinct_counts(
+            summary["value_counts_without_nan"], summary.pop("n_distinct"), count
+        )
+        mark_approximated(summary, "n_distinct", "p_distinct", "n_unique", "p_unique")
+    elif use_approximation(config, series, "distinct", ops.ApproxCountDistinct):
+        # Estimate from the distinct count and the fetched most frequent values,
+        # instead of querying the value counts again.
+        top_counts = summary["value_counts_without_nan"]
+        # The estimate may already be known from the planned aggregates.
+        distinct_count = summary.pop("n_distinct", None)
+        if top_counts.sum() >= count:
+            # The most frequent values are all the values.
+            distinct_count = len(top_counts)
+            unique_count = int((top_counts == 1).sum())
+        else:
+            if distinct_count is None:
+                distinct_count = execute_traced(
+                    series[series.columns[0]].approx_nunique()
+                )
+            distinct_count, unique_count = estimate_distinct_counts(
+                top_counts, distinct_count, count
+            )
+            mark_approximated(
+                summary, "n_distinct", "p_distinct", "n_unique", "p_unique"
+            )
+    else:
+        unique_count = execute_traced(
+            value_counts.filter(value_counts["count"] == 1).count()
+        )
+        distinct_count = execute_traced(value_counts.drop_null().count())
 
     stats = {
         "n_distinct": distinct_count,
@@ -1,11 +1,26 @@
 from typing import Tuple
 
+import pandas as pd
 from ibis import Table
 
 from profunda.config import Settings
 from profunda.model.ibis.algorithms_ibis import histogram_compute, length_summary
+from profunda.model.ibis.planner_ibis import MetricPlanner, plans
+from profunda.model.ibis.trace_ibis import to_pyarrow_traced
 
 
+def _plan_text_ibis(
+    config: Settings, table: Table, column_name: str, planner: MetricPlanner
+) -> None:
+    if config.vars.text.length:
+        length = table[column_name].length()
+        planner.request(column_name, "max_length", length.max())
+        planner.request(column_name, "mean_length", length.mean())
+        planner.request(column_name, "median_length", length.median())
+        planner.request(column_name, "min_length", length.min())
+
+
+@plans(_plan_text_ibis)
 def describe_text_1d_ibis(
     config: Settings,
     series: Table,
@@ -26,16 +41,31 @@ def describe_text_1d_ibis(
     clean = series.drop_null()
 
     if not config.vars.cat.redact:
-        summary.update({"first_rows": clean.limit(5).select(column_name).execute()})
+        # Keep the strings as Arrow strings.
+        first_rows = to_pyarrow_traced(clean.limit(5).select(column_name))
+        summary.update({"first_rows": first_rows.to_pandas(types_mapper=pd.ArrowDtype)})
 
     if config.vars.text.length:
-        summary.update(**length_summary(clean))
+        length_keys = ("max_length", "mean_length", "median_length", "min_length")
+        # Lengths of empty columns are not defined, let length_summary handle them.
+        if not all(key in summary for key in length_keys) or not summary.get("count"):
+            summary.update(**length_summary(clean))
+
+        histogram_stats = None
+        if "count" in summary:
+            histogram_stats = {
+                "min_val": summary["min_length"],
+                "max_val": summary["max_length"],
+                "n": summary["count"],
+            }
+
         summary.update(
             **{
                 "histogram_length": histogram_compute(
                     config,
                     clean.mutate(length=clean[column_name].length()),
                     column_name="length",
+                    stats=histogram_stats,
                 )
             }
         )
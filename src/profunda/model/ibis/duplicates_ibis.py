@@ -6,6 +6,8 @@ from ibis import Table, _
 
 from profunda.config import Settings
 from profunda.model.duplicates import get_duplicates
+from profunda.model.ibis.context_ibis import row_count
+from profunda.model.ibis.trace_ibis import execute_traced
 
 
 @get_duplicates.register
@@ -35,7 +37,7 @@ def get_duplicates_ibis(
     out = None
 
     if n_head > 0:
-        n_rows = df.count().execute()
+        n_rows = row_count(df)
 
         if supported_columns and n_rows > 0:
             duplicate_counts = (
@@ -44,15 +46,13 @@ def get_duplicates_ibis(
                 .filter(_[duplicates_key] > 1)
             )
 
-            n_duplicates = duplicate_counts.count().execute()
+            n_duplicates = execute_traced(duplicate_counts.count())
 
             metrics["n_duplicates"] = n_duplicates
             metrics["p_duplicates"] = n_duplicates / n_rows
 
-            out = (
-                duplicate_counts.order_by(ibis.desc(duplicates_key))
-                .limit(n_head)
-                .to_pandas()
+            out = execute_traced(
+                duplicate_counts.order_by(ibis.desc(duplicates_key)).limit(n_head)
             )
 
         else:
@@ -0,0 +1,108 @@
+"""Files opened as Ibis tables through DuckDB, without loading them in pandas."""
+
+import weakref
+from pathlib import Path
+from typing import Dict, Optional
+
+import ibis
+import pandas as pd
+from ibis import BaseBackend, Table
+
+from profunda.utils.dataframe import uncompressed_extension
+
+# The statistics read from the metadata of the files opened with `read_file`,
+# keyed by the operation of their table.
+_file_statistics: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def parquet_statistics(path: Path, table: Table) -> Dict[str, dict]:
+    """The statistics of the columns of a parquet file, from its metadata.
+
+    The row count is always known. The null counts, and the extremes of the
+    integer and timestamp columns, are known when every row group records them.
+    The extremes of floating point columns are left out, as the statistics of the
+    file do not account for NaN values.
+
+    Args:
+        path: the parquet file
+        table: the file opened as an Ibis table
+
+    Returns:
+        The known statistics of each column, with the keys of the column summaries
+        (`n`, `n_missing`, `min` and `max`).
+    """
+    import pyarrow.parquet as pq
+
+    metadata = pq.ParquetFile(str(path)).metadata
+    schema = table.schema()
+
+    statistics: Dict[str, dict] = {name: {"n": metadata.num_rows} for name in schema}
+    columns: Dict[str, list] = {name: [] for name in schema}
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            # Nested columns have no statistics of their own.
+            if column.path_in_schema in columns:
+                columns[column.path_in_schema].append(column.statistics)
+
+    for name, column_statistics in columns.items():
+        if metadata.num_row_groups == 0 or any(s is None for s in column_statistics):
+            continue
+
+        if all(s.has_null_count for s in column_statistics):
+            statistics[name]["n_missing"] = sum(s.null_count for s in column_statistics)
+
+        dtype = schema[name]
+        exact = dtype.is_integer() or (dtype.is_timestamp() and dtype.timezone is None)
+        if exact and all(s.has_min_max for s in column_statistics):
+            convert = pd.Timestamp if dtype.is_timestamp() else (lambda v: v)
+            statistics[name]["min"] = convert(min(s.min for s in column_statistics))
+            statistics[name]["max"] = convert(max(s.max for s in column_statistics))
+
+    return statistics
+
+
+def read_file(path: Path, backend: Optional[BaseBackend] = None) -> Table:
+    """Open a parquet, CSV, TSV or JSON file as an Ibis table, based on its extension.
+
+    The file is scanned by DuckDB when the table is queried, with only the
+    columns each query needs (projection pushdown). The statistics in the
+    metadata of parquet files answer the row count, null counts and extremes of
+    the columns without reading their data (see `file_statistics`).
+
+    Args:
+        path: the file to open
+        backend: the DuckDB connection to open it with, a new one by default
+
+    Returns:
+        The Ibis table of the file.
+
+    Raises:
+        ValueError: if the file type is not supported.
+    """
+    con = ibis.duckdb.connect() if backend is None else backend
+
+    extension = uncompressed_extension(path)
+    if extension == ".parquet":
+        table = con.read_parquet(str(path))
+        _file_statistics[table.op()] = parquet_statistics(path, table)
+    elif extension in [".json", ".jsonl"]:
+        table = con.read_json(str(path))
+    elif extension == ".tsv":
+        table = con.read_csv(str(path), delim="\t")
+    elif extension == ".csv":
+        table = con.read_csv(str(path))
+    else:
+        raise ValueError(
+            f"Files with extension {extension} cannot be scanned directly, "
+            "read them with `read_pandas` instead."
+        )
+
+    return table
+
+
+def file_statistics(table: Table) -> Dict[str, dict]:
+    """The statistics of the columns of a table opened with `read_file`, known
+    from the metadata of the file. Empty for other tables."""
+    return _file_statistics.get(table.op(), {})
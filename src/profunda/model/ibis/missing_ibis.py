@@ -5,7 +5,10 @@ import pandas as pd
 from ibis import Column, Table
 
 from profunda.config import Settings
-from profunda.model.ibis.correlations_ibis import pearson_compute
+from profunda.model.context import get_context
+from profunda.model.ibis.context_ibis import row_count, table_key
+from profunda.model.ibis.correlations_ibis import pearson_matrix
+from profunda.model.ibis.trace_ibis import execute_traced
 from profunda.visualisation.missing import plot_missing_bar, plot_missing_heatmap
 
 
@@ -17,6 +20,16 @@ def _is_null_or_nan(c: Column) -> Column:
     return out
 
 
+def _null_counts(df: Table) -> pd.Series:
+    """The number of null or nan values of each column, shared by the diagrams."""
+    return get_context().get(
+        ("n_null_or_nan", table_key(df)),
+        lambda: execute_traced(
+            df.aggregate(**{c: _is_null_or_nan(df[c]).sum() for c in df.columns})
+        ).squeeze(axis=0),
+    )
+
+
 def missing_bar(config: Settings, df: Table) -> str:
     """Generate missing values bar plot.
 
@@ -27,17 +40,11 @@ def missing_bar(config: Settings, df: Table) -> str:
     Returns:
         The resulting missing values bar plot encoded as a string.
     """
-    null_counts = (
-        df.aggregate(**{c: _is_null_or_nan(df[c]).sum() for c in df.columns})
-        .to_pandas()
-        .squeeze()
-    )
-
     return plot_missing_bar(
         config,
-        notnull_counts=null_counts,
+        notnull_counts=_null_counts(df),
         columns=df.columns,
-        nrows=df.count().execute(),
+        nrows=row_count(df),
     )
 
 
@@ -61,22 +68,14 @@ def missing_heatmap(config: Settings, df: Table) -> str:
         The resulting missing values heatmap plot encoded as a string.
     """
     # Exclude completely filled or empty columns.
-    n = df.count().execute()
+    n = row_count(df)
+    null_counts = _null_counts(df)
 
     null_matrix = df.mutate(**{c: _is_null_or_nan(df[c]) for c in df.columns})
 
-    null_counts = (
-        null_matrix.aggregate(**{c: null_matrix[c].sum() for c in null_matrix.columns})
-        .to_pandas()
-        .squeeze()
-    )
-
     heatmap_columns = null_counts[(null_counts > 0) & (null_counts < n)].index.to_list()
 
-    correlation_matrix: pd.DataFrame = pearson_compute(
-        config, null_matrix, {c: {"type": "Numeric"} for c in heatmap_columns}
-    )
-    correlation_matrix = correlation_matrix.values
+    correlation_matrix = pearson_matrix(null_matrix, heatmap_columns).values
 
     mask = np.zeros_like(correlation_matrix)
     mask[np.triu_indices_from(mask)] = True
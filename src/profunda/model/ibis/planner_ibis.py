@@ -0,0 +1,167 @@
+"""Deferred planning of aggregate metrics for Ibis tables."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import ibis
+import pandas as pd
+from ibis import Table
+from ibis.expr.types import Scalar
+
+from profunda.model.ibis.arrow_ibis import fetch_record
+
+# Maximum number of distinct aggregates combined into a single query.
+MAX_METRICS_PER_QUERY = 1000
+
+
+def plans(planner: Callable) -> Callable:
+    """Attach a planning function to a describer.
+
+    The planning function is called with `(config, table, column_name, planner)`
+    before any describer runs, and registers the aggregates the describer will
+    need with the `MetricPlanner`. See `Handler.plan`.
+
+    Args:
+        planner: The planning function.
+
+    Returns:
+        A decorator that attaches the planning function to the describer.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        fn.plan = planner  # type: ignore
+        return fn
+
+    return decorator
+
+
+class MetricPlanner:
+    """Collects the aggregates requested by the describers of all columns of a table.
+
+    Identical expressions requested by several describers or columns (e.g. the row
+    count) are computed only once, and all aggregates are combined into as few
+    queries as possible. Metrics that are already known (e.g. from the metadata
+    of a parquet file) are answered without a query.
+
+    Example:
+        >>> planner = MetricPlanner(table)
+        >>> planner.request("a", "n_missing", table["a"].isnull().sum())
+        >>> planner.request("a", "n", table.count())
+        >>> planner.execute()
+        {'a': {'n_missing': 0, 'n': 3}}
+    """
+
+    def __init__(
+        self,
+        table: Table,
+        max_metrics_per_query: int = MAX_METRICS_PER_QUERY,
+        known: Optional[Dict[str, dict]] = None,
+    ):
+        if max_metrics_per_query <= 0:
+            raise ValueError(
+                f"max_metrics_per_query must be positive, got {max_metrics_per_query}."
+            )
+
+        self.table = table
+        self.max_metrics_per_query = max_metrics_per_query
+
+        # Unique expressions, keyed by their operation, and their requesters.
+        self._expressions: Dict[Any, Scalar] = {}
+        self._requests: Dict[Any, List[Tuple[str, str]]] = {}
+
+        # The known metrics of each column, and those that were requested.
+        self._known = known or {}
+        self._answered: Dict[str, dict] = {}
+
+    @property
+    def n_requests(self) -> int:
+        """The number of metrics requested, including duplicates."""
+        return sum(len(requests) for requests in self._requests.values())
+
+    @property
+    def n_metrics(self) -> int:
+        """The number of distinct metrics that will be computed."""
+        return len(self._expressions)
+
+    def request(self, column_name: str, key: str, expr: Scalar) -> None:
+        """Register an aggregate expression for a column.
+
+        Args:
+            column_name: The column whose summary will receive the result.
+            key: The key of the result in the summary.
+            expr: A scalar aggregate over the planner's table.
+        """
+        known = self._known.get(column_name, {})
+        if key in known:
+            self._answered.setdefault(column_name, {})[key] = known[key]
+            return
+
+        op = expr.op()
+        if op not in self._expressions:
+            self._expressions[op] = expr
+            self._requests[op] = []
+        self._requests[op].append((column_name, key))
+
+    def queries(self) -> List[Table]:
+        """Build the aggregation queries for the registered metrics.
+
+        Returns:
+            A list of single-row Ibis Tables, each with at most
+            `max_metrics_per_query` columns named `m<i>` after the metric index.
+        """
+        aliased = [(f"m{i}", expr) for i, expr in enumerate(self._expressions.values())]
+        step = self.max_metrics_per_query
+
+        return [
+            self.table.aggregate(**dict(aliased[start : start + step]))
+            for start in range(0, len(aliased), step)
+        ]
+
+    def explain(self) -> pd.DataFrame:
+        """A debug view of the plan, listing the queries and metrics per column.
+
+        Returns:
+            A DataFrame with one row per requested metric, with the query and the
+            metric it is answered by. Metrics shared between requests have the same
+            `metric` value.
+        """
+        rows = []
+        for i, (op, expr) in enumerate(self._expressions.items()):
+            for column_name, key in self._requests[op]:
+                rows.append(
+                    {
+                        "column": column_name,
+                        "key": key,
+                        "query": i // self.max_metrics_per_query,
+                        "metric": f"m{i}",
+                        "expression": expr.get_name(),
+                    }
+                )
+
+        return pd.DataFrame(
+            rows, columns=["column", "key", "query", "metric", "expression"]
+        )
+
+    def sql(self) -> List[str]:
+        """The compiled SQL of each planned query."""
+        return [str(ibis.to_sql(query)) for query in self.queries()]
+
+    def execute(self) -> Dict[str, dict]:
+        """Run the planned queries.
+
+        Returns:
+            A dict with the requested metrics for each column.
+        """
+        results: Dict[str, dict] = {
+            column_name: dict(metrics)
+            for column_name, metrics in self._answered.items()
+        }
+        requests = list(self._requests.values())
+
+        for query in self.queries():
+            record = fetch_record(query)
+
+            for name, value in record.items():
+                for column_name, key in requests[int(name[1:])]:
+                    results.setdefault(column_name, {})[key] = value
+
+        return results
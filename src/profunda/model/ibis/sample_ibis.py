@@ -6,6 +6,8 @@ from typing import List
 from ibis import Table
 
 from profunda.config import Settings
+from profunda.model.ibis.context_ibis import row_count
+from profunda.model.ibis.trace_ibis import execute_traced
 from profunda.model.sample import Sample, get_sample
 
 
@@ -21,13 +23,13 @@ def get_sample_ibis(config: Settings, df: Table) -> List[Sample]:
         a list of Sample objects
     """
     samples: List[Sample] = []
-    if df.count().execute() == 0:
+    if row_count(df) == 0:
         return samples
 
     n_head = config.samples.head
     if n_head > 0:
         samples.append(
-            Sample(id="head", data=df.head(n_head).to_pandas(), name="First rows")
+            Sample(id="head", data=execute_traced(df.head(n_head)), name="First rows")
         )
 
     n_tail = config.samples.tail
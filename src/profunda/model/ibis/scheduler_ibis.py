@@ -0,0 +1,32 @@
+"""Concurrent stages of a profiling run on Ibis tables."""
+
+from typing import Callable, Tuple
+
+from ibis import Table
+
+from profunda.config import Settings
+from profunda.model.ibis.cursor_ibis import ThreadLocalTable
+from profunda.model.scheduler import get_pool_size, get_stage_frames
+
+
+@get_stage_frames.register
+def get_stage_frames_ibis(
+    config: Settings, df: Table
+) -> Tuple[int, Callable[[], Table]]:
+    """Run the stages concurrently if `config.ibis.concurrent` is set.
+
+    Each worker queries the table through its own connection where needed, see
+    `ThreadLocalTable`.
+
+    Args:
+        config: report Settings object
+        df: the Ibis Table
+
+    Returns:
+        The number of workers, and a getter of the table bound to the calling
+        worker's connection.
+    """
+    if not config.ibis.concurrent:
+        return 1, lambda: df
+
+    return get_pool_size(config), ThreadLocalTable(df).get
@@ -1,13 +1,24 @@
 """Compute statistical description of Ibis datasets."""
 
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Dict, Optional
 
 from ibis import Table
 from tqdm import tqdm
 from visions import VisionsTypeset
 
 from profunda.config import Settings
+from profunda.model.context import get_context, profiling_context
+from profunda.model.ibis.cache_ibis import TableCache
+from profunda.model.ibis.context_ibis import seed_summaries
+from profunda.model.ibis.cursor_ibis import ThreadLocalTable
+from profunda.model.ibis.file_ibis import file_statistics
+from profunda.model.ibis.planner_ibis import MetricPlanner
+from profunda.model.performance import measure_stage
+from profunda.model.scheduler import get_pool_size
 from profunda.model.summarizer import BaseSummarizer
+from profunda.model.trace import query_labels
 from profunda.utils.dataframe import sort_column_names
 
 NUMERIC_TYPES = ()
@@ -34,11 +45,59 @@ def _get_type(series: Table) -> str:
     return vtype
 
 
+def plan_series_descriptions_ibis(
+    config: Settings, df: Table, summarizer: BaseSummarizer
+) -> MetricPlanner:
+    """Collect the aggregates the describers need for all columns of the table.
+
+    Each describer of a column's type can register the plain aggregations it needs
+    (null counts, row count, extremes, length statistics, ...) through its planning
+    hook (see `Handler.plan`). Use `MetricPlanner.explain()` on the result to inspect
+    the planned queries per column.
+
+    Args:
+        config: report Settings object
+        df: The Ibis Table.
+        summarizer: Summarizer object
+
+    Returns:
+        The planner holding the deduplicated aggregates.
+    """
+    planner = MetricPlanner(df, known=file_statistics(df))
+
+    for column_name in df.columns:
+        dtype = _get_type(df.select(column_name))
+        summarizer.plan(dtype, config, df, column_name, planner)
+
+    return planner
+
+
+def get_wide_summaries_ibis(
+    config: Settings, df: Table, summarizer: BaseSummarizer
+) -> Dict[str, dict]:
+    """Compute the planned per-column statistics of all columns in a few wide queries.
+
+    The results are used to seed the summary of each column, so the per-type
+    describers do not have to query them again.
+
+    Args:
+        config: report Settings object
+        df: The Ibis Table.
+        summarizer: Summarizer object
+
+    Returns:
+        A dict with the seeded summary for each column.
+    """
+    seeds = plan_series_descriptions_ibis(config, df, summarizer).execute()
+    return {column_name: seeds.get(column_name, {}) for column_name in df.columns}
+
+
 def ibis_describe_1d(
     config: Settings,
     series: Table,
     summarizer: BaseSummarizer,
     typeset: VisionsTypeset,
+    summary: Optional[dict] = None,
 ) -> dict:
     """Describe a series (infer the variable type, then calculate type-specific values).
 
@@ -47,6 +106,7 @@ def ibis_describe_1d(
         series: The Series to describe.
         summarizer: Summarizer object
         typeset: Typeset
+        summary: Optional precomputed statistics to seed the description with.
 
     Returns:
         A Series containing calculated series description values.
@@ -56,7 +116,9 @@ def ibis_describe_1d(
             "infer_dtypes is not supported for Ibis Tables. Please set infer_dtypes to False."
         )
 
-    return summarizer.summarize(config, series, dtype=_get_type(series))  # type: ignore
+    return summarizer.summarize(
+        config, series, dtype=_get_type(series), summary=summary
+    )  # type: ignore
 
 
 def get_series_descriptions_ibis(
@@ -67,23 +129,98 @@ def get_series_descriptions_ibis(
     pbar: tqdm,
 ) -> dict:
     """
-    Compute series descriptions/statistics for a Spark DataFrame.
+    Compute series descriptions/statistics for an Ibis Table.
+
+    The columns are described one after the other, or concurrently with
+    `config.pool_size` workers if `config.ibis.concurrent` is set.
 
     Returns: A dict with the series descriptions for each column of a Dataset
     """
 
-    def describe_column(name: str) -> Tuple[str, dict]:
-        """Process a single Spark column using Spark's execution model."""
-        description = ibis_describe_1d(config, df.select(name), summarizer, typeset)
-        pbar.set_postfix_str(f"Describe variable: {name}")
-        pbar.update()
-
-        # Pop value counts to remove the reference.
-        description.pop("value_counts", None)
+    with profiling_context(get_context()) as context:
+        seeds = get_wide_summaries_ibis(config, df, summarizer)
+        seed_summaries(df, seeds)
 
-        return name, description
-
-    series_description = {col: describe_column(col)[1] for col in df.columns}
+        # The describers of the columns share the cache through the context.
+        previous = context.table_cache
+        context.table_cache = TableCache(max_rows=config.ibis.cache_max_rows)
+        try:
+            series_description = _describe_columns(
+                config, df, summarizer, typeset, pbar, seeds, context.table_cache
+            )
+        finally:
+            context.table_cache = previous
 
     # Sort and return descriptions
     return sort_column_names(series_description, config.sort)
+
+
+def _describe_columns(
+    config: Settings,
+    df: Table,
+    summarizer: BaseSummarizer,
+    typeset: VisionsTypeset,
+    pbar: tqdm,
+    seeds: Dict[str, dict],
+    cache: TableCache,
+) -> Dict[str, dict]:
+    """Describe each column of the table, see `get_series_descriptions_ibis`."""
+
+    def describe_column(table: Table, name: str) -> dict:
+        """Describe a single column of the table."""
+        with query_labels(column=name), measure_stage("Describe variable", name):
+            description = ibis_describe_1d(
+                config,
+                table.select(name),
+                summarizer,
+                typeset,
+                summary=dict(seeds[name]),
+            )
+
+        # All describers of the column are done, release its cached tables.
+        value_counts = description.pop("value_counts", None)
+        if value_counts is not None:
+            cache.release(value_counts)
+
+        return description
+
+    def update_progress(name: str) -> None:
+        pbar.set_postfix_str(f"Describe variable: {name}")
+        pbar.update()
+
+    try:
+        if config.ibis.concurrent:
+            pool_size = get_pool_size(config)
+            tables = ThreadLocalTable(df)
+
+            descriptions = {}
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                # Run each column in a copy of the context, to share the profiling
+                # context of the run with the workers.
+                futures = {
+                    executor.submit(
+                        copy_context().run,
+                        lambda name: describe_column(tables.get(), name),
+                        name,
+                    ): name
+                    for name in df.columns
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    descriptions[name] = future.result()
+                    update_progress(name)
+
+            # Keep the column order independent of the completion order.
+            series_description = {name: descriptions[name] for name in df.columns}
+
+        else:
+            series_description = {}
+            for name in df.columns:
+                series_description[name] = describe_column(df, name)
+                update_progress(name)
+
+    finally:
+        # Drop tables left behind by columns that failed.
+        cache.clear()
+
+    return series_description
@@ -5,6 +5,7 @@ from collections import Counter
 from ibis import Table
 
 from profunda.config import Settings
+from profunda.model.ibis.context_ibis import row_count
 from profunda.model.table import get_table_stats
 
 
@@ -20,7 +21,7 @@ def get_table_stats_ibis(config: Settings, df: Table, variable_stats: dict) -> d
     Returns:
         A dictionary that contains the table statistics.
     """
-    n = df.count().execute()
+    n = row_count(df)
 
     table_stats = {
         "n": n,
@@ -0,0 +1,93 @@
+"""Instrumentation of the queries issued on Ibis backends.
+
+The Ibis describers run their queries through `execute_traced`,
+`to_pyarrow_traced` and `to_pyarrow_batches_traced` instead of the methods of
+the expressions, which record them in the trace of the run that issues them. The
+backends themselves are left untouched, so queries issued outside a traced run,
+e.g. by other threads or other libraries using the same backend, are not
+recorded.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+import ibis
+import pandas as pd
+import pyarrow as pa
+from ibis import Table
+from ibis.expr.types import Expr
+
+from profunda.model.trace import QueryTrace, trace_queries
+
+
+def _to_sql(expr: Expr) -> str:
+    try:
+        return str(ibis.to_sql(expr, dialect=ibis.get_backend(expr).name))
+    except Exception:  # Backends without a SQL dialect
+        return repr(expr)
+
+
+def _n_rows(result: Any) -> int:
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, (pa.Table, pa.RecordBatch)):
+        return result.num_rows
+    return 1
+
+
+# The trace of the run the current thread issues queries for, if any.
+_active_trace: ContextVar[Optional[QueryTrace]] = ContextVar(
+    "query_trace", default=None
+)
+
+
+def _run(expr: Expr, method: str, **kwargs: Any) -> Any:
+    """Run a method of an expression, recording its query in the active trace."""
+    trace = _active_trace.get()
+    if trace is None:
+        return getattr(expr, method)(**kwargs)
+
+    start = time.perf_counter()
+    result = getattr(expr, method)(**kwargs)
+    end = time.perf_counter()
+    trace.record(_to_sql(expr), start, end, _n_rows(result))
+    return result
+
+
+def execute_traced(expr: Expr, **kwargs: Any) -> Any:
+    """Execute an expression (see `Expr.execute`), as a query of the run."""
+    return _run(expr, "execute", **kwargs)
+
+
+def to_pyarrow_traced(expr: Expr, **kwargs: Any) -> Any:
+    """Fetch the result of an expression as Arrow (see `Expr.to_pyarrow`), as a
+    query of the run."""
+    return _run(expr, "to_pyarrow", **kwargs)
+
+
+def to_pyarrow_batches_traced(expr: Expr, **kwargs: Any) -> pa.RecordBatchReader:
+    """Stream the result of an expression as Arrow record batches (see
+    `Expr.to_pyarrow_batches`), as a query of the run. The query is timed while
+    the stream is opened, not while it is read."""
+    return _run(expr, "to_pyarrow_batches", **kwargs)
+
+
+@trace_queries.register
+@contextmanager
+def trace_queries_ibis(df: Table, trace: Optional[QueryTrace]) -> Iterator[None]:
+    """Record the queries of the run issued within the block.
+
+    The trace is active in the context of the block, and in the threads that run
+    in a copy of it (see `contextvars.copy_context`).
+    """
+    if trace is None:
+        yield
+        return
+
+    token = _active_trace.set(trace)
+    try:
+        yield
+    finally:
+        _active_trace.reset(token)
@@ -20,6 +20,7 @@ PANDAS_MODULES = [
     "table_pandas",
     "timeseries_index_pandas",
     "summary_pandas",
+    "scheduler_pandas",
 ]
 
 # Dynamically import and expose functions from modules
@@ -52,4 +53,5 @@ __all__ = [
     "pandas_get_table_stats",
     "pandas_get_time_index_description",
     "pandas_get_series_descriptions",
+    "pandas_get_stage_frames",
 ]
@@ -1,35 +1,66 @@
 import contextlib
+import functools
+import heapq
+import itertools
 import string
+import sys
+import threading
 from collections import Counter
-from typing import List, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
 
 from profunda.config import Settings
+from profunda.model.pandas.heavy_hitters_pandas import weighted_values
 from profunda.model.pandas.imbalance_pandas import column_imbalance_score
 from profunda.model.pandas.utils_pandas import weighted_median
 from profunda.model.summary_algorithms import (
     chi_square,
     describe_categorical_1d,
     histogram_compute,
+    mark_approximated,
     series_handle_nulls,
     series_hashable,
 )
 
+# The characters stripped from the ends of words.
+_WORD_STRIP = string.punctuation + string.whitespace
 
-def get_character_counts_vc(vc: pd.Series) -> pd.Series:
-    series = pd.Series(vc.index, index=vc, dtype=object)
-    characters = series[series != ""].apply(list)
-    characters = characters.explode()
 
-    counts = pd.Series(characters.index, index=characters).dropna()
-    if len(counts) > 0:
-        counts = counts.groupby(level=0, sort=False).sum()
-        counts = counts.sort_values(ascending=False)
-        # FIXME: correct in split, below should be zero: print(counts.loc[''])
-        counts = counts[counts.index.str.len() > 0]
-    return counts
+def code_point_counts(vc: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """The code points of the values of a value count, and their total counts.
+
+    The values are encoded to UTF-32 at once and viewed as a NumPy array of code
+    points, each weighted by the count of its value.
+
+    Args:
+        vc: Series containing all unique values as index and their frequency
+            as value.
+
+    Returns:
+        The distinct code points, in the order in which they first appear, and
+        their counts.
+    """
+    lengths = np.fromiter(map(len, vc.index), dtype=np.int64, count=len(vc))
+    encoded = "".join(vc.index).encode("utf-32-le", "surrogatepass")
+    code_points = np.frombuffer(encoded, dtype="<u4")
+    if len(code_points) == 0:
+        return code_points, np.array([], dtype=np.int64)
+
+    # The code points in the order in which they first appear, as `groupby` does.
+    inverse, unique = pd.factorize(code_points)
+    weights = np.repeat(vc.to_numpy(dtype=np.float64), lengths)
+    return unique, np.bincount(inverse, weights=weights).astype(np.int64)
+
+
+def get_character_counts_vc(vc: pd.Series) -> pd.Series:
+    code_points, counts = code_point_counts(vc)
+    characters = pd.Index(
+        [chr(c) for c in code_points], dtype=object, name=vc.index.name
+    )
+    counts = pd.Series(counts, index=characters, name=vc.name, dtype=vc.dtype)
+    return counts.sort_values(ascending=False) if len(counts) > 0 else counts
 
 
 def get_character_counts(series: pd.Series) -> Counter:
@@ -53,7 +84,43 @@ def counter_to_series(counter: Counter) -> pd.Series:
     return pd.Series(counts, index=items)
 
 
-def unicode_summary_vc(vc: pd.Series) -> dict:
+class UnicodeTable:
+    """A table of the labels of a Unicode property (e.g. the block), by code point.
+
+    The label of a code point is looked up once per process, the first time the
+    code point is seen, and kept in an array indexed by code point. The Unicode
+    properties have at most a few hundred labels. The tables are shared by the
+    threads describing the columns, new code points are added under a lock.
+    """
+
+    def __init__(self, lookup: Callable[[str], str]) -> None:
+        self.lookup = lookup
+        self.table = np.full(sys.maxunicode + 1, -1, dtype=np.int16)
+        self.labels: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, code_points: np.ndarray) -> np.ndarray:
+        """The ids of the labels of the code points, indices into `labels`."""
+        ids = self.table[code_points]
+        missing = code_points[ids < 0]
+        if len(missing) > 0:
+            with self._lock:
+                for code_point in missing:
+                    if self.table[code_point] >= 0:
+                        # Added by another thread, or earlier in this call.
+                        continue
+                    label = self.lookup(chr(code_point))
+                    if label not in self._ids:
+                        self._ids[label] = len(self.labels)
+                        self.labels.append(label)
+                    self.table[code_point] = self._ids[label]
+        return self.table[code_points]
+
+
+@functools.lru_cache(maxsize=None)
+def unicode_tables() -> Dict[str, UnicodeTable]:
+    """The tables of the block alias, category alias and script of code points."""
     try:
         from tangled_up_in_unicode import (  # type: ignore
             block,
@@ -72,76 +139,97 @@ def unicode_summary_vc(vc: pd.Series) -> dict:
         category_long = char_handler
         script = char_handler
 
+    return {
+        "block_alias": UnicodeTable(lambda char: block_abbr(block(char))),
+        "category_alias": UnicodeTable(lambda char: category_long(category(char))),
+        "script": UnicodeTable(script),
+    }
+
+
+def group_character_counts(
+    table: UnicodeTable, code_points: np.ndarray, character_counts: pd.Series
+) -> Tuple[dict, pd.Series, dict]:
+    """Group the character counts by the labels of a Unicode property.
+
+    Args:
+        table: the table of the property
+        code_points: the code points of the characters
+        character_counts: the counts of the characters, sorted from the most
+            frequent down
+
+    Returns:
+        The label of each character, the counts of the labels sorted from the most
+        frequent down, and the character counts of each label.
+    """
+    if len(code_points) == 0:
+        return {}, counter_to_series(Counter()), {}
+
+    ids = table(code_points)
+    labels = np.array(table.labels, dtype=object)
+    characters = character_counts.index.values
+    counts = character_counts.to_numpy(dtype=np.int64)
+
+    # The labels in the order in which they first appear, as `Counter` keeps them.
+    groups, unique = pd.factorize(ids)
+    totals = np.bincount(groups, weights=counts).astype(np.int64)
+    order = np.argsort(-totals, kind="stable")
+    label_counts = pd.Series(totals[order], index=labels[unique[order]].tolist())
+
+    char_counts = {
+        labels[i]: pd.Series(
+            counts[groups == j], index=characters[groups == j].tolist()
+        )
+        for j, i in enumerate(unique)
+    }
+    return dict(zip(characters, labels[ids])), label_counts, char_counts
+
+
+def unicode_summary_vc(vc: pd.Series) -> dict:
     # Unicode Character Summaries (category and script name)
     character_counts = get_character_counts_vc(vc)
+    code_points = np.fromiter(
+        map(ord, character_counts.index), dtype=np.uint32, count=len(character_counts)
+    )
 
-    character_counts_series = character_counts
     summary = {
-        "n_characters_distinct": len(character_counts_series),
-        "n_characters": np.sum(character_counts_series.values),
-        "character_counts": character_counts_series,
+        "n_characters_distinct": len(character_counts),
+        "n_characters": np.sum(character_counts.values),
+        "character_counts": character_counts,
     }
 
-    char_to_block = {key: block(key) for key in character_counts.keys()}
-    char_to_category_short = {key: category(key) for key in character_counts.keys()}
-    char_to_script = {key: script(key) for key in character_counts.keys()}
+    tables = unicode_tables()
+    block_alias_values, block_alias_counts, block_alias_char_counts = (
+        group_character_counts(tables["block_alias"], code_points, character_counts)
+    )
+    category_alias_values, category_alias_counts, category_alias_char_counts = (
+        group_character_counts(tables["category_alias"], code_points, character_counts)
+    )
+    _, script_counts, script_char_counts = group_character_counts(
+        tables["script"], code_points, character_counts
+    )
 
     summary.update(
         {
-            "category_alias_values": {
-                key: category_long(value)
-                for key, value in char_to_category_short.items()
-            },
-            "block_alias_values": {
-                key: block_abbr(value) for key, value in char_to_block.items()
-            },
+            "category_alias_values": category_alias_values,
+            "block_alias_values": block_alias_values,
         }
     )
 
-    # Retrieve original distribution
-    block_alias_counts: Counter = Counter()
-    per_block_char_counts: dict = {
-        k: Counter() for k in summary["block_alias_values"].values()
-    }
-    for char, n_char in character_counts.items():
-        block_name = summary["block_alias_values"][char]
-        block_alias_counts[block_name] += n_char
-        per_block_char_counts[block_name][char] = n_char
-    summary["block_alias_counts"] = counter_to_series(block_alias_counts)
+    summary["block_alias_counts"] = block_alias_counts
     summary["n_block_alias"] = len(summary["block_alias_counts"])
-    summary["block_alias_char_counts"] = {
-        k: counter_to_series(v) for k, v in per_block_char_counts.items()
-    }
+    summary["block_alias_char_counts"] = block_alias_char_counts
 
-    script_counts: Counter = Counter()
-    per_script_char_counts: dict = {k: Counter() for k in char_to_script.values()}
-    for char, n_char in character_counts.items():
-        script_name = char_to_script[char]
-        script_counts[script_name] += n_char
-        per_script_char_counts[script_name][char] = n_char
-    summary["script_counts"] = counter_to_series(script_counts)
+    summary["script_counts"] = script_counts
     summary["n_scripts"] = len(summary["script_counts"])
-    summary["script_char_counts"] = {
-        k: counter_to_series(v) for k, v in per_script_char_counts.items()
-    }
+    summary["script_char_counts"] = script_char_counts
 
-    category_alias_counts: Counter = Counter()
-    per_category_alias_char_counts: dict = {
-        k: Counter() for k in summary["category_alias_values"].values()
-    }
-    for char, n_char in character_counts.items():
-        category_alias_name = summary["category_alias_values"][char]
-        category_alias_counts[category_alias_name] += n_char
-        per_category_alias_char_counts[category_alias_name][char] += n_char
-    summary["category_alias_counts"] = counter_to_series(category_alias_counts)
+    summary["category_alias_counts"] = category_alias_counts
     if len(summary["category_alias_counts"]) > 0:
         summary["category_alias_counts"].index = summary[
             "category_alias_counts"
         ].index.str.replace("_", " ")
     summary["n_category"] = len(summary["category_alias_counts"])
-    summary["category_alias_char_counts"] = {
-        k: counter_to_series(v) for k, v in per_category_alias_char_counts.items()
-    }
+    summary["category_alias_char_counts"] = category_alias_char_counts
 
     with contextlib.suppress(AttributeError):
         summary["category_alias_counts"].index = summary[
@@ -151,7 +239,83 @@ def unicode_summary_vc(vc: pd.Series) -> dict:
     return summary
 
 
-def word_summary_vc(vc: pd.Series, stop_words: List[str] = []) -> dict:
+def _count_words(
+    texts: list,
+    counts: list,
+    stop_words: FrozenSet[str],
+    word_counts: Dict[str, int],
+    words: Optional[Set[str]] = None,
+) -> None:
+    """Add the weighted counts of the words of the texts to `word_counts`, only
+    counting the `words` if given."""
+    for text, count in zip(texts, counts):
+        for word in text.lower().split():
+            word = word.strip(_WORD_STRIP)
+            if word in stop_words or (words is not None and word not in words):
+                continue
+            word_counts[word] = word_counts.get(word, 0) + count
+
+
+def word_counts_vc(
+    vc: pd.Series,
+    stop_words: FrozenSet[str] = frozenset(),
+    top_k: int = 0,
+    batch_size: int = 10_000,
+) -> Tuple[Dict[str, int], bool]:
+    """Count the words of the values of a value count, weighted by their count.
+
+    The value counts are tokenized in batches of `batch_size` values, each
+    distinct value once. With `top_k`, at most `2 * top_k` words are tracked with
+    a Misra-Gries summary (see `heavy_hitters_pandas.misra_gries`), and the
+    candidates are counted exactly in a second pass. The first `top_k` words are
+    candidates too, so that `top_k` words are returned. The full vocabulary is
+    never kept, but only the words making up more than `1 / (2 * top_k + 1)` of
+    the (weighted) words are certain to be found.
+
+    Args:
+        vc: Series containing all unique values as index and their frequency
+            as value.
+        stop_words: lowercase words not to count
+        top_k: the number of words to keep, zero keeps every word
+        batch_size: the number of values tokenized at once
+
+    Returns:
+        The word counts, by first appearance, and whether the `top_k` most
+        frequent words are estimated.
+    """
+    word_counts: Dict[str, int] = {}
+    first_words: Set[str] = set()
+    approximated = False
+    for start in range(0, len(vc), batch_size):
+        texts = vc.index[start : start + batch_size].tolist()
+        counts = vc.iloc[start : start + batch_size].tolist()
+        _count_words(texts, counts, stop_words, word_counts)
+        if start == 0:
+            first_words = set(itertools.islice(word_counts, top_k))
+
+        if top_k > 0 and len(word_counts) > 2 * top_k:
+            threshold = heapq.nlargest(2 * top_k + 1, word_counts.values())[-1]
+            word_counts = {
+                word: count - threshold
+                for word, count in word_counts.items()
+                if count > threshold
+            }
+            approximated = True
+
+    if approximated:
+        candidates = set(word_counts) | first_words
+        word_counts = {}
+        for start in range(0, len(vc), batch_size):
+            texts = vc.index[start : start + batch_size].tolist()
+            counts = vc.iloc[start : start + batch_size].tolist()
+            _count_words(texts, counts, stop_words, word_counts, candidates)
+
+    return word_counts, approximated
+
+
+def word_summary_vc(
+    vc: pd.Series, stop_words: Iterable[str] = (), top_k: int = 0
+) -> dict:
     """Count the number of occurrences of each individual word across
     all lines of the data Series, then sort from the word with the most
     occurrences to the word with the least occurrences. If a list of
@@ -161,29 +325,35 @@ def word_summary_vc(vc: pd.Series, stop_words: List[str] = []) -> dict:
         vc: Series containing all unique categories as index and their
             frequency as value. Sorted from the most frequent down.
         stop_words: List of stop words to ignore, empty by default.
+        top_k: Number of most frequent words to keep, all by default. Their
+            counts are exact, but the set of words is estimated when the
+            column has more than `2 * top_k` distinct words.
 
     Returns:
         A dict containing the results as a Series with unique words as
         index and the computed frequency as value
     """
     # TODO: configurable lowercase/punctuation etc.
-    # TODO: remove punctuation in words
-
-    series = pd.Series(vc.index, index=vc, dtype=object)
-    word_lists = series.str.lower().str.split()
-    words = word_lists.explode().str.strip(string.punctuation + string.whitespace)
-    word_counts = pd.Series(words.index, index=words)
-    # fix for pandas 1.0.5
-    word_counts = word_counts[word_counts.index.notnull()]
-    word_counts = word_counts.groupby(level=0, sort=False).sum()
+    stop_words = frozenset(x.lower() for x in stop_words)
+    counts, approximated = word_counts_vc(vc, stop_words, top_k)
+
+    word_counts = pd.Series(
+        list(counts.values()),
+        index=pd.Index(list(counts), dtype=object, name=vc.index.name),
+        dtype=vc.dtype,
+        name=vc.name,
+    )
     word_counts = word_counts.sort_values(ascending=False)
+    if top_k > 0:
+        word_counts = word_counts.head(top_k)
 
-    # Remove stop words
-    if len(stop_words) > 0:
-        stop_words = [x.lower() for x in stop_words]
-        word_counts = word_counts.loc[~word_counts.index.isin(stop_words)]
+    if word_counts.empty:
+        return {}
 
-    return {"word_counts": word_counts} if not word_counts.empty else {}
+    summary = {"word_counts": word_counts}
+    if approximated:
+        mark_approximated(summary, "word_counts")
+    return summary
 
 
 def length_summary_vc(vc: pd.Series) -> dict:
@@ -240,8 +410,11 @@ def pandas_describe_categorical_1d(
     # Only run if at least 1 non-missing value
     value_counts = summary["value_counts_without_nan"]
     value_counts.index = value_counts.index.astype(str)
+    weighted = weighted_values(series, summary)
 
     summary["imbalance"] = column_imbalance_score(value_counts, len(value_counts))
+    if summary.get("heavy_hitters", False):
+        mark_approximated(summary, "imbalance", "chi_squared")
 
     redact = config.vars.cat.redact
     if not redact:
@@ -252,7 +425,7 @@ def pandas_describe_categorical_1d(
         summary["chi_squared"] = chi_square(histogram=value_counts.values)
 
     if config.vars.cat.length:
-        summary.update(length_summary_vc(value_counts))
+        summary.update(length_summary_vc(weighted))
         summary.update(
             histogram_compute(
                 config,
@@ -264,10 +437,14 @@ def pandas_describe_categorical_1d(
         )
 
     if config.vars.cat.characters:
-        summary.update(unicode_summary_vc(value_counts))
+        summary.update(unicode_summary_vc(weighted))
 
     if config.vars.cat.words:
-        summary.update(word_summary_vc(value_counts, config.vars.cat.stop_words))
+        summary.update(
+            word_summary_vc(
+                weighted, config.vars.cat.stop_words, config.vars.cat.words_top_k
+            )
+        )
 
     if config.vars.cat.dirty_categories:  # noqa: SIM102
         if not _displayed_catvar_banner:
@@ -3,7 +3,61 @@ from typing import Tuple
 import pandas as pd
 
 from profunda.config import Settings
-from profunda.model.summary_algorithms import describe_counts
+from profunda.model.pandas.heavy_hitters_pandas import (
+    heavy_hitters,
+    is_high_cardinality,
+)
+from profunda.model.partial import HyperLogLog
+from profunda.model.summary_algorithms import (
+    HEAVY_HITTERS_TYPES,
+    describe_counts,
+    mark_approximated,
+)
+
+
+def describe_heavy_hitters(config: Settings, series: pd.Series, summary: dict) -> bool:
+    """Count only the most frequent values of a high-cardinality series.
+
+    Args:
+        config: report Settings object
+        series: Series for which we want to calculate the values.
+        summary: series' summary, updated in place.
+
+    Returns:
+        True if the series was counted, False if it should be counted in full.
+    """
+    if (
+        not config.heavy_hitters.enabled
+        or summary.get("type") not in HEAVY_HITTERS_TYPES
+    ):
+        return False
+
+    values = series.dropna()
+    try:
+        if not is_high_cardinality(config, values):
+            return False
+        sketch = HyperLogLog()
+        value_counts = heavy_hitters(values, config.heavy_hitters.k, sketch)
+    except TypeError:
+        return False
+
+    summary.update(
+        {
+            "hashable": True,
+            "heavy_hitters": True,
+            "value_counts_without_nan": value_counts,
+            "n_missing": len(series) - len(values),
+            "n_distinct": sketch.estimate(),
+        }
+    )
+    try:
+        summary["value_counts_index_sorted"] = value_counts.sort_index(ascending=True)
+        summary["ordering"] = True
+    except TypeError:
+        summary["ordering"] = False
+
+    mark_approximated(summary, "value_counts_without_nan")
+    return True
 
 
 @describe_counts.register
@@ -20,6 +74,9 @@ def pandas_describe_counts(
     Returns:
         A dictionary with the count values (with and without NaN, distinct).
     """
+    if describe_heavy_hitters(config, series, summary):
+        return config, series, summary
+
     try:
         value_counts_with_nan = series.value_counts(dropna=False)
         _ = set(value_counts_with_nan.index)
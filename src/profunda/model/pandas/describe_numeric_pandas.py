@@ -1,4 +1,4 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,13 +12,23 @@ else:
 
 from profunda.config import Settings
 from profunda.model.summary_algorithms import (
+    central_moments,
     chi_square,
     describe_numeric_1d,
     histogram_compute,
+    kurtosis_from_moments,
     series_handle_nulls,
     series_hashable,
+    skewness_from_moments,
 )
 
+# The statistics are computed from the value counts when the ratio of distinct
+# values to values is at most this. Sorting the distinct values costs as much as
+# the passes over the full series at a ratio of about 0.28 (measured at 2M rows);
+# the threshold stays below it, where the value counts are reliably faster (see
+# `numeric_stats_weighted`).
+WEIGHTED_STATS_MAX_DISTINCT_RATIO = 0.25
+
 
 def mad(arr: np.ndarray) -> np.ndarray:
     """Median Absolute Deviation: a "Robust" version of standard deviation.
@@ -28,6 +38,105 @@ def mad(arr: np.ndarray) -> np.ndarray:
     return np.median(np.abs(arr - np.median(arr)))
 
 
+def _rank_values(
+    values: np.ndarray, cumulative: np.ndarray, ranks: np.ndarray
+) -> np.ndarray:
+    """The values at the given (integer) ranks of the sorted repeated values."""
+    index = np.searchsorted(cumulative, ranks, side="right")
+    return values[np.minimum(index, len(values) - 1)]
+
+
+def weighted_quantiles(
+    values: np.ndarray, counts: np.ndarray, quantiles: Sequence[float]
+) -> np.ndarray:
+    """The quantiles of sorted distinct values repeated `counts` times.
+
+    The ranks are looked up in the cumulative counts, and interpolated linearly as
+    `Series.quantile` does, which returns the same values as the full array.
+    """
+    cumulative = np.cumsum(counts)
+    n = cumulative[-1]
+    # pandas hands percentiles to numpy, which divides them by 100 again.
+    q = np.asarray(quantiles, dtype=float) * 100 / 100
+    position = (n - 1) * q
+    lower = np.floor(position)
+    gamma = position - np.where(position >= n - 1, -1, lower)
+    previous = _rank_values(values, cumulative, np.clip(lower, 0, n - 1))
+    following = _rank_values(values, cumulative, np.clip(lower + 1, 0, n - 1))
+
+    diff = following - previous
+    result = np.asarray(previous + diff * gamma)
+    np.subtract(
+        following, diff * (1 - gamma), out=result, where=gamma >= 0.5, casting="unsafe"
+    )
+    return result
+
+
+def weighted_median(values: np.ndarray, counts: np.ndarray) -> float:
+    """The median of sorted distinct values repeated `counts` times, as `np.median`."""
+    cumulative = np.cumsum(counts)
+    n = cumulative[-1]
+    middle = _rank_values(values, cumulative, np.array([(n - 1) // 2, n // 2]))
+    return np.mean(middle)
+
+
+def numeric_stats_weighted(
+    value_counts: pd.Series, quantiles: Sequence[float]
+) -> Dict[str, Any]:
+    """The statistics of the values of a numeric series, from its value counts.
+
+    The moments are recombined from the power sums of the distinct values weighted
+    by their counts, and the quantiles, the median and the MAD are looked up in
+    their cumulative counts. This takes a pass over the distinct values instead of
+    several passes over the full series, which pays off for tall series with few
+    distinct values. The value counts must be finite and non-empty.
+
+    Args:
+        value_counts: the counts of the values, without NaN
+        quantiles: the quantiles to compute
+
+    Returns:
+        The moments, extremes, sum, MAD and quantiles of the series.
+    """
+    order = np.argsort(value_counts.index.values, kind="stable")
+    values = value_counts.index.values[order]
+    counts = value_counts.values[order]
+
+    count = int(counts.sum())
+    total = np.dot(values, counts)
+    mean = total / count
+    deviations = values - mean
+    power_sums = [np.dot(counts, deviations**k) for k in range(1, 5)]
+    _, m2, m3, m4 = central_moments(count, power_sums, mean)
+
+    variance = m2 / (count - 1) if count > 1 else np.nan
+
+    median = weighted_median(values, counts)
+    absolute_deviations = np.abs(values - median)
+    order = np.argsort(absolute_deviations, kind="stable")
+
+    stats = {
+        "mean": mean,
+        "std": np.sqrt(variance),
+        "variance": variance,
+        "min": values[0],
+        "max": values[-1],
+        "kurtosis": kurtosis_from_moments(count, m2, m4),
+        "skewness": skewness_from_moments(count, m2, m3),
+        "sum": total,
+        "mad": weighted_median(absolute_deviations[order], counts[order]),
+    }
+    stats.update(
+        {
+            f"{percentile:.0%}": value
+            for percentile, value in zip(
+                quantiles, weighted_quantiles(values, counts, quantiles)
+            )
+        }
+    )
+    return stats
+
+
 def numeric_stats_pandas(series: pd.Series) -> Dict[str, Any]:
     return {
         "mean": series.mean(),
@@ -49,7 +158,6 @@ def numeric_stats_numpy(
     vc = series_description["value_counts_without_nan"]
     index_values = vc.index.values
 
-    # FIXME: can be performance optimized by using weights in std, var, kurt and skew...
     if len(index_values):
         return {
             "mean": np.average(index_values, weights=vc.values),
@@ -112,6 +220,13 @@ def pandas_describe_numeric_1d(
 
     stats = summary
 
+    n_distinct = len(value_counts)
+    weighted = (
+        not isinstance(series.dtype, IntegerDtype)
+        and summary["n_infinite"] == 0
+        and n_distinct > 0
+        and n_distinct <= WEIGHTED_STATS_MAX_DISTINCT_RATIO * summary["count"]
+    )
     if isinstance(series.dtype, IntegerDtype):
         stats.update(numeric_stats_pandas(series))
         present_values = series.astype(str(series.dtype).lower())
@@ -119,24 +234,24 @@ def pandas_describe_numeric_1d(
     else:
         present_values = series.values
         finite_values = present_values[np.isfinite(present_values)]
-        stats.update(numeric_stats_numpy(present_values, series, summary))
+        if weighted:
+            stats.update(numeric_stats_weighted(value_counts, quantiles))
+        else:
+            stats.update(numeric_stats_numpy(present_values, series, summary))
 
-    stats.update(
-        {
-            "mad": mad(present_values),
-        }
-    )
+    if not weighted:
+        stats["mad"] = mad(present_values)
+        stats.update(
+            {
+                f"{percentile:.0%}": value
+                for percentile, value in series.quantile(quantiles).to_dict().items()
+            }
+        )
 
     if chi_squared_threshold > 0.0:
         stats["chi_squared"] = chi_square(finite_values)
 
     stats["range"] = stats["max"] - stats["min"]
-    stats.update(
-        {
-            f"{percentile:.0%}": value
-            for percentile, value in series.quantile(quantiles).to_dict().items()
-        }
-    )
     stats["iqr"] = stats["75%"] - stats["25%"]
     stats["cv"] = stats["std"] / stats["mean"] if stats["mean"] else np.nan
     stats["p_zeros"] = stats["n_zeros"] / summary["n"]
@@ -3,7 +3,12 @@ from typing import Tuple
 import pandas as pd
 
 from profunda.config import Settings
-from profunda.model.summary_algorithms import describe_supported, series_hashable
+from profunda.model.summary_algorithms import (
+    describe_supported,
+    estimate_distinct_counts,
+    mark_approximated,
+    series_hashable,
+)
 
 
 @describe_supported.register
@@ -25,9 +30,21 @@ def pandas_describe_supported(
     # number of non-NaN observations in the Series
     count = series_description["count"]
 
-    value_counts = series_description["value_counts_without_nan"]
-    distinct_count = len(value_counts)
-    unique_count = value_counts.where(value_counts == 1).count()
+    if series_description.get("heavy_hitters", False):
+        # Only the most frequent values were counted, estimate from them and from
+        # the distinct count sketch.
+        distinct_count, unique_count = estimate_distinct_counts(
+            series_description["value_counts_without_nan"],
+            series_description.pop("n_distinct"),
+            count,
+        )
+        mark_approximated(
+            series_description, "n_distinct", "p_distinct", "n_unique", "p_unique"
+        )
+    else:
+        value_counts = series_description["value_counts_without_nan"]
+        distinct_count = len(value_counts)
+        unique_count = value_counts.where(value_counts == 1).count()
 
     stats = {
         "n_distinct": distinct_count,
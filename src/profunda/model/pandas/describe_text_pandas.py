@@ -8,13 +8,16 @@ from profunda.model.pandas.describe_categorical_pandas import (
     unicode_summary_vc,
     word_summary_vc,
 )
+from profunda.model.pandas.heavy_hitters_pandas import weighted_values
 from profunda.model.summary_algorithms import (
+    describe_text_1d,
     histogram_compute,
     series_handle_nulls,
     series_hashable,
 )
 
 
+@describe_text_1d.register
 @series_hashable
 @series_handle_nulls
 def pandas_describe_text_1d(
@@ -38,11 +41,12 @@ def pandas_describe_text_1d(
     # Only run if at least 1 non-missing value
     value_counts = summary["value_counts_without_nan"]
     value_counts.index = value_counts.index.astype(str)
+    weighted = weighted_values(series, summary)
 
     summary.update({"first_rows": series.head(5)})
 
     if config.vars.text.length:
-        summary.update(length_summary_vc(value_counts))
+        summary.update(length_summary_vc(weighted))
         summary.update(
             histogram_compute(
                 config,
@@ -54,9 +58,13 @@ def pandas_describe_text_1d(
         )
 
     if config.vars.text.characters:
-        summary.update(unicode_summary_vc(value_counts))
+        summary.update(unicode_summary_vc(weighted))
 
     if config.vars.text.words:
-        summary.update(word_summary_vc(value_counts, config.vars.cat.stop_words))
+        summary.update(
+            word_summary_vc(
+                weighted, config.vars.cat.stop_words, config.vars.cat.words_top_k
+            )
+        )
 
     return config, series, summary
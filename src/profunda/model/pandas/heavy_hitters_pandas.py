@@ -0,0 +1,114 @@
+from typing import Optional
+
+import pandas as pd
+
+from profunda.config import Settings
+from profunda.model.partial import HyperLogLog
+
+
+def is_high_cardinality(config: Settings, series: pd.Series) -> bool:
+    """Estimate whether most values of a series are distinct.
+
+    The ratio of distinct values is estimated from the first
+    `config.heavy_hitters.sample_size` values. Series that are not longer than
+    the sample are never considered high-cardinality, as counting them in full is
+    cheap.
+
+    Args:
+        config: report Settings object
+        series: The series, without missing values.
+
+    Returns:
+        True if the estimated ratio of distinct values exceeds
+        `config.heavy_hitters.distinct_ratio`.
+    """
+    sample_size = config.heavy_hitters.sample_size
+    if len(series) <= sample_size:
+        return False
+
+    sample = series.iloc[:sample_size]
+    return sample.nunique() / len(sample) > config.heavy_hitters.distinct_ratio
+
+
+def misra_gries(
+    series: pd.Series,
+    k: int,
+    chunksize: int = 100_000,
+    sketch: Optional[HyperLogLog] = None,
+) -> pd.Series:
+    """Misra-Gries summary of the most frequent values of a series.
+
+    The series is summarized chunk by chunk, merging the counts of each chunk into
+    at most `k` counters. When more than `k` values are tracked, the `k + 1`-th
+    largest count is subtracted from all counters and the non-positive ones are
+    dropped. Every value occurring more than `len(series) / (k + 1)` times is kept,
+    with a count that underestimates its frequency by at most that much.
+
+    Args:
+        series: The series, without missing values.
+        k: The number of counters.
+        chunksize: The number of values counted at once.
+        sketch: If given, the distinct values of each chunk are added to it.
+
+    Returns:
+        The (underestimated) counts of the tracked values.
+    """
+    counters = pd.Series(dtype="int64")
+
+    for start in range(0, len(series), chunksize):
+        chunk = series.iloc[start : start + chunksize].value_counts(sort=False)
+        if sketch is not None:
+            sketch.add(
+                pd.util.hash_array(chunk.index.to_numpy(dtype=object), categorize=False)
+            )
+        counters = pd.concat([counters, chunk]).groupby(level=0, sort=False).sum()
+
+        if len(counters) > k:
+            threshold = counters.nlargest(k + 1).iloc[-1]
+            counters = counters[counters > threshold] - threshold
+
+    return counters.astype("int64")
+
+
+def heavy_hitters(
+    series: pd.Series, k: int, sketch: Optional[HyperLogLog] = None
+) -> pd.Series:
+    """Count the most frequent values of a series without counting every value.
+
+    The candidates are found with a Misra-Gries summary with `2 * k` counters and
+    then counted exactly in a second pass. The first `k` values are candidates
+    too, so near-unique series still return `k` values.
+
+    Args:
+        series: The series, without missing values.
+        k: The number of values to return.
+        sketch: If given, every distinct value is added to it, to estimate the
+            distinct count without counting every value.
+
+    Returns:
+        The counts of (at most) the `k` most frequent values, sorted from the most
+        frequent down, like `pd.Series.value_counts`.
+    """
+    candidates = misra_gries(series, 2 * k, sketch=sketch).index.append(
+        pd.Index(series.iloc[:k])
+    )
+    counts = series[series.isin(candidates)].value_counts()
+    return counts.head(k)
+
+
+def weighted_values(series: pd.Series, summary: dict) -> pd.Series:
+    """Values and their counts, to summarize the lengths, characters and words.
+
+    When only the most frequent values were counted, the values of the series are
+    counted in full instead, so these summaries remain exact.
+
+    Args:
+        series: The series, without missing values.
+        summary: The dict containing the series description so far.
+
+    Returns:
+        A series with the values as index and their counts as values.
+    """
+    if summary.get("heavy_hitters", False):
+        return series.value_counts(sort=False)
+    return summary["value_counts_without_nan"]
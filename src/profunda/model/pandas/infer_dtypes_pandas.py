@@ -0,0 +1,275 @@
+"""Type inference of pandas series, on a sample of their distinct values."""
+
+import hashlib
+import json
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api import types as pdt
+from visions import VisionsTypeset
+from visions.typesets.typeset import get_type_from_path
+
+from profunda.config import Settings
+from profunda.model.type_cache import get_type_cache
+
+
+def stratified_sample(counts: np.ndarray, size: int) -> np.ndarray:
+    """A sample of distinct values, stratified by their frequency.
+
+    The values are ranked from the most frequent down, and the sample takes
+    values evenly spaced over the ranking: the most and the least frequent values
+    are always in the sample.
+
+    Args:
+        counts: the count of each distinct value
+        size: the number of values to sample
+
+    Returns:
+        The positions of the sampled values in `counts`.
+    """
+    ranking = np.argsort(-counts, kind="stable")
+    if len(ranking) <= size:
+        return ranking
+
+    positions = np.linspace(0, len(ranking) - 1, size).round().astype(int)
+    return ranking[np.unique(positions)]
+
+
+def follow_path(
+    typeset: VisionsTypeset, path: List[Any], series: pd.Series
+) -> Optional[pd.Series]:
+    """Follow an inference path over a series, as the typeset would.
+
+    Args:
+        typeset: the typeset
+        path: the types from the root of the typeset to the inferred type
+        series: the series
+
+    Returns:
+        The series cast to the last type of the path, or None if a relation of the
+        path does not hold for the series, or if the series can be inferred further.
+    """
+    graph = typeset.relation_graph
+    state: dict = {}
+    for from_type, to_type in zip(path, path[1:]):
+        relation = graph[from_type][to_type]["relationship"]
+        if not relation.is_relation(series, state):
+            return None
+        series = relation.transform(series, state)
+
+    for to_type in graph.successors(path[-1]):
+        if graph[path[-1]][to_type]["relationship"].is_relation(series, state):
+            return None
+
+    return series
+
+
+def factorize(series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """The distinct values of a series, and the position of the value of each row
+    among them. Missing values are kept as a distinct value, so that the relations
+    and transformations of the typeset see them."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    return codes, pd.Series(uniques, dtype=series.dtype, name=series.name)
+
+
+def cast_distinct(distinct: pd.Series, codes: np.ndarray, index: pd.Index) -> pd.Series:
+    """Map the (cast) distinct values of a series back to its rows."""
+    return distinct.iloc[codes].set_axis(index)
+
+
+def infer_type_sampled(
+    config: Settings,
+    typeset: VisionsTypeset,
+    series: pd.Series,
+    factorized: Optional[Tuple[np.ndarray, pd.Series]] = None,
+) -> Optional[Tuple[List[Any], pd.Series]]:
+    """Infer the type of a string series on a sample of its distinct values.
+
+    The type is inferred on a stratified sample of the distinct values, and
+    verified by following its inference path over all the distinct values. The
+    relations of the typeset hold for a series when they hold for its distinct
+    values, except for those depending on the number of rows (categories), which
+    are ruled out by sampling only series with more distinct values than
+    `config.vars.cat.cardinality_threshold`. The distinct values are cast once,
+    and the cast values are mapped back to the rows.
+
+    Args:
+        config: report Settings object
+        typeset: the typeset
+        series: the series
+        factorized: the series factorized with `factorize`, if already done
+
+    Returns:
+        The inference path and the series cast to its last type, or None if the
+        series is not sampled (not a string series, or with few distinct values)
+        or if the type of the sample does not hold for all distinct values.
+    """
+    sample_size = max(
+        config.type_inference.sample_size, config.vars.cat.cardinality_threshold + 1
+    )
+    if factorized is None:
+        if pdt.infer_dtype(series, skipna=True) != "string":
+            return None
+        factorized = factorize(series)
+
+    codes, distinct = factorized
+    counts = np.bincount(codes, minlength=len(distinct))
+    counts[distinct.isna().to_numpy()] = 0
+    if np.count_nonzero(counts) <= sample_size:
+        return None
+
+    sample = stratified_sample(counts, sample_size)
+    sample = sample[counts[sample] > 0]
+    _, path, _ = typeset.infer(distinct.iloc[sample].reset_index(drop=True))
+
+    cast = follow_path(typeset, path, distinct)
+    if cast is None:
+        return None
+
+    return path, cast_distinct(cast, codes, series.index)
+
+
+def column_fingerprint(
+    config: Settings,
+    typeset: VisionsTypeset,
+    series: pd.Series,
+    distinct: Optional[pd.Series] = None,
+) -> str:
+    """A key identifying the inferred type of a series.
+
+    The key combines the name, the dtype and the number of values of the series
+    with a fingerprint of its distinct values, which does not depend on their
+    order or count. The settings of the variables and the types of the typeset
+    are part of the key, as they change the inferred types.
+
+    Args:
+        config: report Settings object
+        typeset: the typeset
+        series: the series
+        distinct: the distinct values of the series (see `factorize`), if known
+
+    Returns:
+        The hexadecimal digest of the key.
+    """
+    values = (series if distinct is None else distinct).dropna().unique()
+    hashes = pd.util.hash_array(np.asarray(values), categorize=False)
+
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [
+                str(series.name),
+                str(series.dtype),
+                int(series.count()),
+                sorted(str(t) for t in typeset.types),
+                config.vars.json(),
+            ]
+        ).encode()
+    )
+    digest.update(np.sort(hashes).tobytes())
+    return digest.hexdigest()
+
+
+def cast_along_path(
+    typeset: VisionsTypeset, names: List[str], series: pd.Series
+) -> Optional[Tuple[List[Any], pd.Series]]:
+    """Cast a series along a known inference path, without testing the relations.
+
+    Args:
+        typeset: the typeset
+        names: the names of the types of the path
+        series: the series
+
+    Returns:
+        The path and the cast series, or None if the path is not in the typeset.
+    """
+    types = {str(t): t for t in typeset.relation_graph.nodes}
+    if any(name not in types for name in names):
+        return None
+
+    path = [types[name] for name in names]
+    graph = typeset.relation_graph
+    state: dict = {}
+    for from_type, to_type in zip(path, path[1:]):
+        if not graph.has_edge(from_type, to_type):
+            return None
+        series = graph[from_type][to_type]["relationship"].transform(series, state)
+    return path, series
+
+
+def pandas_infer_type(
+    config: Settings, typeset: VisionsTypeset, series: pd.Series
+) -> Tuple[Any, pd.Series]:
+    """Infer the type of a series, and cast it to that type.
+
+    With `config.type_inference.cache`, the inference path of a series found in
+    the on-disk cache is reused (see `column_fingerprint`), and the series is cast
+    along it without testing the relations.
+
+    With a positive `config.type_inference.sample_size`, string series with many
+    distinct values are inferred on a sample of them (see `infer_type_sampled`)
+    and cast through their distinct values. The other series, and those whose
+    sampled type does not hold, are inferred on every value.
+
+    Neither the cache nor the sampling is used when the time series types are
+    active, as their relations depend on the order of the rows.
+
+    Args:
+        config: report Settings object
+        typeset: the typeset
+        series: the series
+
+    Returns:
+        The inferred type and the series cast to it.
+    """
+    settings = config.type_inference
+    ordered = config.vars.timeseries.active
+    sampled = settings.sample_size > 0 and not ordered
+    cached = settings.cache and not ordered
+
+    factorized = None
+    if (sampled or cached) and pdt.infer_dtype(series, skipna=True) == "string":
+        factorized = factorize(series)
+
+    cache = None
+    if cached:
+        cache = get_type_cache(settings.cache_dir, settings.cache_size)
+        try:
+            key = column_fingerprint(
+                config,
+                typeset,
+                series,
+                None if factorized is None else factorized[1],
+            )
+        except TypeError:
+            # Unhashable values (e.g. lists) are not fingerprinted.
+            cache = None
+
+    if cache is not None:
+        names = cache.get(key)
+        if names is not None:
+            if factorized is None:
+                hit = cast_along_path(typeset, names, series)
+            else:
+                codes, distinct = factorized
+                hit = cast_along_path(typeset, names, distinct)
+                if hit is not None:
+                    hit = hit[0], cast_distinct(hit[1], codes, series.index)
+            if hit is not None:
+                return get_type_from_path(hit[0]), hit[1]
+
+    inferred = None
+    if sampled and factorized is not None:
+        inferred = infer_type_sampled(config, typeset, series, factorized)
+
+    if inferred is not None:
+        path, series = inferred
+    elif cache is None:
+        return typeset.infer_type(series), typeset.cast_to_inferred(series)
+    else:
+        series, path, _ = typeset.infer(series)
+
+    if cache is not None:
+        cache.put(key, [str(t) for t in path])
+    return get_type_from_path(path), series
@@ -0,0 +1,26 @@
+from typing import Callable, Tuple
+
+import pandas as pd
+
+from profunda.config import Settings
+from profunda.model.scheduler import get_pool_size, get_stage_frames
+
+
+@get_stage_frames.register
+def pandas_get_stage_frames(
+    config: Settings, df: pd.DataFrame
+) -> Tuple[int, Callable[[], pd.DataFrame]]:
+    """Run the stages with `config.pool_size` workers, which only read the DataFrame,
+    if `config.concurrent_stages` is set.
+
+    Args:
+        config: report Settings object
+        df: the pandas DataFrame
+
+    Returns:
+        The number of workers, and a getter of the DataFrame.
+    """
+    if not config.concurrent_stages:
+        return 1, lambda: df
+
+    return get_pool_size(config), lambda: df
@@ -1,7 +1,7 @@
 """Compute statistical description of datasets."""
 
-import multiprocessing
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from typing import Any, Tuple
 
 import numpy as np
@@ -10,6 +10,9 @@ from tqdm import tqdm
 from visions import VisionsTypeset
 
 from profunda.config import Settings
+from profunda.model.pandas.infer_dtypes_pandas import pandas_infer_type
+from profunda.model.performance import measure_stage
+from profunda.model.scheduler import get_pool_size
 from profunda.model.typeset import ProfilingTypeSet
 from profunda.utils.compat import optional_option_context
 from profunda.utils.dataframe import sort_column_names
@@ -51,8 +54,7 @@ def pandas_describe_1d(
 
     elif config.infer_dtypes:
         # Infer variable types
-        vtype = typeset.infer_type(series)
-        series = typeset.cast_to_inferred(series)
+        vtype, series = pandas_infer_type(config, typeset, series)
     else:
         # Detect variable types from pandas dataframe (df.dtypes).
         # [new dtypes, changed using `astype` function are now considered]
@@ -77,19 +79,20 @@ def pandas_get_series_descriptions(
     def describe_column(name: str, series: pd.Series) -> Tuple[str, dict]:
         """Process a single series to get the column description."""
         pbar.set_postfix_str(f"Describe variable: {name}")
-        description = pandas_describe_1d(config, series, summarizer, typeset)
+        with measure_stage("Describe variable", name, rows=len(series)):
+            description = pandas_describe_1d(config, series, summarizer, typeset)
         pbar.update()
         return name, description
 
-    pool_size = (
-        config.pool_size if config.pool_size > 0 else multiprocessing.cpu_count()
-    )
+    pool_size = get_pool_size(config)
 
     series_description = {}
 
     with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        # Run each column in a copy of the context, to share the profiling context
+        # of the run with the workers.
         future_to_col = {
-            executor.submit(describe_column, name, series): name  # type:ignore
+            executor.submit(copy_context().run, describe_column, name, series): name  # type:ignore
             for name, series in df.items()
         }
 
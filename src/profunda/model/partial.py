@@ -0,0 +1,663 @@
+"""Mergeable summaries of the columns of the partitions of a dataset.
+
+A partition (a file, a date shard, a range of row groups...) is profiled on its
+own with `config.partial.enabled`, which records a `PartialSummary` of each column
+in its description. The summaries of the partitions of a column are merged with
+`PartialSummary.merge`, and the description of the whole column is derived from
+the merged summary with `describe_partial`.
+"""
+
+from copy import copy
+from dataclasses import dataclass
+from math import comb
+from typing import Any, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from multimethod import multimethod
+
+from profunda.config import Settings
+from profunda.model.summary_algorithms import (
+    central_moments,
+    chi_square,
+    describe_boolean_1d,
+    describe_categorical_1d,
+    describe_text_1d,
+    histogram_compute,
+    kurtosis_from_moments,
+    mark_approximated,
+    skewness_from_moments,
+)
+
+# Types whose statistics are derived from their value counts only, by running
+# their describers again on the merged value counts.
+VALUE_COUNT_TYPES = {
+    "Boolean": describe_boolean_1d,
+    "Categorical": describe_categorical_1d,
+    "Text": describe_text_1d,
+}
+
+# Types with a quantile sketch and extreme values.
+ORDERED_TYPES = ("Numeric", "DateTime")
+
+
+def _hash_values(values: np.ndarray, type_name: str) -> np.ndarray:
+    """Hash values consistently across partitions, whatever their dtype."""
+    if type_name == "DateTime":
+        # Dates may also be strings, e.g. read from CSV.
+        values = pd.to_datetime(pd.Index(values), errors="coerce").values
+    if type_name in ORDERED_TYPES:
+        series = pd.Series(np.asarray(values, dtype=float))
+    else:
+        series = pd.Series(values, dtype=object).astype(str)
+    return pd.util.hash_pandas_object(series, index=False).to_numpy(np.uint64)
+
+
+class HyperLogLog:
+    """A HyperLogLog sketch of the number of distinct values.
+
+    Merging two sketches takes the maximum of their registers, which gives the
+    sketch of the union of their values. The relative error of the estimate is
+    about `1.04 / sqrt(2 ** precision)`.
+    """
+
+    def __init__(self, precision: int = 14) -> None:
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add the 64-bit hashes of values to the sketch."""
+        if len(hashes) == 0:
+            return
+
+        width = 64 - self.precision
+        index = (hashes >> np.uint64(width)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << width) - 1)
+
+        # The position of the leftmost 1-bit of the remainder.
+        powers = np.left_shift(np.uint64(1), np.arange(width, dtype=np.uint64))
+        bit_length = np.searchsorted(powers, remainder, side="right")
+        rank = (width - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError(
+                "Cannot merge distinct count sketches of different precisions "
+                f"({self.precision} and {other.precision})"
+            )
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self) -> int:
+        """The estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m**2 / np.sum(2.0 ** -self.registers.astype(float))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """A weighted sample of sorted values, to estimate quantiles.
+
+    The sketch holds every distinct value with its count, until it exceeds `size`
+    points. It is then compressed to `size` points of equal weight, at evenly
+    spaced ranks. Quantiles are exact while the sketch is not compressed.
+    """
+
+    def __init__(self, values: np.ndarray, weights: np.ndarray, size: int) -> None:
+        order = np.argsort(values, kind="stable")
+        self.values = np.asarray(values, dtype=float)[order]
+        self.weights = np.asarray(weights, dtype=float)[order]
+        self.size = size
+        self._compress()
+
+    @property
+    def total(self) -> float:
+        return float(np.sum(self.weights))
+
+    def _compress(self) -> None:
+        if len(self.values) <= self.size:
+            return
+
+        cumulative = np.cumsum(self.weights)
+        ranks = (np.arange(self.size) + 0.5) * self.total / self.size
+        index = np.searchsorted(cumulative, ranks)
+        self.values = self.values[index]
+        self.weights = np.full(self.size, self.total / self.size)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        return QuantileSketch(
+            np.concatenate([self.values, other.values]),
+            np.concatenate([self.weights, other.weights]),
+            min(self.size, other.size),
+        )
+
+    def quantile(self, q: float) -> float:
+        """The quantile, interpolated linearly between ranks (as pandas)."""
+        if len(self.values) == 0:
+            return np.nan
+
+        cumulative = np.cumsum(self.weights)
+        position = q * (self.total - 1)
+        lower, upper = np.floor(position), np.ceil(position)
+        index = np.searchsorted(cumulative, [lower, upper], side="right")
+        index = np.minimum(index, len(self.values) - 1)
+        low, high = self.values[index]
+        return low + (position - lower) * (high - low)
+
+    def absolute_deviation(self, center: float) -> "QuantileSketch":
+        """The sketch of the absolute deviations from the center."""
+        return QuantileSketch(np.abs(self.values - center), self.weights, self.size)
+
+
+@dataclass
+class PowerSums:
+    """The count and the sums of the first four powers of `values - shift`.
+
+    The shift, close to the center of the values, avoids catastrophic cancellation
+    when recombining the sums into central moments.
+    """
+
+    count: float
+    shift: float
+    sums: Tuple[float, float, float, float]
+
+    @classmethod
+    def from_counts(
+        cls, values: np.ndarray, counts: np.ndarray, shift: float
+    ) -> "PowerSums":
+        deviations = values - shift
+        sums = tuple(float(np.dot(counts, deviations**k)) for k in range(1, 5))
+        return cls(float(np.sum(counts)), shift, sums)  # type: ignore[arg-type]
+
+    def merge(self, other: "PowerSums") -> "PowerSums":
+        # Shift the sums of the other to the shift of this one, expanding
+        # (x - a) ** k = ((x - b) + (b - a)) ** k.
+        delta = other.shift - self.shift
+        other_sums = (other.count, *other.sums)
+        sums = tuple(
+            self.sums[k - 1]
+            + sum(comb(k, j) * delta ** (k - j) * other_sums[j] for j in range(k + 1))
+            for k in range(1, 5)
+        )
+        return PowerSums(self.count + other.count, self.shift, sums)  # type: ignore[arg-type]
+
+    def stats(self) -> dict:
+        count = int(self.count)
+        mean, m2, m3, m4 = central_moments(count, self.sums, self.shift)
+        variance = m2 / (count - 1) if count > 1 else np.nan
+        return {
+            "mean": mean,
+            "std": np.sqrt(variance),
+            "variance": variance,
+            "skewness": skewness_from_moments(count, m2, m3),
+            "kurtosis": kurtosis_from_moments(count, m2, m4),
+            "sum": self.sums[0] + count * self.shift,
+        }
+
+
+def _merge_counts(left: pd.Series, right: pd.Series) -> pd.Series:
+    if left.empty:
+        return right
+    if right.empty:
+        return left
+    return pd.concat([left, right]).groupby(level=0, sort=False).sum()
+
+
+def _extremes(counts: pd.Series, n: int) -> pd.Series:
+    """The counts of the `n` smallest and `n` largest values."""
+    counts = counts.sort_index()
+    if len(counts) <= 2 * n:
+        return counts
+    return pd.concat([counts.head(n), counts.tail(n)])
+
+
+class PartialSummary:
+    """The mergeable summary of a column of a partition.
+
+    It is a plain class rather than a dataclass, so the description exports
+    (e.g. JSON) show it by its representation instead of expanding its sketches.
+
+    Attributes:
+        type: The type of the column.
+        n: The number of rows.
+        n_missing: The number of missing values.
+        memory_size: The memory size of the column.
+        n_distinct: The number of distinct values (a lower bound once merged).
+        counts: The counts of the most frequent values.
+        exact: Whether `counts` holds every distinct value.
+        distinct: The distinct count sketch.
+        extremes: The counts of the smallest and largest values.
+        quantiles: The quantile sketch of the finite values.
+        moments: The power sums of the finite values (numeric columns).
+        histogram: The histogram over the shared bin edges of the column, if any.
+        min: The minimum.
+        max: The maximum.
+        n_zeros: The number of zeros.
+        n_negative: The number of negative values.
+        n_infinite: The number of infinite values.
+        monotonic: The monotonicity of the column (see the numeric describer), in
+            the order of the partitions.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        n: int,
+        n_missing: int,
+        memory_size: int,
+        n_distinct: int,
+        counts: pd.Series,
+        exact: bool,
+        distinct: HyperLogLog,
+    ) -> None:
+        self.type = type
+        self.n = n
+        self.n_missing = n_missing
+        self.memory_size = memory_size
+        self.n_distinct = n_distinct
+        self.counts = counts
+        self.exact = exact
+        self.distinct = distinct
+
+        self.extremes: Optional[pd.Series] = None
+        self.quantiles: Optional[QuantileSketch] = None
+        self.moments: Optional[PowerSums] = None
+        self.histogram: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.min: Any = None
+        self.max: Any = None
+        self.n_zeros = 0
+        self.n_negative = 0
+        self.n_infinite = 0
+        self.monotonic = 0
+
+    def __repr__(self) -> str:
+        return f"PartialSummary(type={self.type!r}, n={self.n})"
+
+    def _replace(self, **changes: Any) -> "PartialSummary":
+        partial = copy(self)
+        partial.__dict__.update(changes)
+        return partial
+
+    @property
+    def count(self) -> int:
+        return self.n - self.n_missing
+
+    def merge(self, other: "PartialSummary") -> "PartialSummary":
+        """Merge the summary of the next partition of the column.
+
+        Raises:
+            ValueError: if the column has different types in both partitions.
+        """
+        totals = {
+            "n": self.n + other.n,
+            "n_missing": self.n_missing + other.n_missing,
+            "memory_size": self.memory_size + other.memory_size,
+        }
+        # Partitions without values have no type of their own.
+        if other.count == 0:
+            return self._replace(**totals)
+        if self.count == 0:
+            return other._replace(**totals)
+        if self.type != other.type:
+            raise ValueError(
+                f"Cannot merge partitions of types {self.type} and {other.type}"
+            )
+
+        merged = self._replace(
+            **totals,
+            n_distinct=max(self.n_distinct, other.n_distinct),
+            counts=_merge_counts(self.counts, other.counts),
+            exact=self.exact and other.exact,
+            distinct=self.distinct.merge(other.distinct),
+        )
+        if self.type not in ORDERED_TYPES:
+            return merged
+
+        merged.extremes = _merge_counts(self.extremes, other.extremes)
+        merged.quantiles = self.quantiles.merge(other.quantiles)
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        merged.monotonic = _merge_monotonic(self, other)
+        if self.moments is not None and other.moments is not None:
+            merged.moments = self.moments.merge(other.moments)
+        if (
+            self.histogram is not None
+            and other.histogram is not None
+            and np.array_equal(self.histogram[1], other.histogram[1])
+        ):
+            merged.histogram = (
+                self.histogram[0] + other.histogram[0],
+                self.histogram[1],
+            )
+        else:
+            merged.histogram = None
+        merged.n_zeros = self.n_zeros + other.n_zeros
+        merged.n_negative = self.n_negative + other.n_negative
+        merged.n_infinite = self.n_infinite + other.n_infinite
+        return merged
+
+
+def _merge_monotonic(left: PartialSummary, right: PartialSummary) -> int:
+    """The monotonicity of two consecutive partitions.
+
+    A monotonic increasing partition starts at its minimum and ends at its
+    maximum, so the partitions are increasing if both are and the maximum of the
+    first does not exceed the minimum of the second.
+    """
+    if left.monotonic > 0 and right.monotonic > 0 and left.max <= right.min:
+        strict = left.monotonic == right.monotonic == 2 and left.max < right.min
+        return 2 if strict else 1
+    if left.monotonic < 0 and right.monotonic < 0 and left.min >= right.max:
+        strict = left.monotonic == right.monotonic == -2 and left.min > right.max
+        return -2 if strict else -1
+    return 0
+
+
+def _column_name(series: Any) -> str:
+    """The name of a pandas series, or of the single column of a table."""
+    if isinstance(series, pd.Series):
+        return str(series.name)
+    return str(series.columns[0])
+
+
+def _ordered_values(summary: dict, counts: pd.Series) -> np.ndarray:
+    """The values of a numeric or date column, as floats (seconds for dates)."""
+    if summary["type"] == "DateTime":
+        values = pd.to_datetime(counts.index, errors="coerce")
+        return values.values.astype("datetime64[s]").astype(np.int64).astype(float)
+    return np.asarray(counts.index, dtype=float)
+
+
+@multimethod
+def partial_value_counts(config: Settings, series: Any, summary: dict) -> pd.Series:
+    """The most frequent values of a described column without missing values.
+
+    At least the `config.partial.top_k + 1` most frequent values are returned, if
+    there are as many, so the summary knows whether they are all its values.
+    """
+    return summary.get("value_counts_without_nan", pd.Series(dtype="int64"))
+
+
+@multimethod
+def partial_value_count_batches(
+    config: Settings, series: Any, summary: dict
+) -> Iterable[pd.Series]:
+    """The value counts of a described column without missing values, in batches
+    of distinct values.
+
+    The distinct count, quantile and moment sketches are built from these
+    batches. Backends that only keep the most frequent values in the description
+    stream all of them, instead of holding every count at once.
+    """
+    return [partial_value_counts(config, series, summary)]
+
+
+def _add_ordered(
+    config: Settings,
+    partial: PartialSummary,
+    summary: dict,
+    value_counts: pd.Series,
+    bin_edges: Optional[np.ndarray],
+) -> None:
+    """Add a batch of value counts to the sketches of an ordered column."""
+    settings = config.partial
+    if partial.type == "DateTime":
+        # Dates may also be strings, e.g. read from CSV.
+        value_counts = value_counts.set_axis(
+            pd.to_datetime(value_counts.index, errors="coerce")
+        )
+    extremes = _merge_counts(
+        partial.extremes, _extremes(value_counts, config.n_extreme_obs)
+    )
+    partial.extremes = _extremes(extremes, config.n_extreme_obs)
+
+    values = _ordered_values(summary, value_counts)
+    counts = value_counts.values.astype(float)
+    finite = np.isfinite(values)
+    quantiles = QuantileSketch(values[finite], counts[finite], settings.sketch_size)
+
+    if partial.type == "Numeric":
+        shift = quantiles.quantile(0.5)
+        moments = PowerSums.from_counts(
+            values[finite], counts[finite], 0.0 if np.isnan(shift) else shift
+        )
+        partial.moments = (
+            moments if partial.moments is None else partial.moments.merge(moments)
+        )
+
+    if bin_edges is not None:
+        histogram = np.histogram(
+            values[finite], bins=bin_edges, weights=counts[finite]
+        )[0]
+        if partial.histogram is not None:
+            histogram = histogram + partial.histogram[0]
+        partial.histogram = (histogram, bin_edges)
+
+    partial.quantiles = (
+        quantiles if partial.quantiles is None else partial.quantiles.merge(quantiles)
+    )
+
+
+def get_partial_summary(config: Settings, series: Any, summary: dict) -> PartialSummary:
+    """Summarize a described column of a partition in a mergeable way.
+
+    The summary is derived from the value counts of the column, so it does not
+    depend on the backend.
+
+    Args:
+        config: report Settings object
+        series: The described series.
+        summary: The description of the series.
+
+    Returns:
+        The mergeable summary.
+    """
+    settings = config.partial
+    value_counts = partial_value_counts(config, series, summary)
+    heavy_hitters = summary.get("heavy_hitters", False)
+
+    partial = PartialSummary(
+        type=summary["type"],
+        n=summary["n"],
+        n_missing=summary["n_missing"],
+        memory_size=summary["memory_size"],
+        n_distinct=summary.get("n_distinct", len(value_counts)),
+        counts=value_counts.nlargest(settings.top_k),
+        exact=not heavy_hitters and len(value_counts) <= settings.top_k,
+        distinct=HyperLogLog(settings.hll_precision),
+    )
+    ordered = partial.type in ORDERED_TYPES
+    bin_edges = settings.bin_edges.get(_column_name(series))
+    if ordered:
+        partial.extremes = pd.Series(dtype="int64")
+        partial.min = summary["min"]
+        partial.max = summary["max"]
+        partial.monotonic = summary.get("monotonic", 0)
+        if bin_edges is not None:
+            bin_edges = np.asarray(bin_edges, dtype=float)
+
+    # Only the most frequent values of heavy hitters were counted, pandas hashes
+    # every value instead.
+    hash_values = not (heavy_hitters and isinstance(series, pd.Series))
+    if not hash_values:
+        partial.distinct.add(_hash_values(series.dropna().unique(), partial.type))
+
+    for batch in partial_value_count_batches(config, series, summary):
+        if hash_values:
+            partial.distinct.add(_hash_values(batch.index.values, partial.type))
+        if ordered:
+            _add_ordered(config, partial, summary, batch, bin_edges)
+
+    if not ordered:
+        return partial
+
+    if partial.quantiles is None:
+        partial.quantiles = QuantileSketch(
+            np.empty(0), np.empty(0), settings.sketch_size
+        )
+    if partial.type == "Numeric":
+        if partial.moments is None:
+            partial.moments = PowerSums(0.0, 0.0, (0.0, 0.0, 0.0, 0.0))
+        partial.n_zeros = summary["n_zeros"]
+        partial.n_negative = summary["n_negative"]
+        partial.n_infinite = summary["n_infinite"]
+
+    return partial
+
+
+def _describe_ordered(config: Settings, partial: PartialSummary, summary: dict) -> None:
+    sketch = partial.quantiles
+    if partial.histogram is not None:
+        counts, edges = partial.histogram
+        summary["histogram"] = (counts.astype(np.int64), edges)
+    elif sketch is not None and len(sketch.values) > 0:
+        summary.update(
+            histogram_compute(
+                config, sketch.values, summary["n_distinct"], weights=sketch.weights
+            )
+        )
+    else:
+        summary["histogram"] = []
+
+    if config.vars.num.chi_squared_threshold > 0.0 and len(summary["histogram"]):
+        # The describers bin the values on their own for the test.
+        summary["chi_squared"] = chi_square(histogram=summary["histogram"][0])
+        mark_approximated(summary, "chi_squared")
+
+    summary["min"] = partial.min
+    summary["max"] = partial.max
+    summary["range"] = partial.max - partial.min
+    if partial.type == "DateTime":
+        return
+
+    count = summary["n"]
+    summary.update(partial.moments.stats())
+    if partial.n_infinite > 0:
+        # As the numeric describer, whose moments include the infinite values: the
+        # sum is infinite (NaN with both signs), the higher moments are NaN.
+        if partial.min == -np.inf:
+            total = np.nan if partial.max == np.inf else -np.inf
+        else:
+            total = np.inf
+        summary.update(
+            {
+                "sum": total,
+                "mean": total,
+                "std": np.nan,
+                "variance": np.nan,
+                "skewness": np.nan,
+                "kurtosis": np.nan,
+            }
+        )
+    summary.update({f"{q:.0%}": sketch.quantile(q) for q in config.vars.num.quantiles})
+    if "25%" in summary and "75%" in summary:
+        summary["iqr"] = summary["75%"] - summary["25%"]
+    median = sketch.quantile(0.5)
+    summary["mad"] = sketch.absolute_deviation(median).quantile(0.5)
+    summary["cv"] = summary["std"] / summary["mean"] if summary["mean"] else np.nan
+
+    summary["n_zeros"] = partial.n_zeros
+    summary["p_zeros"] = partial.n_zeros / count
+    summary["n_negative"] = partial.n_negative
+    summary["p_negative"] = partial.n_negative / count
+    summary["n_infinite"] = partial.n_infinite
+    summary["p_infinite"] = partial.n_infinite / count
+
+    summary["monotonic"] = partial.monotonic
+    summary["monotonic_increase"] = partial.monotonic > 0
+    summary["monotonic_decrease"] = partial.monotonic < 0
+    summary["monotonic_increase_strict"] = partial.monotonic == 2
+    summary["monotonic_decrease_strict"] = partial.monotonic == -2
+
+    if len(sketch.values) == sketch.size:
+        mark_approximated(summary, *(f"{q:.0%}" for q in config.vars.num.quantiles))
+        mark_approximated(summary, "iqr", "mad")
+
+
+def describe_partial(config: Settings, partial: PartialSummary, summary: dict) -> dict:
+    """Describe a column from the merged summary of its partitions.
+
+    Statistics that cannot be merged exactly (e.g. the distinct count of columns
+    with more than `config.partial.top_k` distinct values in a partition, or the
+    quantiles once the sketch is compressed) are estimated and marked as
+    approximated.
+
+    Args:
+        config: report Settings object
+        partial: The merged summary of the column.
+        summary: The description of the column in one of the partitions, for the
+            statistics that are not merged.
+
+    Returns:
+        The description of the column.
+    """
+    summary = {
+        **{
+            k: v
+            for k, v in summary.items()
+            if k not in ("heavy_hitters", "approximated")
+        },
+        "type": partial.type,
+        "partial": partial,
+    }
+
+    count = partial.count
+    value_counts = partial.counts.sort_values(ascending=False, kind="stable")
+    if partial.exact:
+        n_distinct = len(value_counts)
+        n_unique = int((value_counts == 1).sum())
+    else:
+        n_distinct = max(partial.distinct.estimate(), partial.n_distinct)
+        # A lower bound: the values that are not unique occur at least twice, so
+        # count >= n_unique + 2 * (n_distinct - n_unique).
+        n_unique = max(0, 2 * n_distinct - count)
+        mark_approximated(summary, "n_distinct", "p_distinct", "n_unique", "p_unique")
+
+    summary.update(
+        {
+            "n": partial.n,
+            "count": count,
+            "n_missing": partial.n_missing,
+            "p_missing": partial.n_missing / partial.n if partial.n > 0 else 0,
+            "memory_size": partial.memory_size,
+            "n_distinct": n_distinct,
+            "p_distinct": n_distinct / count if count > 0 else 0,
+            "is_unique": n_unique == count and count > 0,
+            "n_unique": n_unique,
+            "p_unique": n_unique / count if count > 0 else 0,
+            "value_counts_without_nan": value_counts,
+        }
+    )
+
+    if partial.type in ORDERED_TYPES:
+        summary["value_counts_index_sorted"] = partial.extremes.sort_index()
+        if count > 0:
+            _describe_ordered(config, partial, summary)
+    else:
+        try:
+            summary["value_counts_index_sorted"] = value_counts.sort_index()
+        except TypeError:
+            summary["value_counts_index_sorted"] = value_counts
+
+    describe_1d = VALUE_COUNT_TYPES.get(partial.type)
+    if describe_1d is not None and count > 0:
+        # The describers only use the series for the first rows, which are those
+        # of the first partition.
+        first_rows = summary.get("first_rows")
+        series = pd.Series(value_counts.index.values, dtype=object)
+        _, _, summary = describe_1d(config, series, summary)
+        if first_rows is not None:
+            summary["first_rows"] = first_rows
+        if not partial.exact:
+            mark_approximated(summary, "imbalance")
+
+    return summary
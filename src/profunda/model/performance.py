@@ -0,0 +1,78 @@
+"""Wall time, CPU time and memory use of the stages of a profiling run."""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from profunda.model.context import get_context
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore
+
+
+def _peak_rss() -> Optional[int]:
+    """The peak resident set size of the process in bytes, if available."""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@contextmanager
+def measure(
+    records: List[Dict[str, Any]],
+    stage: str,
+    column: Optional[str] = None,
+    rows: Optional[int] = None,
+) -> Iterator[None]:
+    """Measure the block and append its metrics to the records.
+
+    The metrics are the wall time and CPU time in seconds, and the growth of the
+    peak resident set size in bytes (None where it is not available). The CPU time
+    and memory are those of the whole process, and include any other stages that
+    run concurrently.
+
+    Args:
+        records: The list to append the metrics to.
+        stage: The name of the stage.
+        column: The column the stage is about, if any.
+        rows: The number of rows processed, if known.
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    rss_start = _peak_rss()
+
+    yield
+
+    rss_end = _peak_rss()
+    records.append(
+        {
+            "stage": stage,
+            "column": column,
+            "wall_time": time.perf_counter() - wall_start,
+            "cpu_time": time.process_time() - cpu_start,
+            "peak_rss_delta": (
+                None if rss_start is None or rss_end is None else rss_end - rss_start
+            ),
+            "rows": rows,
+        }
+    )
+
+
+def measure_stage(
+    stage: str, column: Optional[str] = None, rows: Optional[int] = None
+) -> ContextManager[None]:
+    """Measure a stage of the active profiling run, see `measure`.
+
+    The number of rows defaults to the number of rows of the profiled table, when
+    it is known upfront (pandas).
+    """
+    context = get_context()
+    if rows is None:
+        rows = context.n_rows
+    return measure(context.performance, stage, column=column, rows=rows)
@@ -0,0 +1,149 @@
+"""Run the stages of a profiling run concurrently, respecting their dependencies."""
+
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Set, Tuple
+
+from multimethod import multimethod
+
+from profunda.config import Settings
+
+
+class _Task(NamedTuple):
+    fn: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...]
+    exclusive: bool
+
+
+class TaskGraph:
+    """A graph of the stages of `describe` and the stages they depend on.
+
+    Each task receives the results of the tasks it depends on, by name. Tasks that
+    do not depend on each other run concurrently on a thread pool, and exclusive
+    tasks (e.g. plotting with matplotlib, which is not thread-safe) never run at the
+    same time as another exclusive task.
+
+    Example:
+        >>> graph = TaskGraph()
+        >>> graph.add("table", lambda _: get_table_stats(config, df, variables))
+        >>> graph.add("alerts", lambda r: get_alerts(r["table"]), ["table"])
+        >>> results = graph.run(pool_size=4)
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, _Task] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[[Dict[str, Any]], Any],
+        depends_on: Sequence[str] = (),
+        exclusive: bool = False,
+    ) -> None:
+        """Add a task to the graph.
+
+        Args:
+            name: The name of the task, unique within the graph.
+            fn: Computes the result of the task from the results of its dependencies.
+            depends_on: The names of the tasks it depends on, added before.
+            exclusive: Whether the task must not run at the same time as another
+                exclusive task.
+
+        Raises:
+            ValueError: if the name is taken, or a dependency is unknown.
+        """
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already defined")
+
+        unknown = [dependency for dependency in depends_on if dependency not in self]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown tasks {unknown}")
+
+        self._tasks[name] = _Task(fn, tuple(depends_on), exclusive)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tasks
+
+    def _call(self, name: str, results: Dict[str, Any]) -> Any:
+        task = self._tasks[name]
+        return task.fn(
+            {dependency: results[dependency] for dependency in task.depends_on}
+        )
+
+    def run(self, pool_size: int) -> Dict[str, Any]:
+        """Run the tasks with at most `pool_size` workers.
+
+        With a single worker, the tasks run one after the other in the calling
+        thread, in the order they were added. Otherwise, each task starts as soon as
+        its dependencies are done. The first error raised by a task cancels the
+        tasks that have not started yet, and is raised again.
+
+        Args:
+            pool_size: The maximum number of tasks running at the same time.
+
+        Returns:
+            The result of each task, in the order the tasks were added.
+        """
+        results: Dict[str, Any] = {}
+
+        if pool_size <= 1:
+            for name in self._tasks:
+                results[name] = self._call(name, results)
+            return results
+
+        lock = threading.Lock()
+
+        def run_task(name: str, dependencies: Dict[str, Any]) -> Any:
+            if not self._tasks[name].exclusive:
+                return self._call(name, dependencies)
+            with lock:
+                return self._call(name, dependencies)
+
+        pending = dict(self._tasks)
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            while pending or running:
+                ready = [
+                    name
+                    for name, task in pending.items()
+                    if all(dependency in results for dependency in task.depends_on)
+                ]
+                for name in ready:
+                    del pending[name]
+                    # Run each task in a copy of the context, to share the profiling
+                    # context of the run with the workers.
+                    future = executor.submit(
+                        copy_context().run, run_task, name, dict(results)
+                    )
+                    running[future] = name
+
+                done: Set[Future]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException:
+                        for other in running:
+                            other.cancel()
+                        raise
+
+        return {name: results[name] for name in self._tasks}
+
+
+def get_pool_size(config: Settings) -> int:
+    """The number of workers of the thread pools, `config.pool_size` or the number
+    of CPUs if it is not positive."""
+    return config.pool_size if config.pool_size > 0 else multiprocessing.cpu_count()
+
+
+@multimethod
+def get_stage_frames(config: Settings, df: Any) -> Tuple[int, Callable[[], Any]]:
+    """The number of workers to run the stages of `describe` with, and a getter of
+    the DataFrame that is safe to use from the calling worker.
+
+    Backends run the stages one after the other by default.
+    """
+    return 1, lambda: df
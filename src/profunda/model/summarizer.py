@@ -1,7 +1,7 @@
 # mypy: ignore-errors
 
 from dataclasses import asdict
-from typing import Any, Callable, Dict, List, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -25,6 +25,7 @@ from profunda.model.pandas import (
     pandas_describe_url_1d,
 )
 from profunda.model.pandas.describe_supported_pandas import pandas_describe_supported
+from profunda.model.partial import get_partial_summary
 from profunda.model.summary_algorithms import (  # Check what is this method used for
     describe_file_1d,
     describe_image_1d,
@@ -42,10 +43,20 @@ class BaseSummarizer(Handler):
     """
 
     def summarize(
-        self, config: Settings, series: pd.Series, dtype: Type[VisionsBaseType]
+        self,
+        config: Settings,
+        series: pd.Series,
+        dtype: Type[VisionsBaseType],
+        summary: Optional[dict] = None,
     ) -> dict:
-        """Generates the summary for a given series"""
-        return self.handle(str(dtype), config, series, {"type": str(dtype)})
+        """Generates the summary for a given series, optionally seeded with
+        precomputed statistics"""
+        summary = self.handle(
+            str(dtype), config, series, {**(summary or {}), "type": str(dtype)}
+        )
+        if config.partial.enabled:
+            summary["partial"] = get_partial_summary(config, series, summary)
+        return summary
 
 
 # Revisit this with the correct support for Spark as well.
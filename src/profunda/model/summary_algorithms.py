@@ -1,5 +1,5 @@
 import functools
-from typing import Any, Callable, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Optional, Sequence, Tuple, TypeVar, Union
 
 import numpy as np
 import pandas as pd
@@ -109,6 +109,83 @@ def histogram_compute(
     return stats
 
 
+def _zero_out_fperr(value: float) -> float:
+    """Zero out values that are within floating point error of zero (as pandas)."""
+    return 0.0 if np.abs(value) < 1e-14 else value
+
+
+def central_moments(
+    count: int,
+    power_sums: Sequence[float],
+    shift: float = 0.0,
+) -> Tuple[float, float, float, float]:
+    """Recombine shifted power sums into the mean and the central moment sums.
+
+    The power sums are expected to be `sum((x - shift) ** k)` for k = 1..4. Shifting
+    by a value close to the center of the data (e.g. the median) before summing
+    avoids the catastrophic cancellation of recombining raw power sums.
+
+    Args:
+        count: The number of values summed.
+        power_sums: The four shifted power sums s1, s2, s3 and s4.
+        shift: The value subtracted from each value before summing.
+
+    Returns:
+        A tuple with the mean and the sums of the 2nd, 3rd and 4th central powers.
+    """
+    if count == 0:
+        return np.nan, np.nan, np.nan, np.nan
+
+    s1, s2, s3, s4 = (float(s) for s in power_sums)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        delta = s1 / count
+        m2 = s2 - count * delta**2
+        m3 = s3 - 3 * delta * s2 + 2 * count * delta**3
+        m4 = s4 - 4 * delta * s3 + 6 * delta**2 * s2 - 3 * count * delta**4
+
+    # Cancellation can leave tiny negative values for (near-)constant data.
+    m2 = max(m2, 0.0) if not np.isnan(m2) else m2
+    m4 = max(m4, 0.0) if not np.isnan(m4) else m4
+
+    return shift + delta, m2, m3, m4
+
+
+def skewness_from_moments(count: int, m2: float, m3: float) -> float:
+    """Unbiased skewness from central moment sums, following pandas `nanskew`."""
+    if count < 3:
+        return np.nan
+
+    m2 = _zero_out_fperr(m2)
+    m3 = _zero_out_fperr(m3)
+
+    if m2 == 0:
+        return 0.0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2**1.5)
+
+
+def kurtosis_from_moments(count: int, m2: float, m4: float) -> float:
+    """Unbiased Fisher kurtosis from central moment sums, following pandas `nankurt`."""
+    if count < 4:
+        return np.nan
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+        numerator = count * (count + 1) * (count - 1) * m4
+        denominator = (count - 2) * (count - 3) * m2**2
+
+    numerator = _zero_out_fperr(numerator)
+    denominator = _zero_out_fperr(denominator)
+
+    if denominator == 0:
+        return 0.0
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return numerator / denominator - adj
+
+
 def chi_square(
     values: Optional[np.ndarray] = None,
     histogram: Optional[np.ndarray] = None,
@@ -174,6 +251,49 @@ def series_handle_nulls(
     return inner
 
 
+# Types whose high-cardinality columns only count their most frequent values.
+HEAVY_HITTERS_TYPES = ("Categorical", "Text")
+
+
+def mark_approximated(summary: dict, *keys: str) -> None:
+    """Record that statistics in the summary are estimates."""
+    summary["approximated"] = sorted({*summary.get("approximated", []), *keys})
+
+
+def estimate_distinct_counts(
+    value_counts: pd.Series, n_distinct: int, count: int
+) -> Tuple[int, int]:
+    """Estimate the distinct and unique counts from the most frequent values.
+
+    Args:
+        value_counts: The counts of the most frequent values, sorted from the most
+            frequent down, e.g. a prefix of `value_counts_without_nan`.
+        n_distinct: The estimated number of distinct values, e.g. from a sketch.
+        count: The number of values.
+
+    Returns:
+        The number of distinct values, consistent with the counted values, and the
+        number of values occurring once. The latter is exact when the counts cover
+        all the values, or when their least frequent value occurs once (then so
+        does every value beyond them). Otherwise the values beyond the counted ones
+        are assumed to occur at most twice: this lower bound is exact for most
+        high-cardinality columns, and underestimates the others.
+    """
+    n_distinct = min(int(n_distinct), count)
+    unique_count = int((value_counts == 1).sum())
+    rest = count - int(value_counts.sum())
+    if rest > 0:
+        if len(value_counts) > 0 and value_counts.iloc[-1] == 1:
+            unique_count += rest
+        else:
+            rest_distinct = min(max(n_distinct - len(value_counts), 1), rest)
+            unique_count += max(0, 2 * rest_distinct - rest)
+
+    # Every counted value occurring more than once is distinct from the others.
+    n_distinct = max(n_distinct, unique_count + int((value_counts > 1).sum()))
+    return n_distinct, unique_count
+
+
 def named_aggregate_summary(series: pd.Series, key: str) -> dict:
     summary = {
         f"max_{key}": np.max(series),
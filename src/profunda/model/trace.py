@@ -0,0 +1,113 @@
+"""Instrumentation of the queries issued by a profiling run."""
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+from multimethod import multimethod
+
+_labels: ContextVar[Dict[str, Optional[str]]] = ContextVar("query_labels", default={})
+
+
+@contextmanager
+def query_labels(**labels: Optional[str]) -> Iterator[None]:
+    """Attribute the queries issued within the block to a stage and/or column.
+
+    Example:
+        >>> with query_labels(stage="Describe variables", column="age"):
+        ...     execute_traced(table.count())
+    """
+    token = _labels.set({**_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+class QueryTrace:
+    """Records the queries issued during a profiling run.
+
+    Every query is recorded with the stage and column it was issued for (see
+    `query_labels`), its SQL, its wall time and the number of rows it returned. The
+    records are exposed as `BaseDescription.queries`, and can be exported as a
+    Chrome trace with `to_chrome_trace`.
+    """
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self._records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, start: float, end: float, rows: int) -> None:
+        """Record a query.
+
+        Args:
+            sql: The SQL of the query.
+            start: The start of the query, from `time.perf_counter`.
+            end: The end of the query, from `time.perf_counter`.
+            rows: The number of rows returned.
+        """
+        labels = _labels.get()
+        record = {
+            "stage": labels.get("stage"),
+            "column": labels.get("column"),
+            "sql": sql,
+            "start": start - self.start,
+            "duration": end - start,
+            "rows": rows,
+            "thread": threading.get_ident(),
+        }
+        with self._lock:
+            self._records.append(record)
+
+    @property
+    def records(self) -> List[Dict[str, Any]]:
+        """The recorded queries, in order of completion."""
+        with self._lock:
+            return list(self._records)
+
+
+def to_chrome_trace(queries: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert recorded queries to the Chrome trace event format.
+
+    The result can be loaded in `chrome://tracing` or Perfetto. Each thread that
+    issued queries is a track, which shows the fan-out of concurrent queries.
+
+    Args:
+        queries: The recorded queries, see `BaseDescription.queries`.
+
+    Returns:
+        The trace, as a JSON-serializable dict.
+    """
+    threads = {thread: i for i, thread in enumerate({q["thread"] for q in queries})}
+
+    events = [
+        {
+            "name": query["column"] or query["stage"] or "query",
+            "cat": query["stage"] or "query",
+            "ph": "X",
+            "ts": query["start"] * 1e6,
+            "dur": query["duration"] * 1e6,
+            "pid": 0,
+            "tid": threads[query["thread"]],
+            "args": {
+                "stage": query["stage"],
+                "column": query["column"],
+                "rows": query["rows"],
+                "sql": query["sql"],
+            },
+        }
+        for query in queries
+    ]
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+@multimethod
+def trace_queries(df: Any, trace: Optional[QueryTrace]) -> ContextManager:
+    """Record the queries issued on the backend of `df` within the block.
+
+    Backends without queries to record do nothing.
+    """
+    return nullcontext()
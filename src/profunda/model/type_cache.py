@@ -0,0 +1,120 @@
+"""A persistent cache of the types inferred for the columns of datasets."""
+
+import functools
+import json
+import sqlite3
+import threading
+import time
+import warnings
+from contextlib import closing
+from pathlib import Path
+from typing import List, Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "profunda"
+
+
+class TypeCache:
+    """An on-disk cache of inferred types, with least-recently-used eviction.
+
+    The inference path of a column (the names of the types from the root of the
+    typeset to the inferred type) is stored under a key that fingerprints the
+    column, in an SQLite database shared by the processes using the same
+    directory. When there are more than `max_entries` entries, the least recently
+    used ones are evicted.
+
+    The cache never fails a profiling run: if the database cannot be used, a
+    warning is issued and the cache behaves as if it were empty.
+
+    Example:
+        >>> cache = TypeCache(Path("~/.cache/profunda"), max_entries=10_000)
+        >>> path = cache.get(key)
+        >>> ...
+        >>> cache.put(key, ["Unsupported", "Text", "Numeric"])
+    """
+
+    def __init__(self, directory: Path, max_entries: int):
+        self.path = Path(directory).expanduser() / "types.sqlite"
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS types "
+            "(key TEXT PRIMARY KEY, path TEXT NOT NULL, used INTEGER NOT NULL)"
+        )
+        return connection
+
+    def _warn(self, error: Exception) -> None:
+        if not self._failed:
+            self._failed = True
+            warnings.warn(f"The type inference cache {self.path} is unusable: {error}")
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """The inference path stored under a key, or None if there is none."""
+        with self._lock:
+            try:
+                with closing(self._connect()) as connection, connection:
+                    row = connection.execute(
+                        "SELECT path FROM types WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None:
+                        connection.execute(
+                            "UPDATE types SET used = ? WHERE key = ?",
+                            (time.time_ns(), key),
+                        )
+            except (sqlite3.Error, OSError) as error:
+                self._warn(error)
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, path: List[str]) -> None:
+        """Store the inference path of a key, evicting the least recently used
+        entries beyond `max_entries`."""
+        with self._lock:
+            try:
+                with closing(self._connect()) as connection, connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO types VALUES (?, ?, ?)",
+                        (key, json.dumps(path), time.time_ns()),
+                    )
+                    connection.execute(
+                        "DELETE FROM types WHERE key IN (SELECT key FROM types "
+                        "ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+            except (sqlite3.Error, OSError) as error:
+                self._warn(error)
+
+    def __len__(self) -> int:
+        with self._lock:
+            try:
+                with closing(self._connect()) as connection, connection:
+                    (count,) = connection.execute(
+                        "SELECT COUNT(*) FROM types"
+                    ).fetchone()
+            except (sqlite3.Error, OSError) as error:
+                self._warn(error)
+                return 0
+            return count
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_cache(directory: Optional[str], max_entries: int) -> TypeCache:
+    """The type cache of a directory (`~/.cache/profunda` by default), shared by
+    the profiling runs of the process."""
+    return TypeCache(
+        DEFAULT_CACHE_DIR if directory is None else Path(directory), max_entries
+    )
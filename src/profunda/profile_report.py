@@ -1,14 +1,16 @@
 import copy
+import hashlib
 import json
 import warnings
 from dataclasses import asdict, is_dataclass
 from importlib.metadata import version
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, ContextManager, Dict, List, Optional, Union
 
 import ibis
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from tqdm.auto import tqdm
 from typeguard import typechecked
 from visions import VisionsTypeset
@@ -19,6 +21,9 @@ from profunda.model import BaseDescription
 from profunda.model.alerts import AlertType
 from profunda.model.dataframe import ibisDataFrame
 from profunda.model.describe import describe as describe_df
+from profunda.model.ibis.arrow_ibis import to_memtable
+from profunda.model.ibis.file_ibis import read_file
+from profunda.model.performance import measure
 from profunda.model.sample import Sample
 from profunda.model.summarizer import (
     BaseSummarizer,
@@ -26,12 +31,18 @@ from profunda.model.summarizer import (
     format_summary,
     redact_summary,
 )
+from profunda.model.trace import to_chrome_trace
 from profunda.model.typeset import ProfilingTypeSet
 from profunda.report import get_report_structure
 from profunda.report.presentation.core import Root
 from profunda.report.presentation.flavours.html.templates import create_html_assets
 from profunda.serialize_report import SerializeReport
-from profunda.utils.dataframe import hash_dataframe
+from profunda.utils.dataframe import (
+    HASH_PREFIX,
+    hash_dataframe,
+    read_pandas,
+    read_pandas_chunks,
+)
 from profunda.utils.logger import ProfilingLogger
 from profunda.utils.paths import get_config
 
@@ -54,7 +65,7 @@ class ProfileReport(SerializeReport, ExpectationsReport):
 
     def __init__(
         self,
-        df: Optional[Union[pd.DataFrame, ibisDataFrame]] = None,
+        df: Optional[Union[pd.DataFrame, ibisDataFrame, pa.Table]] = None,
         minimal: bool = False,
         tsmode: bool = False,
         sortby: Optional[str] = None,
@@ -78,7 +89,7 @@ class ProfileReport(SerializeReport, ExpectationsReport):
         - custom settings **kwargs (e.g. `title`)
 
         Args:
-            df: a pandas DataFrame or ibis Table
+            df: a pandas DataFrame, ibis Table or Arrow table
             minimal: minimal mode is a default configuration with minimal computation
             ts_mode: activates time-series analysis for all the numerical variables from the dataset.
             Only available for pd.DataFrame
@@ -92,13 +103,66 @@ class ProfileReport(SerializeReport, ExpectationsReport):
             type_schema: optional dict containing pairs of `column name`: `type`
             **kwargs: other arguments, for valid arguments, check the default configuration file.
         """
-        if isinstance(df, pd.DataFrame):
-            df = ibis.memtable(df)
+        if isinstance(df, pa.Table):
+            df = to_memtable(df)
 
         self.__validate_inputs(df, minimal, tsmode, config_file, lazy)
 
+        def build_config(default: Settings) -> Settings:
+            # Merging the settings updates the arguments in place.
+            return self.__build_config(
+                default,
+                config_file,
+                minimal,
+                config,
+                explorative,
+                sensitive,
+                copy.deepcopy(kwargs),
+            )
+
+        if isinstance(df, ibisDataFrame):
+            report_config = build_config(IbisSettings())
+        else:
+            report_config = build_config(Settings())
+            if isinstance(df, pd.DataFrame):
+                # Large DataFrames are profiled with DuckDB, which holds less in
+                # memory, with its own defaults. The features only pandas
+                # supports keep them on pandas if the caller enabled them, i.e.
+                # they are enabled over the Ibis defaults.
+                ibis_config = build_config(IbisSettings())
+                if self.__use_ibis(ibis_config, df, tsmode, type_schema, typeset):
+                    df = to_memtable(df)
+                    report_config = ibis_config
+
         self._df_type = type(df)
 
+        report_config.vars.timeseries.active = tsmode
+        if tsmode and sortby:
+            report_config.vars.timeseries.sortby = sortby
+
+        self.df = self.__initialize_dataframe(df, report_config)  # type: ignore
+        self.config = report_config
+        self._df_hash = None
+        self._sample = sample
+        self._type_schema = type_schema
+        self._typeset = typeset
+        self._summarizer = summarizer
+        self._render_performance: List[Dict[str, Any]] = []
+
+        if not lazy:
+            # Trigger building the report structure
+            _ = self.report
+
+    @staticmethod
+    def __build_config(
+        default: Settings,
+        config_file: Optional[Union[Path, str]],
+        minimal: bool,
+        config: Optional[Settings],
+        explorative: bool,
+        sensitive: bool,
+        kwargs: dict,
+    ) -> Settings:
         if config_file or minimal:
             if not config_file:
                 config_file = get_config("config_minimal.yaml")
@@ -107,12 +171,7 @@ class ProfileReport(SerializeReport, ExpectationsReport):
         elif config is not None:
             report_config = config
         else:
-            if isinstance(df, pd.DataFrame):
-                report_config = Settings()
-            elif isinstance(df, ibisDataFrame):
-                report_config = IbisSettings()
-            else:
-                raise NotImplementedError(f"Unsupported dataframe type: {type(df)}")
+            report_config = default
 
         groups = [
             (explorative, "explorative"),
@@ -135,21 +194,39 @@ class ProfileReport(SerializeReport, ExpectationsReport):
         if kwargs:
             report_config = report_config.update(kwargs)
 
-        report_config.vars.timeseries.active = tsmode
-        if tsmode and sortby:
-            report_config.vars.timeseries.sortby = sortby
+        return report_config
 
-        self.df = self.__initialize_dataframe(df, report_config)  # type: ignore
-        self.config = report_config
-        self._df_hash = None
-        self._sample = sample
-        self._type_schema = type_schema
-        self._typeset = typeset
-        self._summarizer = summarizer
+    @staticmethod
+    def __use_ibis(
+        report_config: Settings,
+        df: pd.DataFrame,
+        tsmode: bool,
+        type_schema: Optional[dict],
+        typeset: Optional[VisionsTypeset],
+    ) -> bool:
+        """Whether to profile a pandas DataFrame with DuckDB, see `config.backend`."""
+        engine = report_config.backend.engine
+        if engine not in ("auto", "pandas", "ibis"):
+            raise ValueError(
+                f"Unknown backend engine '{engine}', use 'auto', 'pandas' or 'ibis'."
+            )
 
-        if not lazy:
-            # Trigger building the report structure
-            _ = self.report
+        if engine == "ibis" and tsmode:
+            raise NotImplementedError(
+                "Time-Series dataset analysis is not yet supported for Ibis Tables"
+            )
+        if engine != "auto":
+            return engine == "ibis"
+
+        requires_pandas = (
+            tsmode
+            or report_config.infer_dtypes
+            or report_config.vars.text.characters
+            or report_config.vars.text.words
+            or bool(type_schema)
+            or typeset is not None
+        )
+        return not requires_pandas and df.size > report_config.backend.max_pandas_cells
 
     @staticmethod
     def __validate_inputs(
@@ -179,9 +256,10 @@ class ProfileReport(SerializeReport, ExpectationsReport):
                     "Time-Series dataset analysis is not yet supported for Ibis Tables"
                 )
 
-            if df is not None and df.count().execute() == 0:  # type: ignore
+            # Fetch a single row, counting all rows is left to the profiling run.
+            if df is not None and df.limit(1).count().execute() == 0:  # type: ignore
                 raise ValueError("Table is empty. Please provide a non-empty Table.")
-        else:
+        elif df is not None:
             raise NotImplementedError(f"Unsupported dataframe type: {type(df)}")
 
     @staticmethod
@@ -270,15 +348,41 @@ class ProfileReport(SerializeReport, ExpectationsReport):
     @property
     def df_hash(self) -> Optional[str]:
         if self._df_hash is None and self.df is not None:
-            self._df_hash = hash_dataframe(self.df)
+            if not isinstance(self.df, ibisDataFrame):
+                self._df_hash = hash_dataframe(self.df)
+            elif isinstance(self.df.op(), ibis.expr.operations.InMemoryTable):
+                self._df_hash = hash_dataframe(self.df.op().data.to_frame())
+            else:
+                # Backend tables are identified by their query, to not fetch them.
+                digest = hashlib.sha256(ibis.to_sql(self.df).encode("utf-8"))
+                self._df_hash = f"{HASH_PREFIX}{digest.hexdigest()}"
         return self._df_hash
 
     @property
     def report(self) -> Root:
         if self._report is None:
-            self._report = get_report_structure(self.config, self.description_set)
+            description = self.description_set
+            with self._measure_render("Generate report structure"):
+                self._report = get_report_structure(self.config, description)
         return self._report
 
+    @property
+    def render_performance(self) -> List[Dict[str, Any]]:
+        """The metrics of generating and rendering the report, see `measure`.
+
+        They are kept apart from the metrics of the profiling run in
+        `BaseDescription.performance`, so the exports of the description do not
+        depend on which exports came before. Rendering a stage again replaces its
+        metrics.
+        """
+        return list(self._render_performance)
+
+    def _measure_render(self, stage: str) -> ContextManager[None]:
+        self._render_performance = [
+            record for record in self._render_performance if record["stage"] != stage
+        ]
+        return measure(self._render_performance, stage)
+
     @property
     def html(self) -> str:
         if self._html is None:
@@ -401,9 +505,12 @@ class ProfileReport(SerializeReport, ExpectationsReport):
 
         report = self.report
 
-        with tqdm(
-            total=1, desc="Render HTML", disable=not self.config.progress_bar
-        ) as pbar:
+        with (
+            self._measure_render("Render HTML"),
+            tqdm(
+                total=1, desc="Render HTML", disable=not self.config.progress_bar
+            ) as pbar,
+        ):
             html = HTMLReport(copy.deepcopy(report)).render(
                 nav=self.config.html.navbar_show,
                 offline=self.config.html.use_local_assets,
@@ -429,12 +536,15 @@ class ProfileReport(SerializeReport, ExpectationsReport):
 
         report = self.report
 
-        with tqdm(
-            total=1,
-            desc="Render widgets",
-            disable=not self.config.progress_bar,
-            leave=False,
-        ) as pbar:
+        with (
+            self._measure_render("Render widgets"),
+            tqdm(
+                total=1,
+                desc="Render widgets",
+                disable=not self.config.progress_bar,
+                leave=False,
+            ) as pbar,
+        ):
             widgets = WidgetReport(copy.deepcopy(report)).render()
             pbar.update()
         return widgets
@@ -467,9 +577,12 @@ class ProfileReport(SerializeReport, ExpectationsReport):
 
         description = self.description_set
 
-        with tqdm(
-            total=1, desc="Render JSON", disable=not self.config.progress_bar
-        ) as pbar:
+        with (
+            self._measure_render("Render JSON"),
+            tqdm(
+                total=1, desc="Render JSON", disable=not self.config.progress_bar
+            ) as pbar,
+        ):
             description_dict = format_summary(description)
             description_dict = encode_it(description_dict)
             description_dict = redact_summary(description_dict, self.config)
@@ -497,6 +610,28 @@ class ProfileReport(SerializeReport, ExpectationsReport):
 
         return self.json
 
+    def to_chrome_trace(self, output_file: Optional[Union[str, Path]] = None) -> str:
+        """Export the queries of the profiling run in the Chrome trace event format.
+
+        The queries are only recorded if `config.ibis.trace` is set. Load the trace
+        in `chrome://tracing` or https://ui.perfetto.dev to inspect them.
+
+        Args:
+            output_file: Optional path of the JSON file to write the trace to.
+
+        Returns:
+            The trace as a JSON string.
+        """
+        if not self.config.ibis.trace:
+            warnings.warn(
+                "No queries are recorded. Set config.ibis.trace to True to record them."
+            )
+
+        data = json.dumps(to_chrome_trace(self.description_set.queries))
+        if output_file is not None:
+            Path(output_file).write_text(data, encoding="utf-8")
+        return data
+
     def to_notebook_iframe(self) -> None:
         """Used to output the HTML representation to a Jupyter notebook.
         When config.notebook.iframe.attribute is "src", this function creates a temporary HTML file
@@ -542,6 +677,127 @@ class ProfileReport(SerializeReport, ExpectationsReport):
         """Override so that Jupyter Notebook does not print the object."""
         return ""
 
+    @classmethod
+    def from_file(cls, path: Union[Path, str], **kwargs) -> "ProfileReport":
+        """Profile a parquet, CSV, TSV or JSON file scanned directly by DuckDB.
+
+        The file is not loaded in pandas: it is opened as an Ibis table, and each
+        query reads only the columns it needs. The row count, null counts and
+        extremes stored in the metadata of parquet files are used instead of
+        reading the data (see `profunda.model.ibis.file_ibis.read_file`).
+
+        Args:
+            path: the file to profile
+            **kwargs: the arguments of the ProfileReport, see `__init__`
+
+        Returns:
+            The ProfileReport of the file.
+
+        Raises:
+            ValueError: if the file type cannot be scanned by DuckDB.
+        """
+        return cls(read_file(Path(path)), **kwargs)
+
+    @classmethod
+    def from_path(
+        cls, path: Union[Path, str], chunksize: Optional[int] = None, **kwargs
+    ) -> "ProfileReport":
+        """Profile a file, based on its extension (see `read_pandas`).
+
+        With `chunksize`, the file is read in chunks of at most `chunksize` rows,
+        which are profiled one after the other and merged with `update`, so the
+        peak memory is bounded by the size of a chunk instead of the size of the
+        file. The correlations, interactions and missing value diagrams require
+        the whole dataset and are left out of the report of a chunked file.
+
+        Args:
+            path: the file to profile
+            chunksize: the maximum number of rows read at once, the whole file is
+                read at once if None
+            **kwargs: the arguments of the ProfileReport, see `__init__`
+
+        Returns:
+            The ProfileReport of the file.
+        """
+        path = Path(path)
+        if chunksize is None:
+            return cls(read_pandas(path), **kwargs)
+
+        # The mergeable summaries are enabled before the first chunk is described
+        # (e.g. with `lazy=False`). As an argument, they are merged into new
+        # settings, instead of modifying those of the caller.
+        kwargs["partial"] = {**kwargs.get("partial", {}), "enabled": True}
+
+        report = None
+        for chunk in read_pandas_chunks(path, chunksize):
+            if report is None:
+                report = cls(chunk, **kwargs)
+            else:
+                report = report.update(chunk)
+
+        if report is None:
+            # A file without rows has no chunk.
+            return cls(read_pandas(path), **kwargs)
+        return report
+
+    def update(self, df: Union[pd.DataFrame, ibisDataFrame]) -> "ProfileReport":
+        """Update the report with the rows appended to the profiled table.
+
+        Only the new rows are profiled. Their summaries are merged with the
+        mergeable state kept in the description of this report, which is persisted
+        with `dump`, so the history is not scanned again:
+        ```
+        report = ProfileReport(df, partial={"enabled": True})
+        report.dump("report.pp")
+        ...
+        report = ProfileReport().load("report.pp").update(new_rows)
+        report.dump("report.pp")
+        ```
+        See `profunda.merge_reports.append_description` for details.
+
+        Args:
+            df: the rows appended to the table since the last update
+
+        Returns:
+            The ProfileReport of the whole table.
+
+        Raises:
+            ValueError: if the report has no description, or was not profiled with
+                `config.partial.enabled`.
+        """
+        from profunda.merge_reports import append_description
+
+        if self._description_set is None and self.df is None:
+            raise ValueError("The report has no description to update.")
+        if not self.config.partial.enabled:
+            raise ValueError(
+                "The report has no mergeable state, profile the table with "
+                "`config.partial.enabled` to update it."
+            )
+
+        # Profile the new rows with the backend and the types of the description.
+        # Columns without values so far have no type of their own (e.g. an
+        # all-missing column is Unsupported), their type is inferred again.
+        description = self.description_set
+        config = self.config.copy(deep=True)
+        if description.package.get("backend") in ("pandas", "ibis"):
+            config.backend.engine = description.package["backend"]
+        type_schema = {
+            name: variable["type"]
+            for name, variable in description.variables.items()
+            if variable["partial"].count > 0
+        }
+        appended = ProfileReport(
+            df, config=config, type_schema={**type_schema, **(self._type_schema or {})}
+        )
+        description = append_description(
+            description, appended.description_set, self.config
+        )
+
+        report = ProfileReport(None, config=self.config.copy(deep=True))
+        report._description_set = description
+        return report
+
     def compare(
         self, other: "ProfileReport", config: Optional[Settings] = None
     ) -> "ProfileReport":
@@ -19,6 +19,7 @@ from profunda.report.formatters import (
 from profunda.report.presentation.core import Alerts, Container, Table
 from profunda.report.presentation.core import Image as ImageWidget
 from profunda.report.presentation.core.renderable import Renderable
+from profunda.report.structure.variables.render_common import approximated
 from profunda.visualisation.plot import plot_overview_timeseries
 
 
@@ -47,10 +48,12 @@ def get_dataset_overview(config: Settings, summary: BaseDescription) -> Renderab
                 {
                     "name": "Duplicate rows",
                     "value": fmt_number(summary.table["n_duplicates"]),
+                    **approximated(summary.table, "n_duplicates"),
                 },
                 {
                     "name": "Duplicate rows (%)",
                     "value": fmt_percent(summary.table["p_duplicates"]),
+                    **approximated(summary.table, "p_duplicates"),
                 },
             ]
         )
@@ -8,6 +8,7 @@ from profunda.config import Settings
 from profunda.model import BaseDescription
 from profunda.model.alerts import AlertType
 from profunda.model.handler import get_render_map
+from profunda.report.formatters import fmt_bytesize, fmt_number, fmt_timespan
 from profunda.report.presentation.core import (
     HTML,
     Collapse,
@@ -227,6 +228,49 @@ def get_duplicates_items(
     return items
 
 
+def get_performance_items(performance: List[dict]) -> List[Renderable]:
+    """Create the list of profiling performance items
+
+    Args:
+        performance: the metrics of each profiling stage
+
+    Returns:
+        List of profiling performance items to show in the interface.
+    """
+    items: List[Renderable] = []
+    if not isinstance(performance, list) or len(performance) == 0:
+        return items
+
+    stages = pd.DataFrame(
+        {
+            "Stage": [record["stage"] for record in performance],
+            "Column": [record["column"] or "" for record in performance],
+            "Wall time": [fmt_timespan(record["wall_time"]) for record in performance],
+            "CPU time": [fmt_timespan(record["cpu_time"]) for record in performance],
+            "Peak memory increase": [
+                ""
+                if record["peak_rss_delta"] is None
+                else fmt_bytesize(record["peak_rss_delta"])
+                for record in performance
+            ],
+            "Rows": [
+                "" if record["rows"] is None else fmt_number(record["rows"])
+                for record in performance
+            ],
+        }
+    )
+    btn = ToggleButton("Show stages", anchor_id="performance-stages")
+    items.append(
+        Collapse(
+            btn,
+            Duplicate(duplicate=stages, name="Stages", anchor_id="performance-table"),
+            name="Stages",
+            anchor_id="performance-collapse",
+        )
+    )
+    return items
+
+
 def get_definition_items(definitions: pd.DataFrame) -> Sequence[Renderable]:
     """Create the list of duplicates items
 
@@ -448,6 +492,18 @@ def get_report_structure(config: Settings, summary: BaseDescription) -> Root:
                 )
             )
 
+        if config.html.performance_show:
+            performance_items = get_performance_items(summary.performance)
+            if len(performance_items) > 0:
+                section_items.append(
+                    Container(
+                        items=performance_items,
+                        sequence_type="list",
+                        name="Profiling performance",
+                        anchor_id="performance",
+                    )
+                )
+
         sections = Container(
             section_items,
             name="Root",
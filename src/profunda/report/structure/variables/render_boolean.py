@@ -12,7 +12,10 @@ from profunda.report.presentation.core import (
 )
 from profunda.report.presentation.core.renderable import Renderable
 from profunda.report.presentation.frequency_table_utils import freq_table
-from profunda.report.structure.variables.render_common import render_common
+from profunda.report.structure.variables.render_common import (
+    approximated,
+    render_common,
+)
 from profunda.visualisation.plot import cat_frequency_plot
 
 
@@ -39,11 +42,13 @@ def render_boolean(config: Settings, summary: dict) -> dict:
             {
                 "name": "Distinct",
                 "value": fmt(summary["n_distinct"]),
+                **approximated(summary, "n_distinct"),
                 "alert": "n_distinct" in summary["alert_fields"],
             },
             {
                 "name": "Distinct (%)",
                 "value": fmt_percent(summary["p_distinct"]),
+                **approximated(summary, "p_distinct"),
                 "alert": "p_distinct" in summary["alert_fields"],
             },
             {
@@ -22,7 +22,10 @@ from profunda.report.presentation.core import (
 )
 from profunda.report.presentation.core.renderable import Renderable
 from profunda.report.presentation.frequency_table_utils import freq_table
-from profunda.report.structure.variables.render_common import render_common
+from profunda.report.structure.variables.render_common import (
+    approximated,
+    render_common,
+)
 from profunda.report.utils import image_or_empty
 from profunda.visualisation.plot import cat_frequency_plot, histogram
 
@@ -38,11 +41,13 @@ def render_categorical_frequency(
                 "hint": help(
                     "The number of unique values (all values that occur exactly once in the dataset)."
                 ),
+                **approximated(summary, "n_unique"),
                 "alert": "n_unique" in summary["alert_fields"],
             },
             {
                 "name": "Unique (%)",
                 "value": fmt_percent(summary["p_unique"]),
+                **approximated(summary, "p_unique"),
                 "alert": "p_unique" in summary["alert_fields"],
             },
         ],
@@ -358,11 +363,13 @@ def render_categorical(config: Settings, summary: dict) -> dict:
             {
                 "name": "Distinct",
                 "value": fmt(summary["n_distinct"]),
+                **approximated(summary, "n_distinct"),
                 "alert": "n_distinct" in summary["alert_fields"],
             },
             {
                 "name": "Distinct (%)",
                 "value": fmt_percent(summary["p_distinct"]),
+                **approximated(summary, "p_distinct"),
                 "alert": "p_distinct" in summary["alert_fields"],
             },
             {
@@ -1,4 +1,5 @@
 from profunda.config import Settings
+from profunda.report.formatters import help
 from profunda.report.presentation.frequency_table_utils import (
     extreme_obs_table,
     freq_table,
@@ -29,3 +30,19 @@ def render_common(config: Settings, summary: dict) -> dict:
     }
 
     return template_variables
+
+
+def approximated(summary: dict, key: str) -> dict:
+    """Mark a table row with a hint if its statistic is an estimate.
+
+    Args:
+        summary: The variable description.
+        key: The key of the statistic shown in the row.
+
+    Returns:
+        The row fields to add, empty for exact statistics.
+    """
+    if key not in summary.get("approximated", []):
+        return {}
+
+    return {"hint": help("Approximation, computed with an approximate aggregate.")}
@@ -3,6 +3,7 @@ from typing import Any, Dict
 from profunda.config import Settings
 from profunda.report.formatters import fmt, fmt_bytesize, fmt_percent
 from profunda.report.presentation.core import Container, Table, VariableInfo
+from profunda.report.structure.variables.render_common import approximated
 from profunda.report.utils import image_or_empty
 from profunda.visualisation.plot import histogram, mini_histogram
 
@@ -28,11 +29,13 @@ def render_date(config: Settings, summary: Dict[str, Any]) -> Dict[str, Any]:
             {
                 "name": "Distinct",
                 "value": fmt(summary["n_distinct"]),
+                **approximated(summary, "n_distinct"),
                 "alert": False,
             },
             {
                 "name": "Distinct (%)",
                 "value": fmt_percent(summary["p_distinct"]),
+                **approximated(summary, "p_distinct"),
                 "alert": False,
             },
             {
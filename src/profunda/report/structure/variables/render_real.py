@@ -12,7 +12,10 @@ from profunda.report.presentation.core import (
     Table,
     VariableInfo,
 )
-from profunda.report.structure.variables.render_common import render_common
+from profunda.report.structure.variables.render_common import (
+    approximated,
+    render_common,
+)
 from profunda.report.utils import image_or_empty
 from profunda.visualisation.plot import histogram, mini_histogram
 
@@ -39,11 +42,13 @@ def render_real(config: Settings, summary: dict) -> dict:
             {
                 "name": "Distinct",
                 "value": fmt(summary["n_distinct"]),
+                **approximated(summary, "n_distinct"),
                 "alert": "n_distinct" in summary["alert_fields"],
             },
             {
                 "name": "Distinct (%)",
                 "value": fmt_percent(summary["p_distinct"]),
+                **approximated(summary, "p_distinct"),
                 "alert": "p_distinct" in summary["alert_fields"],
             },
             {
@@ -153,22 +158,27 @@ def render_real(config: Settings, summary: dict) -> dict:
             {
                 "name": "5-th percentile",
                 "value": fmt_numeric(summary["5%"], precision=config.report.precision),
+                **approximated(summary, "5%"),
             },
             {
                 "name": "Q1",
                 "value": fmt_numeric(summary["25%"], precision=config.report.precision),
+                **approximated(summary, "25%"),
             },
             {
                 "name": "median",
                 "value": fmt_numeric(summary["50%"], precision=config.report.precision),
+                **approximated(summary, "50%"),
             },
             {
                 "name": "Q3",
                 "value": fmt_numeric(summary["75%"], precision=config.report.precision),
+                **approximated(summary, "75%"),
             },
             {
                 "name": "95-th percentile",
                 "value": fmt_numeric(summary["95%"], precision=config.report.precision),
+                **approximated(summary, "95%"),
             },
             {
                 "name": "Maximum",
@@ -183,6 +193,7 @@ def render_real(config: Settings, summary: dict) -> dict:
             {
                 "name": "Interquartile range (IQR)",
                 "value": fmt_numeric(summary["iqr"], precision=config.report.precision),
+                **approximated(summary, "iqr"),
             },
         ],
         name="Quantile statistics",
@@ -214,6 +225,7 @@ def render_real(config: Settings, summary: dict) -> dict:
             {
                 "name": "Median Absolute Deviation (MAD)",
                 "value": fmt_numeric(summary["mad"], precision=config.report.precision),
+                **approximated(summary, "mad"),
             },
             {
                 "name": "Skewness",
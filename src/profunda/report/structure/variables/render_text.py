@@ -12,7 +12,10 @@ from profunda.report.structure.variables.render_categorical import (
     render_categorical_length,
     render_categorical_unicode,
 )
-from profunda.report.structure.variables.render_common import render_common
+from profunda.report.structure.variables.render_common import (
+    approximated,
+    render_common,
+)
 from profunda.visualisation.plot import plot_word_cloud
 
 
@@ -44,11 +47,13 @@ def render_text(config: Settings, summary: Dict[str, Any]) -> Dict[str, Any]:
             {
                 "name": "Distinct",
                 "value": fmt(summary["n_distinct"]),
+                **approximated(summary, "n_distinct"),
                 "alert": "n_distinct" in summary["alert_fields"],
             },
             {
                 "name": "Distinct (%)",
                 "value": fmt_percent(summary["p_distinct"]),
+                **approximated(summary, "p_distinct"),
                 "alert": "p_distinct" in summary["alert_fields"],
             },
             {
@@ -5,7 +5,7 @@ import re
 import unicodedata
 import warnings
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import pandas as pd
 from pandas.core.util.hashing import hash_pandas_object
@@ -125,6 +125,54 @@ def read_pandas(file_name: Path) -> pd.DataFrame:
     return df
 
 
+def read_pandas_chunks(file_name: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Read DataFrames of at most `chunksize` rows based on the file extension, so
+    that the whole file is never loaded in memory.
+    Reading in chunks is supported for .csv, .tsv, .jsonl and .parquet files, the
+    other file types are read at once with `read_pandas`.
+
+    Args:
+        file_name: the file to read
+        chunksize: the maximum number of rows of each DataFrame
+
+    Returns:
+        Iterator over the DataFrames, in the order of the rows in the file
+    """
+    extension = uncompressed_extension(file_name)
+    if extension == ".jsonl":
+        with pd.read_json(str(file_name), lines=True, chunksize=chunksize) as reader:
+            yield from reader
+    elif extension == ".tsv":
+        with pd.read_csv(str(file_name), sep="\t", chunksize=chunksize) as reader:
+            yield from reader
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(str(file_name))
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    elif extension in [
+        ".json",
+        ".dta",
+        ".xls",
+        ".xlsx",
+        ".hdf",
+        ".h5",
+        ".sas7bdat",
+        ".xpt",
+        ".pkl",
+        ".pickle",
+        ".tar",
+    ]:
+        yield read_pandas(file_name)
+    else:
+        if extension != ".csv":
+            warn_read(extension)
+
+        with pd.read_csv(str(file_name), chunksize=chunksize) as reader:
+            yield from reader
+
+
 def rename_index(df: pd.DataFrame) -> pd.DataFrame:
     """If the DataFrame contains a column or index named `index`, this will produce errors. We rename the {index,column}
     to be `df_index`.
@@ -1,15 +1,43 @@
+import threading
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from tqdm import tqdm
 
+from profunda.model.performance import measure_stage
+from profunda.model.trace import query_labels
+
+# Serializes the updates of the progress bar by stages running concurrently.
+_lock = threading.Lock()
+
+
+def update_bar(
+    bar: tqdm, postfix: Optional[str] = None, n: int = 0, total: int = 0
+) -> None:
+    """Update a progress bar that concurrent stages share.
+
+    Args:
+        bar: The progress bar.
+        postfix: The message to show, if any.
+        n: The number of steps done.
+        total: The number of steps to add to the total.
+    """
+    with _lock:
+        if postfix is not None:
+            bar.set_postfix_str(postfix)
+        if total:
+            bar.total += total
+        if n:
+            bar.update(n)
+
 
 def progress(fn: Callable, bar: tqdm, message: str) -> Callable:
     @wraps(fn)
     def inner(*args, **kwargs) -> Any:
-        bar.set_postfix_str(message)
-        ret = fn(*args, **kwargs)
-        bar.update()
+        update_bar(bar, postfix=message)
+        with query_labels(stage=message), measure_stage(message):
+            ret = fn(*args, **kwargs)
+        update_bar(bar, n=1)
         return ret
 
     return inner
@@ -0,0 +1,103 @@
+"""Test the Arrow hand-off between pandas, pyarrow and the Ibis backend."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from ibis import _
+
+from profunda import ProfileReport
+from profunda.model.ibis.arrow_ibis import (
+    fetch_record,
+    fetch_value_count_batches,
+    fetch_value_counts,
+    to_memtable,
+)
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "num": [1.0, 2.0, None, 2.0],
+            "int": [1, 2, 3, 2],
+            "str": ["a", "b", None, "b"],
+            "date": pd.date_range("2020-01-01", periods=4),
+        }
+    )
+
+
+def test_to_memtable(df):
+    for data in (
+        df,
+        pa.Table.from_pandas(df),
+        df.convert_dtypes(dtype_backend="pyarrow"),
+    ):
+        table = to_memtable(data)
+        assert table.columns == tuple(df.columns)
+        assert table.count().execute() == len(df)
+
+
+def test_fetch_record(df):
+    table = to_memtable(df)
+    query = table.aggregate(
+        mean=table["num"].mean(),
+        empty_mean=table["num"].mean(where=table["num"] > 5),
+        empty_min=table["int"].min(where=table["int"] > 5),
+        n=table["int"].sum(),
+        first=table["date"].min(),
+    )
+
+    record = fetch_record(query)
+    expected = query.execute().to_dict("records")[0]
+
+    assert record.keys() == expected.keys()
+    assert record["mean"] == expected["mean"]
+    assert np.isnan(record["empty_mean"])
+    assert record["empty_min"] is None
+    assert record["n"] == expected["n"]
+    assert record["first"] == pd.Timestamp("2020-01-01")
+
+
+def test_fetch_value_counts(df):
+    table = to_memtable(df)
+    query = (
+        table.filter(table["str"].notnull())
+        .group_by("str")
+        .aggregate(count=_.count())
+        .order_by("str")
+    )
+
+    counts = fetch_value_counts(query, "str")
+
+    assert isinstance(counts.index.dtype, pd.ArrowDtype)
+    assert counts.to_dict() == query.to_pandas().set_index("str")["count"].to_dict()
+
+
+@pytest.mark.parametrize("column", ["str", "int", "date"])
+def test_fetch_value_count_batches(df, column):
+    table = to_memtable(df)
+    query = (
+        table.filter(table[column].notnull())
+        .group_by(column)
+        .aggregate(count=_.count())
+    )
+
+    batches = list(fetch_value_count_batches(query, column, chunk_size=1))
+
+    assert len(batches) == query.count().execute()
+    counts = pd.concat(batches)
+    expected = fetch_value_counts(query, column)
+    assert counts.sort_index().to_dict() == expected.sort_index().to_dict()
+
+
+def test_profile_report_arrow_table(df):
+    report = ProfileReport(
+        pa.Table.from_pandas(df),
+        progress_bar=False,
+        vars={"text": {"characters": False, "words": False}},
+    )
+    description = report.get_description()
+
+    assert description.package["backend"] == "ibis"
+    assert description.variables["num"]["mean"] == pytest.approx(df["num"].mean())
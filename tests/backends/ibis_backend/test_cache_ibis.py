@@ -0,0 +1,68 @@
+"""Test the cache of intermediate tables for the Ibis backend."""
+
+import ibis
+import pytest
+
+from profunda.model.ibis.cache_ibis import TableCache
+
+
+@pytest.fixture
+def value_counts():
+    table = ibis.memtable({"a": [1, 2, 2, 3, 3, 3]})
+    return table.group_by("a").aggregate(count=table.count())
+
+
+def _backend_cache_size(table):
+    return len(ibis.get_backend(table)._cache_op_to_entry)
+
+
+def test_table_cache_references(value_counts):
+    cache = TableCache()
+    before = _backend_cache_size(value_counts)
+
+    first = cache.cache(value_counts, n_rows=3)
+    second = cache.cache(value_counts, n_rows=3)
+
+    assert first is second
+    assert cache.hits == 1
+    assert cache.n_tables == 1
+    assert cache.n_rows == 3
+    assert _backend_cache_size(value_counts) == before + 1
+
+    cache.release(first)
+    assert cache.n_tables == 1
+    assert second.count().execute() == 3
+
+    cache.release(second)
+    assert cache.n_tables == 0
+    assert _backend_cache_size(value_counts) == before
+
+
+def test_table_cache_budget(value_counts):
+    cache = TableCache(max_rows=5)
+
+    cached = cache.cache(value_counts, n_rows=3)
+    other = value_counts.filter(value_counts["a"] > 1)
+    skipped = cache.cache(other, n_rows=3)
+
+    assert skipped is other
+    assert cache.skipped == 1
+    assert cache.n_tables == 1
+
+    # Releasing tables that were not cached is a no-op.
+    cache.release(skipped)
+    assert cache.n_tables == 1
+
+    cache.release(cached)
+    assert cache.cache(other, n_rows=3) is not other
+
+
+def test_table_cache_clear(value_counts):
+    cache = TableCache()
+    before = _backend_cache_size(value_counts)
+    cache.cache(value_counts)
+
+    cache.clear()
+
+    assert cache.n_tables == 0
+    assert _backend_cache_size(value_counts) == before
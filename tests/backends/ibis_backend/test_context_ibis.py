@@ -0,0 +1,40 @@
+import ibis
+import pandas as pd
+
+from profunda import ProfileReport
+from profunda.model.context import profiling_context
+from profunda.model.ibis.context_ibis import (
+    extremes,
+    null_count,
+    row_count,
+    seed_summaries,
+)
+
+
+def test_context_ibis_seed_summaries():
+    table = ibis.memtable(pd.DataFrame({"a": [1, None, 3], "b": ["x", "y", None]}))
+
+    with profiling_context() as context:
+        seed_summaries(table, {"a": {"n": 3, "n_missing": 1, "min": 1, "max": 3}})
+
+        assert row_count(table) == 3
+        assert null_count(table, "a") == 1
+        # The describers receive single column tables.
+        assert extremes(table.select("a"), "a") == (1, 3)
+        assert context.stats()["misses"] == 0
+
+        assert null_count(table, "b") == 1
+        assert context.stats()["misses"] == 1
+
+
+def test_context_ibis_description():
+    df = pd.DataFrame({"a": [1, 2, None, 4] * 5, "b": list("abcd") * 5})
+    report = ProfileReport(ibis.memtable(df), progress_bar=False, minimal=True)
+    report.config.vars.text.characters = False
+    report.config.vars.text.words = False
+
+    context = report.get_description().context
+
+    # The row count is only computed with the column aggregates, other stages reuse it.
+    assert context["hits"] > 0
+    assert context["misses"] == 0
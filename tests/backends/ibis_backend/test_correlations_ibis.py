@@ -1,8 +1,15 @@
 import ibis
+import numpy as np
 import pandas as pd
 import pytest
+from ibis.expr.types.relations import CachedTable
 
 from profunda.config import Settings
+from profunda.model.ibis.correlations_ibis import (
+    contingency_tables,
+    pearson_matrix,
+    spearman_matrix,
+)
 from profunda.model.ibis.correlations_ibis import (
     cramers_compute as ibis_cramers_compute,
 )
@@ -16,9 +23,15 @@ from profunda.model.ibis.correlations_ibis import phi_k_compute as ibis_phi_k_co
 from profunda.model.ibis.correlations_ibis import (
     spearman_compute as ibis_spearman_compute,
 )
+from profunda.model.pandas.correlations_pandas import (
+    cramers_compute as pandas_cramers_compute,
+)
 from profunda.model.pandas.correlations_pandas import (
     pearson_compute as pandas_pearson_compute,
 )
+from profunda.model.pandas.correlations_pandas import (
+    spearman_compute as pandas_spearman_compute,
+)
 
 
 @pytest.fixture
@@ -46,13 +59,131 @@ def test_pearson_ibis(correlation_data_num, correlation_var_types):
     pd.testing.assert_frame_equal(res_pandas, res_ibis)
 
 
+@pytest.mark.parametrize("max_metrics_per_query", [1, 5, 1000])
+def test_pearson_matrix_pairwise_complete(max_metrics_per_query):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 4)) + 1e6, columns=list("abcd"))
+    df.loc[rng.random(200) < 0.2, "b"] = np.nan
+    df.loc[rng.random(200) < 0.3, "c"] = None
+    df["d"] = df["a"] * 2
+    df["e"] = rng.random(200) < 0.5
+    df["f"] = 1.0
+
+    actual = pearson_matrix(ibis.memtable(df), list(df.columns), max_metrics_per_query)
+
+    pd.testing.assert_frame_equal(actual, df.astype(float).corr())
+
+
+def test_spearman_ibis(correlation_data_num, correlation_var_types):
+    cfg = Settings()
+
+    res_ibis = ibis_spearman_compute(cfg, correlation_data_num, correlation_var_types)
+
+    res_pandas = pandas_spearman_compute(cfg, correlation_data_num.to_pandas(), {})
+
+    pd.testing.assert_frame_equal(res_pandas, res_ibis)
+
+
+@pytest.mark.parametrize("max_metrics_per_query", [3, 1000])
+def test_spearman_matrix_ties_and_missing(max_metrics_per_query):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.integers(0, 10, size=(100, 3)).astype(float), columns=list("abc")
+    )
+    df.loc[rng.random(100) < 0.2, "b"] = np.nan
+    df.loc[rng.random(100) < 0.3, "c"] = np.nan
+    df["d"] = 1.0
+
+    actual = spearman_matrix(ibis.memtable(df), list(df.columns), max_metrics_per_query)
+
+    pd.testing.assert_frame_equal(actual, df.corr(method="spearman"))
+
+
+def test_spearman_matrix_sample():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(10000, 2)), columns=list("ab"))
+    df["b"] += df["a"]
+
+    actual = spearman_matrix(ibis.memtable(df), ["a", "b"], sample_size=2000)
+
+    expected = df.corr(method="spearman")
+    assert np.allclose(actual, expected, atol=0.05)
+
+
+def test_spearman_matrix_sample_released(monkeypatch):
+    released = []
+    release = CachedTable.release
+    monkeypatch.setattr(
+        CachedTable, "release", lambda self: released.append(self) or release(self)
+    )
+    con = ibis.duckdb.connect()
+    df = pd.DataFrame(
+        np.random.default_rng(0).normal(size=(1000, 2)), columns=["a", "b"]
+    )
+
+    spearman_matrix(con.create_table("t", df), ["a", "b"], sample_size=200)
+
+    assert len(released) == 1
+    assert con.list_tables() == ["t"]
+
+
+@pytest.fixture
+def categorical_data():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "a": rng.choice(list("xyz"), 200),
+            "b": rng.choice(list("pq"), 200),
+            "c": rng.random(200) < 0.3,
+            "d": rng.choice(list("uvwxy"), 200),
+        }
+    )
+    df.loc[rng.random(200) < 0.2, "a"] = None
+    df["e"] = df["a"]
+    df["f"] = rng.choice(list("ab"), 200)
+    df.loc[df["a"].notnull(), "f"] = None
+    return df
+
+
+def test_cramers_ibis(categorical_data):
+    df = categorical_data
+    summary = {c: {"type": "Categorical", "n_distinct": df[c].nunique()} for c in df}
+
+    res_ibis = ibis_cramers_compute(Settings(), ibis.memtable(df), summary)
+
+    res_pandas = pandas_cramers_compute(Settings(), df, summary)
+
+    pd.testing.assert_frame_equal(res_pandas, res_ibis)
+
+
+@pytest.mark.parametrize("max_pairs_per_query", [1, 2, 50])
+def test_contingency_tables(categorical_data, max_pairs_per_query):
+    df = categorical_data
+    pairs = [("a", "b"), ("b", "d"), ("a", "f"), ("d", "a")]
+
+    tables = contingency_tables(ibis.memtable(df), pairs, max_pairs_per_query)
+
+    for (a, b), table in zip(pairs, tables):
+        expected = pd.crosstab(df[a], df[b])
+        if expected.empty:
+            assert table.empty
+        else:
+            table = table.loc[expected.index, expected.columns]
+            assert (table.values == expected.values).all()
+
+
+@pytest.mark.parametrize("func", [ibis_pearson_compute, ibis_spearman_compute])
+def test_single_numeric_column(func, correlation_data_num):
+    res = func(Settings(), correlation_data_num, {"test_num_1": {"type": "Numeric"}})
+
+    assert res.empty
+
+
 @pytest.mark.parametrize(
     "func",
     [
-        ibis_spearman_compute,
         ibis_kendall_compute,
         ibis_phi_k_compute,
-        ibis_cramers_compute,
     ],
 )
 def test_not_implemented(func, correlation_data_num):
@@ -0,0 +1,41 @@
+"""Test per-thread connections for the Ibis backend."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import ibis
+import pandas as pd
+
+from profunda.model.ibis.cursor_ibis import ThreadLocalTable
+
+
+def test_thread_local_table_memtable():
+    table = ibis.memtable({"a": [1, 2, 3]})
+    tables = ThreadLocalTable(table)
+
+    assert tables.requires_cursors
+
+    def run(_):
+        local = tables.get()
+        assert local is tables.get()
+        return local, local["a"].sum().execute()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(run, range(4)))
+
+    assert [total for _, total in results] == [6] * 4
+    assert all(local is not table for local, _ in results)
+
+
+def test_thread_local_table_database(tmp_path):
+    con = ibis.duckdb.connect(str(tmp_path / "test.duckdb"))
+    table = con.create_table("test", pd.DataFrame({"a": [1, 2, 3]}))
+    table = table.filter(table["a"] > 1)
+
+    tables = ThreadLocalTable(table)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        totals = list(
+            executor.map(lambda _: tables.get()["a"].sum().execute(), range(4))
+        )
+
+    assert totals == [5] * 4
@@ -3,7 +3,11 @@ import pandas as pd
 import pytest
 
 from profunda.config import Settings
+from profunda.model.context import profiling_context
+from profunda.model.ibis.cache_ibis import TableCache
 from profunda.model.ibis.describe_counts_ibis import describe_counts_ibis
+from profunda.model.ibis.describe_generic_ibis import describe_generic_ibis
+from profunda.model.ibis.describe_supported_ibis import describe_supported_ibis
 from profunda.model.pandas.describe_counts_pandas import pandas_describe_counts
 
 
@@ -35,3 +39,66 @@ def test_describe_counts_ibis_matches_pandas(
         pandas_summary["value_counts_without_nan"],
         ibis_summary["value_counts_without_nan"],
     )
+
+
+@pytest.mark.parametrize("n_distinct_estimate, cached", [(3, True), (4, False)])
+def test_describe_counts_ibis_cache_max_distinct(
+    ibis_data: ibis.Table, n_distinct_estimate: int, cached: bool
+):
+    config = Settings()
+    config.ibis.cache_max_distinct = 3
+    cache = TableCache()
+
+    with profiling_context() as context:
+        context.table_cache = cache
+        _, _, summary = describe_counts_ibis(
+            config,
+            ibis_data.select("A"),
+            {"n_distinct_estimate": n_distinct_estimate},
+        )
+
+    assert "n_distinct_estimate" not in summary
+    assert cache.n_tables == int(cached)
+    assert summary["value_counts"].count().execute() == 4
+
+    cache.release(summary["value_counts"])
+    assert cache.n_tables == 0
+
+
+def test_describe_counts_ibis_heavy_hitters():
+    config = Settings()
+    config.heavy_hitters.enabled = True
+    config.heavy_hitters.k = 5
+    config.heavy_hitters.sample_size = 100
+    values = [f"id{i}" for i in range(1000)] + ["hot"] * 50 + [None] * 10
+    table = ibis.memtable(pd.DataFrame({"A": values}))
+
+    summary = {"type": "Text"}  # type: ignore
+    for func in [describe_counts_ibis, describe_generic_ibis, describe_supported_ibis]:
+        _, _, summary = func(config, table, summary)
+
+    assert summary["heavy_hitters"]
+    assert summary["n_missing"] == 10
+    assert summary["value_counts"].count().execute() == 5
+    assert summary["value_counts_without_nan"].index[0] == "hot"
+    assert summary["n_distinct"] == pytest.approx(1001, rel=0.2)
+    assert 0 <= summary["n_unique"] <= summary["n_distinct"]
+    assert summary["approximated"] == [
+        "n_distinct",
+        "n_unique",
+        "p_distinct",
+        "p_unique",
+        "value_counts_without_nan",
+    ]
+
+
+def test_describe_counts_ibis_heavy_hitters_low_cardinality():
+    config = Settings()
+    config.heavy_hitters.enabled = True
+    config.heavy_hitters.sample_size = 100
+    table = ibis.memtable(pd.DataFrame({"A": list("abc") * 100}))
+
+    _, _, summary = describe_counts_ibis(config, table, {"type": "Text"})
+
+    assert "heavy_hitters" not in summary
+    assert summary["value_counts"].count().execute() == 3
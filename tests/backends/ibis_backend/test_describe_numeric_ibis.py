@@ -147,3 +147,46 @@ def test_describe_numeric_ibis(series, test_id):
     if not all(series == 0):
         np.testing.assert_array_equal(hist_ibis[0], hist_pandas[0])
         np.testing.assert_array_equal(hist_ibis[1], hist_pandas[1])
+
+
+def test_describe_numeric_ibis_large_offset():
+    """Moments are recombined without losing precision for large offsets."""
+    config = Settings()
+    config.plot.histogram.bins = 3
+
+    rng = np.random.default_rng(0)
+    series = pd.Series(1e9 + rng.gamma(2.0, size=1000), name="offset")
+
+    summary_ibis = {"n": len(series)}
+    _, _, summary_ibis = describe_numeric_1d_ibis(
+        config, ibis.memtable(series), summary_ibis
+    )
+
+    assert summary_ibis["variance"] == approx(series.var())
+    assert summary_ibis["skewness"] == approx(series.skew(), rel=1e-4)
+    assert summary_ibis["kurtosis"] == approx(series.kurt(), rel=1e-4)
+
+
+def test_describe_numeric_ibis_approximate():
+    config = Settings()
+    config.ibis.approximate.quantiles = True
+    series = pd.Series(np.arange(10001, dtype=float), name="data")
+
+    summary = {}  # type: ignore
+    for func in [
+        describe_counts_ibis,
+        describe_generic_ibis,
+        describe_supported_ibis,
+        describe_numeric_1d_ibis,
+    ]:
+        _, _, summary = func(config, ibis.memtable(series.to_frame()), summary)
+
+    assert summary["50%"] == approx(5000, rel=0.01)
+    assert summary["mad"] == approx(2500, rel=0.01)
+    assert summary["mean"] == 5000
+    assert set(summary["approximated"]) == {
+        "mad",
+        "iqr",
+        *(f"{q:.0%}" for q in config.vars.num.quantiles),
+    }
+    assert "n_distinct" not in summary["approximated"]
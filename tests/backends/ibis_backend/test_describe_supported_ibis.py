@@ -9,6 +9,7 @@ from profunda.model.ibis.describe_supported_ibis import describe_supported_ibis
 from profunda.model.pandas.describe_counts_pandas import pandas_describe_counts
 from profunda.model.pandas.describe_generic_pandas import pandas_describe_generic
 from profunda.model.pandas.describe_supported_pandas import pandas_describe_supported
+from profunda.model.summary_algorithms import estimate_distinct_counts
 
 
 @pytest.mark.parametrize(
@@ -47,3 +48,58 @@ def test_describe_supported_ibis_matches_pandas(data: pd.DataFrame):
     assert ibis_summary["is_unique"] == pandas_summary["is_unique"]
     assert ibis_summary["n_unique"] == pandas_summary["n_unique"]
     assert ibis_summary["p_unique"] == pytest.approx(pandas_summary["p_unique"])
+
+
+def _describe_approximate(values):
+    config = Settings()
+    config.ibis.approximate.distinct = True
+    ibis_series = ibis.memtable(pd.DataFrame({"A": values}))
+
+    summary = {}  # type: ignore
+    for func in [
+        describe_counts_ibis,
+        describe_generic_ibis,
+        describe_supported_ibis,
+    ]:
+        _, _, summary = func(config, ibis_series, summary)
+    return summary
+
+
+def test_describe_supported_ibis_approximate_top_values():
+    # The most frequent values are all the values, the counts are exact.
+    summary = _describe_approximate([i % 100 for i in range(1000)])
+
+    assert summary["n_distinct"] == 100
+    assert summary["n_unique"] == 0
+    assert "approximated" not in summary
+
+
+@pytest.mark.parametrize(
+    "values, n_unique, error",
+    [
+        (list(range(1000)) + list(range(100)), 900, 0),
+        # Twice the distinct count error, as the unique values are estimated from it.
+        ([i % 500 for i in range(1000)], 0, 100),
+    ],
+)
+def test_describe_supported_ibis_approximate(values, n_unique, error):
+    summary = _describe_approximate(values)
+
+    assert summary["n_distinct"] == pytest.approx(len(set(values)), rel=0.1)
+    assert summary["n_unique"] == pytest.approx(n_unique, abs=error)
+    assert summary["approximated"] == [
+        "n_distinct",
+        "n_unique",
+        "p_distinct",
+        "p_unique",
+    ]
+
+
+def test_estimate_distinct_counts():
+    counts = pd.Series([5, 3, 2])
+    # Covering all the values.
+    assert estimate_distinct_counts(counts, 3, 10) == (3, 0)
+    # The values beyond the counted ones occur once.
+    assert estimate_distinct_counts(pd.Series([5, 1]), 4, 14) == (10, 9)
+    # The values beyond the counted ones occur at most twice.
+    assert estimate_distinct_counts(counts, 8, 17) == (8, 3)
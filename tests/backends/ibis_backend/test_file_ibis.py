@@ -0,0 +1,71 @@
+"""Test scanning files directly with the Ibis DuckDB backend."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport
+from profunda.model.ibis.file_ibis import file_statistics, read_file
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "int": rng.integers(0, 50, 1000),
+            "num": rng.normal(size=1000),
+            "date": pd.date_range("2020-01-01", periods=1000, freq="h"),
+        }
+    )
+    df.loc[::5, "num"] = np.nan
+    return df
+
+
+def test_parquet_statistics(df, tmp_path):
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=300)
+
+    statistics = file_statistics(read_file(tmp_path / "data.parquet"))
+
+    assert statistics["int"] == {
+        "n": 1000,
+        "n_missing": 0,
+        "min": df["int"].min(),
+        "max": df["int"].max(),
+    }
+    # The extremes of floating point columns are not trusted.
+    assert statistics["num"] == {"n": 1000, "n_missing": 200}
+    assert statistics["date"]["min"] == df["date"].min()
+    assert statistics["date"]["max"] == df["date"].max()
+
+
+def test_file_statistics_other_tables(df, tmp_path):
+    df.to_csv(tmp_path / "data.csv", index=False)
+
+    assert file_statistics(read_file(tmp_path / "data.csv")) == {}
+
+
+def test_read_file_unsupported(tmp_path):
+    with pytest.raises(ValueError, match="cannot be scanned"):
+        read_file(tmp_path / "data.xlsx")
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".csv", ".jsonl"])
+def test_from_file(df, tmp_path, extension):
+    path = tmp_path / f"data{extension}"
+    if extension == ".parquet":
+        df.to_parquet(path)
+    elif extension == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_json(path, orient="records", lines=True, date_format="iso")
+
+    description = ProfileReport.from_file(path, progress_bar=False).get_description()
+    expected = ProfileReport(df, progress_bar=False).get_description()
+
+    assert description.table["n"] == expected.table["n"]
+    for column in ("int", "num"):
+        for key in ("n_missing", "n_distinct", "min", "max", "mean"):
+            assert description.variables[column][key] == pytest.approx(
+                expected.variables[column][key]
+            ), (column, key)
@@ -0,0 +1,63 @@
+import ibis
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport, merge
+
+
+def _report(df: pd.DataFrame, partial: bool) -> ProfileReport:
+    report = ProfileReport(ibis.memtable(df), progress_bar=False, minimal=True)
+    report.config.vars.text.characters = False
+    report.config.vars.text.words = False
+    report.config.partial.enabled = partial
+    return report
+
+
+def test_merge_reports_ibis():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {"num": rng.normal(size=300), "cat": rng.choice(["a", "b", "c"], 300)}
+    )
+
+    full = _report(df, partial=False).get_description()
+    merged = merge(
+        [_report(df.iloc[i : i + 100], partial=True) for i in range(0, 300, 100)]
+    )
+    description = merged.get_description()
+
+    assert description.table["n"] == 300
+    for column in df.columns:
+        for key in ("n_distinct", "n_missing"):
+            assert description.variables[column][key] == full.variables[column][key]
+    for key in ("mean", "std", "50%"):
+        assert description.variables["num"][key] == pytest.approx(
+            full.variables["num"][key]
+        )
+    assert "Overview" in merged.to_html()
+
+
+def test_partial_summary_ibis_top_k():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {"num": rng.integers(0, 1000, size=5000), "cat": rng.integers(0, 800, 5000)}
+    )
+    df["cat"] = "v" + df["cat"].astype(str)
+
+    report = _report(df, partial=True)
+    report.config.partial.top_k = 50
+    variables = report.get_description().variables
+
+    for column in df.columns:
+        partial = variables[column]["partial"]
+        assert len(partial.counts) == 50
+        assert not partial.exact
+        assert partial.counts.iloc[0] == df[column].value_counts().iloc[0]
+        assert partial.distinct.estimate() == pytest.approx(
+            df[column].nunique(), rel=0.05
+        )
+
+    partial = variables["num"]["partial"]
+    assert partial.moments.stats()["mean"] == pytest.approx(df["num"].mean())
+    assert partial.quantiles.total == len(df)
+    assert partial.extremes.index.min() == df["num"].min()
@@ -0,0 +1,88 @@
+"""Test the deferred metric planner for Ibis backend."""
+
+import ibis
+import pytest
+
+from profunda.config import IbisSettings
+from profunda.model.ibis.planner_ibis import MetricPlanner
+from profunda.model.ibis.summary_ibis import plan_series_descriptions_ibis
+from profunda.model.summarizer import ProfilingSummarizer
+from profunda.model.typeset import ProfilingTypeSet
+
+
+@pytest.fixture
+def data():
+    return ibis.memtable(
+        {
+            "int_column": [1, 2, None, 5, 7],
+            "str_column": ["a", "bb", "c", None, "e"],
+            "float_column": [1.1, 2.2, 3.3, 4.4, 5.5],
+        }
+    )
+
+
+def test_planner_deduplicates(data):
+    planner = MetricPlanner(data)
+    planner.request("int_column", "n", data.count())
+    planner.request("str_column", "n", data.count())
+    planner.request("int_column", "n_missing", data["int_column"].isnull().sum())
+    planner.request("int_column", "nulls", data["int_column"].isnull().sum())
+
+    assert planner.n_requests == 4
+    assert planner.n_metrics == 2
+    assert len(planner.queries()) == 1
+
+    assert planner.execute() == {
+        "int_column": {"n": 5, "n_missing": 1, "nulls": 1},
+        "str_column": {"n": 5},
+    }
+
+
+def test_planner_chunks_queries(data):
+    planner = MetricPlanner(data, max_metrics_per_query=2)
+    for column_name in data.columns:
+        planner.request(column_name, "n_missing", data[column_name].isnull().sum())
+
+    assert len(planner.queries()) == 2
+    assert len(planner.sql()) == 2
+    assert planner.execute() == {
+        "int_column": {"n_missing": 1},
+        "str_column": {"n_missing": 1},
+        "float_column": {"n_missing": 0},
+    }
+
+
+def test_planner_known_metrics(data):
+    planner = MetricPlanner(data, known={"int_column": {"n": 5}})
+    planner.request("int_column", "n", data.count())
+    planner.request("int_column", "n_missing", data["int_column"].isnull().sum())
+
+    assert planner.n_metrics == 1
+    assert planner.execute() == {"int_column": {"n": 5, "n_missing": 1}}
+
+
+def test_planner_invalid_chunk_size(data):
+    with pytest.raises(ValueError):
+        MetricPlanner(data, max_metrics_per_query=0)
+
+
+def test_plan_series_descriptions_ibis(data):
+    config = IbisSettings()
+    typeset = ProfilingTypeSet(config)
+    summarizer = ProfilingSummarizer(use_ibis=True, typeset=typeset)
+
+    planner = plan_series_descriptions_ibis(config, data, summarizer)
+    plan = planner.explain()
+
+    assert set(plan["column"]) == set(data.columns)
+    assert len(planner.queries()) == 1
+
+    # The row count is requested for every column, but computed once.
+    row_count = plan[plan["key"] == "n"]
+    assert len(row_count) == len(data.columns)
+    assert row_count["metric"].nunique() == 1
+
+    seeds = planner.execute()
+    assert seeds["int_column"]["n_missing"] == 1
+    assert seeds["str_column"]["max_length"] == 2
+    assert seeds["float_column"]["max"] == 5.5
@@ -0,0 +1,38 @@
+import multiprocessing
+
+import ibis
+import pandas as pd
+
+from profunda import ProfileReport
+from profunda.config import Settings
+from profunda.model.scheduler import get_stage_frames
+
+
+def test_concurrent_stages_ibis():
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 4], "b": [1.0, None, 3.0, 4.0, 4.0]})
+
+    descriptions = []
+    for concurrent in (False, True):
+        report = ProfileReport(ibis.memtable(df), progress_bar=False, minimal=True)
+        report.config.ibis.concurrent = concurrent
+        report.config.pool_size = 4
+        descriptions.append(report.get_description())
+    sequential, concurrent = descriptions
+
+    assert concurrent.table == sequential.table
+    assert concurrent.missing.keys() == sequential.missing.keys()
+    assert [str(alert) for alert in concurrent.alerts] == [
+        str(alert) for alert in sequential.alerts
+    ]
+    # The facts of the table are shared with the copies bound to each worker.
+    assert concurrent.context["misses"] == sequential.context["misses"]
+
+
+def test_stage_frames_ibis_pool_size():
+    config = Settings()
+    config.ibis.concurrent = True
+    config.pool_size = -1
+    table = ibis.memtable(pd.DataFrame({"a": [1]}))
+
+    # Not positive pool sizes use every CPU, as with pandas.
+    assert get_stage_frames(config, table)[0] == multiprocessing.cpu_count()
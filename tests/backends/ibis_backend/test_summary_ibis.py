@@ -3,6 +3,8 @@
 from datetime import datetime
 
 import ibis
+import numpy as np
+import pandas as pd
 import pytest
 import tqdm
 
@@ -10,6 +12,7 @@ from profunda.config import IbisSettings
 from profunda.model.ibis.summary_ibis import (
     _get_type,
     get_series_descriptions_ibis,
+    get_wide_summaries_ibis,
     ibis_describe_1d,
 )
 from profunda.model.summarizer import ProfilingSummarizer
@@ -89,3 +92,115 @@ def test__get_type_unsupported():
     actual = _get_type(ibis.memtable({"col": [[1, 2], [3], [4, 5, 6]]}))
 
     assert actual == "Unsupported"
+
+
+def test_get_wide_summaries_ibis(data):
+    config = IbisSettings()
+
+    typeset = ProfilingTypeSet(config)
+    summarizer = ProfilingSummarizer(use_ibis=True, typeset=typeset)
+
+    actual = get_wide_summaries_ibis(config, data, summarizer)
+
+    assert set(actual) == set(data.columns)
+    assert all(summary["n"] == 5 for summary in actual.values())
+    assert all(summary["n_missing"] == 0 for summary in actual.values())
+    assert actual["int_column"]["sum"] == 18
+    assert actual["str_column"]["max_length"] == 1
+    assert actual["date_column"]["max"] == datetime(2021, 1, 5)
+
+
+@pytest.mark.parametrize(
+    "column", ["int_column", "str_column", "bool_column", "float_column", "date_column"]
+)
+def test_ibis_describe_1d_seeded(data, column):
+    """Seeding the summary with the wide aggregates does not change the result."""
+    config = IbisSettings()
+
+    typeset = ProfilingTypeSet(config)
+    summarizer = ProfilingSummarizer(use_ibis=True, typeset=typeset)
+
+    seeded = ibis_describe_1d(
+        config,
+        data.select(column),
+        summarizer,
+        typeset,
+        summary=get_wide_summaries_ibis(config, data, summarizer)[column],
+    )
+    unseeded = ibis_describe_1d(config, data.select(column), summarizer, typeset)
+
+    assert seeded.keys() == unseeded.keys()
+    for key, value in unseeded.items():
+        if isinstance(value, (float, int, np.number)) and not isinstance(value, bool):
+            assert seeded[key] == pytest.approx(value, nan_ok=True), key
+        elif isinstance(value, (str, pd.Timestamp)):
+            assert seeded[key] == value, key
+
+
+def _scalars(description: dict) -> dict:
+    return {
+        key: value
+        for key, value in description.items()
+        if np.isscalar(value) and not pd.isna(value)
+    }
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+def test_get_series_descriptions_ibis_concurrent(data, pool_size):
+    typeset = ProfilingTypeSet(IbisSettings())
+    summarizer = ProfilingSummarizer(use_ibis=True, typeset=typeset)
+
+    serial = get_series_descriptions_ibis(
+        IbisSettings(), data, summarizer, typeset, tqdm.tqdm()
+    )
+
+    config = IbisSettings(pool_size=pool_size)
+    config.ibis.concurrent = True
+    pbar = tqdm.tqdm(total=len(data.columns))
+    concurrent = get_series_descriptions_ibis(config, data, summarizer, typeset, pbar)
+
+    assert pbar.n == len(data.columns)
+    assert list(concurrent) == list(data.columns)
+    for column in data.columns:
+        assert _scalars(concurrent[column]) == _scalars(serial[column])
+
+
+def test_get_series_descriptions_ibis_concurrent_database(tmp_path):
+    con = ibis.duckdb.connect(str(tmp_path / "test.duckdb"))
+    table = con.create_table(
+        "test",
+        pd.DataFrame({"a": np.arange(100), "b": [str(i % 7) for i in range(100)]}),
+    )
+
+    config = IbisSettings(pool_size=2)
+    config.ibis.concurrent = True
+    typeset = ProfilingTypeSet(config)
+    actual = get_series_descriptions_ibis(
+        config,
+        table,
+        ProfilingSummarizer(use_ibis=True, typeset=typeset),
+        typeset,
+        tqdm.tqdm(),
+    )
+
+    assert list(actual) == ["a", "b"]
+    assert actual["a"]["max"] == 99
+    assert actual["b"]["n_distinct"] == 7
+
+
+def test_get_series_descriptions_ibis_releases_value_counts(data):
+    config = IbisSettings()
+    typeset = ProfilingTypeSet(config)
+    backend = ibis.get_backend(data)
+    before = len(backend._cache_op_to_entry)
+
+    actual = get_series_descriptions_ibis(
+        config,
+        data,
+        ProfilingSummarizer(use_ibis=True, typeset=typeset),
+        typeset,
+        tqdm.tqdm(),
+    )
+
+    assert len(backend._cache_op_to_entry) == before
+    assert all("table_cache" not in description for description in actual.values())
@@ -0,0 +1,124 @@
+import json
+import threading
+
+import ibis
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport
+from profunda.model.ibis.trace_ibis import (
+    execute_traced,
+    to_pyarrow_traced,
+    trace_queries_ibis,
+)
+from profunda.model.trace import QueryTrace, query_labels
+
+# The methods of the backends that run queries.
+TRACED_METHODS = ("execute", "to_pyarrow", "to_pyarrow_batches")
+
+
+@pytest.fixture
+def table() -> ibis.Table:
+    return ibis.memtable(pd.DataFrame({"a": [1, 2, None, 4], "b": list("abcd")}))
+
+
+def test_trace_queries_ibis(table: ibis.Table):
+    trace = QueryTrace()
+    backend_class = type(ibis.get_backend(table))
+    methods = {name: getattr(backend_class, name) for name in TRACED_METHODS}
+
+    with trace_queries_ibis(table, trace), query_labels(stage="count"):
+        assert execute_traced(table.count()) == 4
+        execute_traced(table)
+        to_pyarrow_traced(table.limit(2))
+        # The queries not issued through the helpers are not part of the run.
+        table.count().execute()
+
+    # Queries issued after the block are not recorded.
+    execute_traced(table.count())
+    # The backend is left untouched.
+    assert methods == {name: getattr(backend_class, name) for name in TRACED_METHODS}
+
+    records = trace.records
+    assert [(r["stage"], r["rows"]) for r in records] == [
+        ("count", 1),
+        ("count", 4),
+        ("count", 2),
+    ]
+    assert "COUNT" in records[0]["sql"]
+    assert all(r["duration"] >= 0 for r in records)
+
+
+def test_trace_queries_ibis_per_run(table: ibis.Table):
+    outer, inner = QueryTrace(), QueryTrace()
+
+    with trace_queries_ibis(table, outer):
+        # Another thread using the same backend is not part of the run.
+        thread = threading.Thread(target=lambda: execute_traced(table.count()))
+        thread.start()
+        thread.join()
+
+        with trace_queries_ibis(table, inner):
+            execute_traced(table.count())
+        execute_traced(table)
+
+    assert [r["rows"] for r in outer.records] == [4]
+    assert [r["rows"] for r in inner.records] == [1]
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_trace_description(table: ibis.Table, concurrent: bool):
+    report = ProfileReport(table, progress_bar=False, minimal=True)
+    report.config.vars.text.characters = False
+    report.config.vars.text.words = False
+    report.config.ibis.trace = True
+    report.config.ibis.concurrent = concurrent
+
+    queries = pd.DataFrame(report.get_description().queries)
+
+    assert set(queries["stage"]) == {"Describe variables"}
+    assert set(queries["column"].dropna()) == {"a", "b"}
+
+    trace = json.loads(report.to_chrome_trace())
+    assert len(trace["traceEvents"]) == len(queries)
+
+
+def test_trace_arrow_queries(tmp_path):
+    # The metric planner, moments and correlations fetch their results as Arrow.
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "x": rng.normal(size=200),
+            "y": rng.normal(size=200),
+            "c": rng.choice(list("abc"), 200),
+        }
+    )
+    df.to_parquet(tmp_path / "data.parquet")
+    report = ProfileReport.from_file(tmp_path / "data.parquet", progress_bar=False)
+    report.config.ibis.trace = True
+
+    queries = pd.DataFrame(report.get_description().queries)
+
+    planner = queries[
+        (queries["stage"] == "Describe variables") & queries["column"].isna()
+    ]
+    assert len(planner) == 1
+    assert all(f'"{column}"' in planner["sql"].iloc[0] for column in ("x", "y"))
+
+    moments = queries[queries["sql"].str.contains("__profunda_shift")]
+    assert set(moments["column"]) == {"x", "y"}
+
+    stages = queries["stage"].value_counts()
+    assert stages["Calculate spearman correlation"] == 2
+    assert stages["Calculate pearson correlation"] == 2
+
+
+def test_trace_disabled(table: ibis.Table):
+    report = ProfileReport(table, progress_bar=False, minimal=True)
+    report.config.vars.text.characters = False
+    report.config.vars.text.words = False
+
+    assert report.get_description().queries == []
+    with pytest.warns(UserWarning, match="ibis.trace"):
+        report.to_chrome_trace()
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"num": np.arange(100.0), "bool": np.arange(100) % 2 == 0})
+
+
+def _backend(report: ProfileReport) -> str:
+    return report.get_description().package["backend"]
+
+
+def test_backend_auto_small(df):
+    report = ProfileReport(df, progress_bar=False)
+
+    assert isinstance(report.df, pd.DataFrame)
+    assert _backend(report) == "pandas"
+
+
+def test_backend_auto_large(df):
+    # With the default settings, no feature requires pandas.
+    report = ProfileReport(df, progress_bar=False, backend={"max_pandas_cells": 100})
+
+    assert not isinstance(report.df, pd.DataFrame)
+    assert _backend(report) == "ibis"
+    # The defaults of the Ibis backend apply.
+    assert not report.config.infer_dtypes
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"infer_dtypes": True},
+        {"vars": {"text": {"words": True}}},
+        {"type_schema": {"num": "numeric"}},
+    ],
+)
+def test_backend_auto_pandas_features(df, kwargs):
+    report = ProfileReport(
+        df, progress_bar=False, backend={"max_pandas_cells": 100}, **kwargs
+    )
+
+    assert _backend(report) == "pandas"
+
+
+def test_backend_engine(df):
+    report = ProfileReport(df, progress_bar=False, backend={"engine": "ibis"})
+    assert _backend(report) == "ibis"
+
+    with pytest.raises(ValueError, match="Unknown backend engine"):
+        ProfileReport(df, backend={"engine": "spark"})
@@ -1,5 +1,7 @@
 import os
 
+import numpy as np
+import pandas as pd
 import pytest
 import requests
 
@@ -63,3 +65,26 @@ def test_double_config(console_data, test_output_dir):
     assert (
         str(e.value) == "Arguments `config_file` and `minimal` are mutually exclusive."
     )
+
+
+def test_console_streaming(tmp_path):
+    rng = np.random.default_rng(0)
+    data = tmp_path / "data.csv"
+    pd.DataFrame(
+        {"num": rng.normal(size=250), "bool": rng.choice([True, False], 250)}
+    ).to_csv(data, index=False)
+
+    report = tmp_path / "test_streaming.html"
+    console.main(["-s", "--minimal", "--chunksize", "100", str(data), str(report)])
+    assert report.exists(), "Report should exist"
+
+
+def test_console_parquet(tmp_path):
+    data = tmp_path / "data.parquet"
+    pd.DataFrame({"num": np.arange(250), "bool": np.arange(250) % 2 == 0}).to_parquet(
+        data
+    )
+
+    report = tmp_path / "test_parquet.html"
+    console.main(["-s", "--minimal", str(data), str(report)])
+    assert report.exists(), "Report should exist"
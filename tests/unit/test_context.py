@@ -0,0 +1,40 @@
+import threading
+
+from profunda.model.context import ProfilingContext, get_context, profiling_context
+
+
+def test_profiling_context_memoizes_facts():
+    context = ProfilingContext()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return 42
+
+    assert context.get("n", compute) == 42
+    assert context.get("n", compute) == 42
+    assert len(calls) == 1
+    assert context.stats() == {"n_facts": 1, "hits": 1, "misses": 1}
+
+
+def test_profiling_context_seed():
+    context = ProfilingContext()
+    context.seed("n", 10)
+    context.seed("n", 20)
+
+    assert context.get("n", lambda: 30) == 10
+    assert context.stats() == {"n_facts": 1, "hits": 1, "misses": 0}
+
+
+def test_profiling_context_active():
+    with profiling_context() as context:
+        assert get_context() is context
+
+        # Contexts are not shared with threads that did not copy them.
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_context()))
+        thread.start()
+        thread.join()
+        assert other[0] is not context
+
+    assert get_context() is not context
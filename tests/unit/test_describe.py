@@ -556,6 +556,9 @@ def test_describe_df(column, describe_data, expected_results, summarizer):
         "package",
         "sample",
         "duplicates",
+        "context",
+        "queries",
+        "performance",
     } == set(asdict(results).keys()), "Not in results"
 
     # Loop over variables
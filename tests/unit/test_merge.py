@@ -0,0 +1,290 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport, merge_descriptions
+from profunda.config import Settings
+from profunda.model.describe import describe
+from profunda.model.partial import HyperLogLog, PowerSums, QuantileSketch
+from profunda.model.typeset import ProfilingTypeSet
+
+
+@pytest.fixture
+def partitioned_df():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "num": rng.normal(size=600),
+            "int": rng.integers(0, 20, 600),
+            "cat": rng.choice(["a", "b", "c"], 600),
+            "bool": rng.choice([True, False], 600),
+            "date": pd.date_range("2020-01-01", periods=600, freq="h"),
+            "id": np.arange(600),
+        }
+    )
+    df.loc[::7, "num"] = np.nan
+    return df
+
+
+def _describe(df, summarizer, **partial):
+    config = Settings()
+    config.progress_bar = False
+    config.partial.enabled = True
+    config.partial = config.partial.copy(update=partial)
+    return describe(config, df, summarizer, ProfilingTypeSet(config))
+
+
+def _partitions(df, n):
+    size = len(df) // n
+    return [
+        df.iloc[i : i + size].reset_index(drop=True) for i in range(0, len(df), size)
+    ]
+
+
+def test_merge_descriptions(partitioned_df, summarizer):
+    full = _describe(partitioned_df, summarizer)
+    merged = merge_descriptions(
+        [_describe(part, summarizer) for part in _partitions(partitioned_df, 3)]
+    )
+
+    assert merged.table["n"] == full.table["n"]
+    assert merged.table["n_cells_missing"] == full.table["n_cells_missing"]
+    assert merged.table["types"] == full.table["types"]
+
+    for column in partitioned_df.columns:
+        expected, actual = full.variables[column], merged.variables[column]
+        assert actual["type"] == expected["type"]
+        for key in ("n", "n_missing", "n_distinct", "n_unique", "min", "max"):
+            if key in expected:
+                assert actual[key] == expected[key], (column, key)
+        assert set(actual.get("approximated", [])) <= {"chi_squared"}
+
+    for column in ("num", "int"):
+        expected, actual = full.variables[column], merged.variables[column]
+        for key in ("mean", "std", "variance", "skewness", "kurtosis", "sum"):
+            assert actual[key] == pytest.approx(expected[key]), (column, key)
+        for key in ("5%", "25%", "50%", "75%", "95%", "mad"):
+            assert actual[key] == pytest.approx(expected[key]), (column, key)
+        np.testing.assert_allclose(actual["histogram"][0], expected["histogram"][0])
+        np.testing.assert_allclose(actual["histogram"][1], expected["histogram"][1])
+
+    assert merged.variables["id"]["monotonic"] == 2
+    assert merged.variables["int"]["monotonic"] == 0
+    for column in ("cat", "bool"):
+        assert merged.variables[column]["imbalance"] == pytest.approx(
+            full.variables[column]["imbalance"]
+        )
+        pd.testing.assert_series_equal(
+            merged.variables[column]["value_counts_without_nan"].sort_index(),
+            full.variables[column]["value_counts_without_nan"].sort_index(),
+            check_names=False,
+        )
+
+
+def test_merge_descriptions_approximated(partitioned_df, summarizer):
+    full = _describe(partitioned_df, summarizer)
+    merged = merge_descriptions(
+        [
+            _describe(part, summarizer, top_k=10, sketch_size=50)
+            for part in _partitions(partitioned_df, 3)
+        ]
+    )
+
+    actual = merged.variables["num"]
+    assert "n_distinct" in actual["approximated"]
+    assert "50%" in actual["approximated"]
+    assert actual["n_distinct"] == pytest.approx(
+        full.variables["num"]["n_distinct"], rel=0.05
+    )
+    assert actual["50%"] == pytest.approx(full.variables["num"]["50%"], abs=0.1)
+    # The moments are merged exactly.
+    assert actual["mean"] == pytest.approx(full.variables["num"]["mean"])
+
+
+@pytest.mark.parametrize("infinities", [[np.inf], [-np.inf], [np.inf, -np.inf]])
+def test_merge_descriptions_infinite(summarizer, infinities):
+    values = np.arange(100.0)
+    values[7 : 7 + len(infinities)] = infinities
+    df = pd.DataFrame({"num": values})
+
+    full = _describe(df, summarizer).variables["num"]
+    merged = merge_descriptions(
+        [_describe(part, summarizer) for part in _partitions(df, 2)]
+    ).variables["num"]
+
+    assert merged["n_infinite"] == full["n_infinite"] == len(infinities)
+    for key in ("mean", "sum", "std", "variance", "skewness", "kurtosis", "cv"):
+        np.testing.assert_equal(merged[key], full[key], err_msg=key)
+
+
+def test_merge_descriptions_shared_bin_edges(partitioned_df, summarizer):
+    edges = [0.0, 5.0, 10.0, 15.0, 20.0]
+    merged = merge_descriptions(
+        [
+            _describe(part, summarizer, bin_edges={"int": edges})
+            for part in _partitions(partitioned_df, 2)
+        ]
+    )
+
+    counts, bin_edges = merged.variables["int"]["histogram"]
+    np.testing.assert_array_equal(bin_edges, edges)
+    np.testing.assert_array_equal(
+        counts, np.histogram(partitioned_df["int"], bins=edges)[0]
+    )
+
+
+def test_merge_descriptions_errors(partitioned_df, summarizer):
+    with pytest.raises(ValueError, match="No descriptions"):
+        merge_descriptions([])
+
+    config = Settings()
+    config.progress_bar = False
+    description = describe(config, partitioned_df, summarizer, ProfilingTypeSet(config))
+    with pytest.raises(ValueError, match="partial.enabled"):
+        merge_descriptions([description, description])
+
+
+def test_update_duplicates():
+    history = pd.DataFrame({"a": [1, 1, 2, 3], "b": list("xxyz")})
+    new_rows = pd.DataFrame({"a": [2, 4, 4], "b": list("yww")})
+    config = {
+        "minimal": True,
+        "progress_bar": False,
+        "partial": {"enabled": True},
+        "duplicates": {"head": 10},
+    }
+
+    report = ProfileReport(history, **config).update(new_rows)
+    table = report.get_description().table
+
+    # The row (2, "y") is duplicated across the updates, and is not detected.
+    full = ProfileReport(pd.concat([history, new_rows]), **config)
+    assert full.get_description().table["n_duplicates"] == 3
+    assert table["n_duplicates"] == 2
+    assert table["approximated"] == ["n_duplicates", "p_duplicates"]
+    assert "Approximation" in report.to_html()
+
+
+def test_update(partitioned_df, tmp_path):
+    history, new_rows = _partitions(partitioned_df, 2)
+    config = {
+        "minimal": True,
+        "progress_bar": False,
+        "partial": {"enabled": True},
+        "vars": {"text": {"characters": False, "words": False}},
+    }
+
+    report = ProfileReport(history, **config)
+    report.get_description()
+    report.dump(tmp_path / "report.pp")
+    report = ProfileReport().load(tmp_path / "report.pp").update(new_rows)
+    report.dump(tmp_path / "report.pp")
+    loaded = ProfileReport().load(tmp_path / "report.pp")
+
+    full = ProfileReport(partitioned_df, **config).get_description()
+    updated = loaded.get_description()
+    assert updated.table["n"] == full.table["n"]
+    for column in ("num", "int"):
+        for key in ("n_missing", "n_distinct", "min", "max", "mean", "std"):
+            assert updated.variables[column][key] == pytest.approx(
+                full.variables[column][key]
+            ), (column, key)
+    # The metrics are those of the last update only.
+    assert {p["stage"] for p in updated.performance} == {
+        p["stage"] for p in report.get_description().performance
+    }
+    assert "<html" in loaded.to_html()
+
+
+def test_from_path_chunks(partitioned_df, tmp_path):
+    partitioned_df.to_parquet(tmp_path / "data.parquet")
+    config = {
+        "minimal": True,
+        "progress_bar": False,
+        "vars": {"text": {"characters": False, "words": False}},
+    }
+
+    full = ProfileReport.from_path(tmp_path / "data.parquet", **config)
+    chunked = ProfileReport.from_path(
+        tmp_path / "data.parquet", chunksize=200, **config
+    )
+
+    expected, actual = full.get_description(), chunked.get_description()
+    assert actual.table["n"] == expected.table["n"]
+    assert actual.table["n_cells_missing"] == expected.table["n_cells_missing"]
+    for key in ("n_distinct", "min", "max", "mean", "std", "50%"):
+        assert actual.variables["num"][key] == pytest.approx(
+            expected.variables["num"][key]
+        ), key
+
+
+def test_from_path_chunks_not_lazy(partitioned_df, tmp_path):
+    partitioned_df.to_csv(tmp_path / "data.csv", index=False)
+    config = Settings()
+    config.progress_bar = False
+
+    report = ProfileReport.from_path(
+        tmp_path / "data.csv", chunksize=200, config=config, minimal=False, lazy=False
+    )
+
+    assert report.get_description().table["n"] == len(partitioned_df)
+    assert not config.partial.enabled
+
+
+def test_from_path_chunks_missing_first(tmp_path):
+    df = pd.DataFrame({"a": np.arange(3000)})
+    df["b"] = np.where(df["a"] >= 1500, df["a"], np.nan)
+    df.to_csv(tmp_path / "data.csv", index=False)
+    config = Settings()
+    config.progress_bar = False
+    config.vars.text.characters = False
+    config.vars.text.words = False
+
+    full = ProfileReport.from_path(tmp_path / "data.csv", config=config)
+    chunked = ProfileReport.from_path(
+        tmp_path / "data.csv", chunksize=1000, config=config
+    )
+
+    expected, actual = full.get_description(), chunked.get_description()
+    assert actual.variables["b"]["type"] == expected.variables["b"]["type"]
+    assert actual.variables["b"]["type"] == "Numeric"
+    assert actual.variables["b"]["mean"] == pytest.approx(2249.5)
+    assert actual.variables["b"]["n_missing"] == 1500
+    assert not config.partial.enabled
+
+
+def test_update_without_partial(partitioned_df):
+    report = ProfileReport(partitioned_df, progress_bar=False)
+    with pytest.raises(ValueError, match="partial.enabled"):
+        report.update(partitioned_df)
+
+
+def test_hyperloglog():
+    left, right = HyperLogLog(12), HyperLogLog(12)
+    left.add(pd.util.hash_array(np.arange(0, 6000)))
+    right.add(pd.util.hash_array(np.arange(4000, 10000)))
+
+    assert left.merge(right).estimate() == pytest.approx(10000, rel=0.05)
+
+
+def test_power_sums_merge():
+    values = np.array([1.0, 2.0, 4.0, 8.0, 16.0, 32.0])
+    left = PowerSums.from_counts(values[:3], np.ones(3), shift=2.0)
+    right = PowerSums.from_counts(values[3:], np.ones(3), shift=16.0)
+
+    stats = left.merge(right).stats()
+    series = pd.Series(values)
+    assert stats["mean"] == pytest.approx(series.mean())
+    assert stats["variance"] == pytest.approx(series.var())
+    assert stats["skewness"] == pytest.approx(series.skew())
+    assert stats["kurtosis"] == pytest.approx(series.kurt())
+
+
+def test_quantile_sketch():
+    values = np.array([3.0, 1.0, 2.0, 5.0])
+    counts = np.array([2.0, 1.0, 3.0, 1.0])
+    sketch = QuantileSketch(values, counts, size=10)
+    series = pd.Series(np.repeat(values, counts.astype(int)))
+
+    for q in (0.0, 0.1, 0.25, 0.5, 0.9, 1.0):
+        assert sketch.quantile(q) == pytest.approx(series.quantile(q))
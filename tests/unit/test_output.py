@@ -27,6 +27,9 @@ def test_json(data):
         "scatter",
         "table",
         "variables",
+        "context",
+        "queries",
+        "performance",
     }
 
 
@@ -1,7 +1,17 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from profunda.model.pandas.describe_categorical_pandas import word_summary_vc
+from profunda.model.pandas.describe_categorical_pandas import (
+    UnicodeTable,
+    get_character_counts_vc,
+    unicode_summary_vc,
+    word_counts_vc,
+    word_summary_vc,
+)
 
 value_counts_w_words = pd.Series(index=["The dog", "is hungry"], data=[2, 1])
 
@@ -21,3 +31,76 @@ def test_word_summary_vc_with_stop_words(stop_words):
         ].to_dict()
         == pd.Series(index=["dog", "is", "hungry"], data=[2, 1, 1]).to_dict()
     )
+
+
+def test_get_character_counts_vc():
+    vc = pd.Series(index=["abb", "", "b\U0001f600", "a\x00"], data=[2, 5, 1, 3])
+    counts = get_character_counts_vc(vc)
+    assert counts.to_dict() == {"a": 5, "b": 5, "\U0001f600": 1, "\x00": 3}
+    assert list(counts.values) == sorted(counts.values, reverse=True)
+
+
+def test_unicode_table_looks_up_once():
+    looked_up = []
+
+    def lookup(char):
+        looked_up.append(char)
+        return "upper" if char.isupper() else "other"
+
+    table = UnicodeTable(lookup)
+    ids = table(np.array([ord("a"), ord("B"), ord("c")]))
+    assert [table.labels[i] for i in ids] == ["other", "upper", "other"]
+    ids = table(np.array([ord("B"), ord("a")]))
+    assert [table.labels[i] for i in ids] == ["upper", "other"]
+    assert looked_up == ["a", "B", "c"]
+
+
+def test_unicode_table_threads():
+    looked_up = []
+
+    def lookup(char):
+        looked_up.append(char)
+        time.sleep(0.001)
+        return "upper" if char.isupper() else "other"
+
+    table = UnicodeTable(lookup)
+    code_points = np.array([ord(c) for c in "aBcDeF"])
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(table, [code_points] * 16))
+
+    assert sorted(looked_up) == sorted("aBcDeF")
+    assert sorted(table.labels) == ["other", "upper"]
+    for ids in results:
+        labels = [table.labels[i] for i in ids]
+        assert labels == ["other", "upper"] * 3
+
+
+def test_unicode_summary_vc():
+    summary = unicode_summary_vc(pd.Series(index=["ab", "bc"], data=[2, 1]))
+    assert summary["n_characters"] == 6
+    assert summary["n_characters_distinct"] == 3
+    assert summary["character_counts"].to_dict() == {"b": 3, "a": 2, "c": 1}
+    assert sum(s.sum() for s in summary["category_alias_char_counts"].values()) == 6
+    assert summary["script_counts"].sum() == 6
+
+
+def test_word_summary_vc_top_k():
+    words = [f"w{i}" for i in range(100)]
+    vc = pd.Series(
+        index=[f"Common, {word} rare{i}." for i, word in enumerate(words)],
+        data=[1] * 100,
+    )
+    summary = word_summary_vc(vc, top_k=2)
+    assert summary["word_counts"].to_dict() == {"common": 100, "w0": 1}
+    assert summary["approximated"] == ["word_counts"]
+
+    summary = word_summary_vc(vc, top_k=1000)
+    assert len(summary["word_counts"]) == 201
+    assert "approximated" not in summary
+
+
+def test_word_counts_vc_batches():
+    vc = pd.Series(index=["a b", "b c", "c d", "a"], data=[1, 2, 3, 4])
+    counts, approximated = word_counts_vc(vc, frozenset({"d"}), batch_size=1)
+    assert counts == {"a": 5, "b": 3, "c": 5}
+    assert not approximated
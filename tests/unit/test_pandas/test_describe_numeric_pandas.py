@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda.model.pandas.describe_numeric_pandas import mad, numeric_stats_weighted
+
+quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, 2, 2, 3, 3, 3, 10],
+        [0.5, 0.5, -1.25, 4.0, 4.0, 4.0, 4.0, 7.5],
+        [2.0] * 10,
+        [1.0, 2.0],
+        [42],
+    ],
+)
+def test_numeric_stats_weighted(values):
+    series = pd.Series(values)
+    stats = numeric_stats_weighted(series.value_counts(), quantiles)
+
+    assert stats["min"] == series.min()
+    assert stats["max"] == series.max()
+    assert stats["mad"] == mad(series.values)
+    for q, value in series.quantile(quantiles).items():
+        assert stats[f"{q:.0%}"] == value
+
+    expected = {
+        "mean": series.mean(),
+        "sum": series.sum(),
+        "std": series.std(),
+        "variance": series.var(),
+        "skewness": series.skew(),
+        "kurtosis": series.kurt(),
+    }
+    for key, value in expected.items():
+        assert stats[key] == pytest.approx(value, nan_ok=True), key
+
+
+def test_numeric_stats_weighted_tall_series():
+    rng = np.random.default_rng(0)
+    series = pd.Series(np.round(rng.normal(3, 2, 10_000), 1))
+    stats = numeric_stats_weighted(series.value_counts(), quantiles)
+
+    assert stats["mad"] == mad(series.values)
+    assert stats["50%"] == series.median()
+    assert stats["std"] == pytest.approx(series.std())
+    assert stats["skewness"] == pytest.approx(series.skew())
+    assert stats["kurtosis"] == pytest.approx(series.kurt())
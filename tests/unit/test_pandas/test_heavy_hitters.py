@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda.config import Settings
+from profunda.model.pandas.heavy_hitters_pandas import heavy_hitters, misra_gries
+from profunda.model.partial import HyperLogLog
+from profunda.model.summary import describe_1d
+
+
+@pytest.fixture
+def high_cardinality() -> pd.Series:
+    values = [f"id{i}" for i in range(20_000)] + ["hot"] * 500 + ["warm"] * 300
+    series = pd.Series(values).sample(frac=1, random_state=0).reset_index(drop=True)
+    series[::10] = np.nan
+    return series
+
+
+def test_misra_gries_keeps_frequent_values():
+    series = pd.Series(["a"] * 50 + ["b"] * 30 + list("cdefghij") * 2)
+    counters = misra_gries(series, k=2, chunksize=7)
+
+    assert set(counters.index) == {"a", "b"}
+    assert (counters <= series.value_counts()[counters.index]).all()
+
+
+def test_heavy_hitters(high_cardinality):
+    values = high_cardinality.dropna()
+    sketch = HyperLogLog()
+    counts = heavy_hitters(values, k=5, sketch=sketch)
+
+    assert len(counts) == 5
+    assert sketch.estimate() == pytest.approx(values.nunique(), rel=0.02)
+    pd.testing.assert_series_equal(counts.head(2), values.value_counts().head(2))
+
+
+def test_describe_heavy_hitters(high_cardinality, summarizer, typeset):
+    config = Settings()
+    config.heavy_hitters.enabled = False
+    exact = describe_1d(config, high_cardinality, summarizer, typeset)
+
+    # Heavy hitters are enabled by default.
+    config = Settings()
+    config.heavy_hitters.k = 10
+    approximate = describe_1d(config, high_cardinality, summarizer, typeset)
+
+    assert approximate["heavy_hitters"]
+    assert len(approximate["value_counts_without_nan"]) == 10
+    assert approximate["approximated"] == [
+        "n_distinct",
+        "n_unique",
+        "p_distinct",
+        "p_unique",
+        "value_counts_without_nan",
+    ]
+    assert approximate["n_distinct"] == pytest.approx(exact["n_distinct"], rel=0.02)
+    for key in [
+        "n_missing",
+        # The least frequent counted values occur once, so do all the others.
+        "n_unique",
+        "is_unique",
+        "mean_length",
+        "n_characters",
+    ]:
+        assert approximate[key] == exact[key], key
+    pd.testing.assert_series_equal(
+        approximate["word_counts"],
+        exact["word_counts"],
+        check_like=True,
+        check_names=False,
+    )
+
+
+def test_describe_heavy_hitters_low_cardinality(summarizer, typeset):
+    config = Settings()
+    series = pd.Series(list("abc") * 10_000)
+
+    description = describe_1d(config, series, summarizer, typeset)
+
+    assert "heavy_hitters" not in description
+    assert len(description["value_counts_without_nan"]) == 3
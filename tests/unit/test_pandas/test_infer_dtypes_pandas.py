@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda.config import Settings
+from profunda.model.pandas.infer_dtypes_pandas import (
+    infer_type_sampled,
+    pandas_infer_type,
+    stratified_sample,
+)
+from profunda.model.typeset import ProfilingTypeSet
+
+
+def _full_inference(config, series):
+    typeset = ProfilingTypeSet(config)
+    return typeset.infer_type(series), typeset.cast_to_inferred(series)
+
+
+def _sampled_config():
+    config = Settings()
+    config.type_inference.sample_size = 100
+    return config
+
+
+def test_stratified_sample():
+    counts = np.array([1, 50, 3, 7, 2, 9])
+    assert list(stratified_sample(counts, 10)) == [1, 5, 3, 2, 4, 0]
+    assert list(stratified_sample(counts, 3)) == [1, 3, 0]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [str(i % 700) for i in range(2000)] + [np.nan] * 10,
+        [f"{i / 7:.3f}" for i in range(1000)],
+        list(
+            pd.date_range("2020-01-01", periods=1000, freq="h").strftime(
+                "%Y-%m-%d %H:%M"
+            )
+        )
+        + [np.nan],
+        [f"item {i}" for i in range(1000)],
+        [str(i) for i in range(999)] + ["not a number"],
+    ],
+)
+def test_pandas_infer_type_sampled(values):
+    config = _sampled_config()
+    series = pd.Series(values, name="column")
+    assert infer_type_sampled(config, ProfilingTypeSet(config), series) is not None
+
+    vtype, cast = pandas_infer_type(config, ProfilingTypeSet(config), series)
+    expected_type, expected = _full_inference(config, series)
+    assert str(vtype) == str(expected_type)
+    pd.testing.assert_series_equal(cast, expected)
+
+
+def test_infer_type_sampled_verification_fails():
+    config = _sampled_config()
+    # The value that is not a number is ranked between the sampled values.
+    numbers = [str(i) for i in range(1000, 2000)]
+    values = [str(i) for i in range(1000)] * 3 + numbers[:5] + ["x"] + numbers[5:]
+    series = pd.Series(values, name="column")
+    typeset = ProfilingTypeSet(config)
+    assert infer_type_sampled(config, typeset, series) is None
+    vtype, _ = pandas_infer_type(config, typeset, series)
+    assert str(vtype) == "Text"
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series(["a", "b"] * 500),
+        pd.Series(range(1000)),
+        pd.Series([str(i) for i in range(1000)], dtype="category"),
+    ],
+)
+def test_infer_type_sampled_skipped(series):
+    config = _sampled_config()
+    assert infer_type_sampled(config, ProfilingTypeSet(config), series) is None
+
+
+def test_pandas_infer_type_full_by_default(monkeypatch):
+    config = Settings()
+    assert config.type_inference.sample_size == 0
+    sampled = []
+    monkeypatch.setattr(
+        "profunda.model.pandas.infer_dtypes_pandas.infer_type_sampled",
+        lambda *args: sampled.append(args),
+    )
+    series = pd.Series([str(i) for i in range(2000)], name="column")
+
+    vtype, cast = pandas_infer_type(config, ProfilingTypeSet(config), series)
+    assert not sampled
+    expected_type, expected = _full_inference(config, series)
+    assert str(vtype) == str(expected_type)
+    pd.testing.assert_series_equal(cast, expected)
@@ -0,0 +1,80 @@
+import pandas as pd
+
+from profunda import ProfileReport
+from profunda.config import Settings
+from profunda.model.context import ProfilingContext, profiling_context
+from profunda.model.describe import describe
+from profunda.model.performance import measure, measure_stage
+from profunda.model.typeset import ProfilingTypeSet
+
+
+def test_measure():
+    records = []
+    with measure(records, "Compute", column="a", rows=3):
+        sum(range(1000))
+
+    assert len(records) == 1
+    record = records[0]
+    assert record["stage"] == "Compute"
+    assert record["column"] == "a"
+    assert record["rows"] == 3
+    assert record["wall_time"] >= 0
+    assert record["cpu_time"] >= 0
+    assert record["peak_rss_delta"] is None or record["peak_rss_delta"] >= 0
+
+
+def test_measure_stage_rows_default():
+    with profiling_context(ProfilingContext(n_rows=10)) as context:
+        with measure_stage("Stage"):
+            pass
+        with measure_stage("Column", column="a", rows=5):
+            pass
+
+    assert [(r["stage"], r["column"], r["rows"]) for r in context.performance] == [
+        ("Stage", None, 10),
+        ("Column", "a", 5),
+    ]
+
+
+def test_describe_performance(summarizer):
+    config = Settings()
+    config.progress_bar = False
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "z"]})
+
+    description = describe(config, df, summarizer, ProfilingTypeSet(config))
+
+    columns = {
+        record["column"]: record["rows"]
+        for record in description.performance
+        if record["stage"] == "Describe variable"
+    }
+    assert columns == {"a": 4, "b": 4}
+    stages = {record["stage"] for record in description.performance}
+    assert {"Describe variables", "Get alerts"} <= stages
+
+
+def test_performance_html():
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    report = ProfileReport(df, progress_bar=False, minimal=True)
+    report.config.html.performance_show = True
+    assert "Profiling performance" in report.to_html()
+
+    report = ProfileReport(df, progress_bar=False, minimal=True)
+    assert "Profiling performance" not in report.to_html()
+
+
+def test_render_performance():
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    report = ProfileReport(df, progress_bar=False, minimal=True)
+
+    first = report.to_json()
+    report.to_html()
+    report.invalidate_cache("rendering")
+
+    # The description does not record the exports.
+    assert report.to_json() == first
+    assert [record["stage"] for record in report.render_performance] == [
+        "Generate report structure",
+        "Render HTML",
+        "Render JSON",
+    ]
@@ -0,0 +1,120 @@
+import multiprocessing
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from profunda.config import Settings
+from profunda.model.describe import describe
+from profunda.model.scheduler import TaskGraph, get_pool_size, get_stage_frames
+from profunda.model.typeset import ProfilingTypeSet
+
+
+def test_task_graph_dependencies():
+    graph = TaskGraph()
+    graph.add("a", lambda _: 1)
+    graph.add("b", lambda r: r["a"] + 1, depends_on=["a"])
+    graph.add("c", lambda _: 10)
+    graph.add("d", lambda r: r["b"] + r["c"], depends_on=["b", "c"])
+
+    for pool_size in (1, 4):
+        results = graph.run(pool_size)
+        assert list(results) == ["a", "b", "c", "d"]
+        assert results == {"a": 1, "b": 2, "c": 10, "d": 12}
+
+
+def test_task_graph_concurrent():
+    barrier = threading.Barrier(2, timeout=5)
+
+    graph = TaskGraph()
+    graph.add("a", lambda _: barrier.wait())
+    graph.add("b", lambda _: barrier.wait())
+
+    # Both tasks only finish when running at the same time.
+    graph.run(pool_size=2)
+
+
+def test_task_graph_exclusive():
+    running = []
+    overlaps = []
+
+    def task(_: dict) -> None:
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        running.pop()
+
+    graph = TaskGraph()
+    for name in "abcd":
+        graph.add(name, task, exclusive=True)
+    graph.run(pool_size=4)
+
+    assert overlaps == [1, 1, 1, 1]
+
+
+def test_task_graph_errors():
+    graph = TaskGraph()
+    graph.add("a", lambda _: 1)
+    with pytest.raises(ValueError, match="already defined"):
+        graph.add("a", lambda _: 2)
+    with pytest.raises(ValueError, match="unknown"):
+        graph.add("b", lambda _: 2, depends_on=["c"])
+
+    def fail(_: dict) -> None:
+        raise RuntimeError("stage failed")
+
+    graph.add("b", fail, depends_on=["a"])
+    graph.add("c", lambda _: 3, depends_on=["b"])
+    with pytest.raises(RuntimeError, match="stage failed"):
+        graph.run(pool_size=2)
+
+
+def test_describe_concurrent_stages(summarizer):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, 5, 5],
+            "b": [2.0, 4.0, None, 8.0, 10.0, 10.0],
+            "c": ["x", "y", "x", "z", "x", "x"],
+        }
+    )
+
+    descriptions = []
+    for pool_size in (1, 4):
+        config = Settings()
+        config.progress_bar = False
+        config.pool_size = pool_size
+        config.concurrent_stages = True
+        descriptions.append(describe(config, df, summarizer, ProfilingTypeSet(config)))
+    sequential, concurrent = descriptions
+
+    assert concurrent.table == sequential.table
+    assert list(concurrent.correlations) == list(sequential.correlations)
+    assert list(concurrent.missing) == list(sequential.missing)
+    assert concurrent.scatter.keys() == sequential.scatter.keys()
+    assert [str(alert) for alert in concurrent.alerts] == [
+        str(alert) for alert in sequential.alerts
+    ]
+    pd.testing.assert_frame_equal(concurrent.duplicates, sequential.duplicates)
+
+
+def test_describe_stages_sequential_by_default():
+    config = Settings()
+    config.pool_size = 4
+    pool_size, _ = get_stage_frames(config, pd.DataFrame({"a": [1]}))
+
+    assert pool_size == 1
+
+
+@pytest.mark.parametrize(
+    "pool_size, expected",
+    [(3, 3), (0, multiprocessing.cpu_count()), (-1, multiprocessing.cpu_count())],
+)
+def test_get_pool_size(pool_size, expected):
+    config = Settings()
+    config.pool_size = pool_size
+    config.concurrent_stages = True
+    config.ibis.concurrent = True
+
+    assert get_pool_size(config) == expected
+    assert get_stage_frames(config, pd.DataFrame({"a": [1]}))[0] == expected
@@ -0,0 +1,35 @@
+import time
+
+from profunda.model.trace import QueryTrace, query_labels, to_chrome_trace
+
+
+def test_query_trace_labels():
+    trace = QueryTrace()
+
+    with query_labels(stage="Describe variables"):
+        with query_labels(column="a"):
+            trace.record("SELECT 1", time.perf_counter(), time.perf_counter(), 1)
+        trace.record("SELECT 2", time.perf_counter(), time.perf_counter(), 2)
+    trace.record("SELECT 3", time.perf_counter(), time.perf_counter(), 3)
+
+    labels = [(r["stage"], r["column"], r["rows"]) for r in trace.records]
+    assert labels == [
+        ("Describe variables", "a", 1),
+        ("Describe variables", None, 2),
+        (None, None, 3),
+    ]
+
+
+def test_to_chrome_trace():
+    trace = QueryTrace()
+    with query_labels(stage="Get alerts"):
+        trace.record("SELECT 1", trace.start + 1, trace.start + 1.5, 10)
+
+    events = to_chrome_trace(trace.records)["traceEvents"]
+
+    assert len(events) == 1
+    assert events[0]["ph"] == "X"
+    assert events[0]["name"] == "Get alerts"
+    assert events[0]["ts"] == 1e6
+    assert events[0]["dur"] == 0.5e6
+    assert events[0]["args"]["sql"] == "SELECT 1"
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from profunda import ProfileReport
+from profunda.config import Settings
+from profunda.model.pandas.infer_dtypes_pandas import (
+    column_fingerprint,
+    pandas_infer_type,
+)
+from profunda.model.type_cache import TypeCache, get_type_cache
+from profunda.model.typeset import ProfilingTypeSet
+
+
+@pytest.fixture
+def cache_config(tmp_path):
+    config = Settings()
+    config.type_inference.cache = True
+    config.type_inference.cache_dir = str(tmp_path)
+    return config
+
+
+def test_type_cache_lru(tmp_path):
+    cache = TypeCache(tmp_path, max_entries=2)
+    cache.put("a", ["Unsupported", "Text"])
+    cache.put("b", ["Unsupported", "Numeric"])
+    assert cache.get("a") == ["Unsupported", "Text"]
+    cache.put("c", ["Unsupported", "Boolean"])
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == ["Unsupported", "Text"]
+    assert cache.get("c") == ["Unsupported", "Boolean"]
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_type_cache_unusable(tmp_path):
+    directory = tmp_path / "file"
+    directory.write_text("not a directory")
+    cache = TypeCache(directory, max_entries=10)
+    with pytest.warns(UserWarning, match="unusable"):
+        cache.put("a", ["Unsupported", "Text"])
+    assert cache.get("a") is None
+
+
+def test_column_fingerprint(cache_config):
+    typeset = ProfilingTypeSet(cache_config)
+    series = pd.Series(["1", "2", "3", np.nan] * 5, name="x")
+    key = column_fingerprint(cache_config, typeset, series)
+
+    assert key == column_fingerprint(cache_config, typeset, series[::-1])
+    assert key != column_fingerprint(cache_config, typeset, series.rename("y"))
+    assert key != column_fingerprint(cache_config, typeset, series.replace("3", "4"))
+    assert key != column_fingerprint(cache_config, typeset, series.iloc[1:])
+
+
+def test_pandas_infer_type_cached(cache_config):
+    series = pd.Series([str(i % 70) + ".5" for i in range(100)] + [np.nan], name="x")
+    cache = get_type_cache(
+        cache_config.type_inference.cache_dir, cache_config.type_inference.cache_size
+    )
+
+    vtype, cast = pandas_infer_type(
+        cache_config, ProfilingTypeSet(cache_config), series
+    )
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    typeset = ProfilingTypeSet(cache_config)
+    cached_type, cached = pandas_infer_type(cache_config, typeset, series)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert str(cached_type) == str(vtype) == "Numeric"
+    pd.testing.assert_series_equal(cached, cast)
+
+
+def test_profile_report_cached_types(cache_config, tmp_path):
+    df = pd.DataFrame(
+        {
+            "number": [str(i) for i in range(100)],
+            "date": pd.date_range("2020-01-01", periods=100).strftime("%Y-%m-%d"),
+            "flag": ["yes", "no"] * 50,
+        }
+    )
+    first = ProfileReport(df, config=cache_config, progress_bar=False)
+    second = ProfileReport(df, config=cache_config, progress_bar=False)
+
+    types = {k: v["type"] for k, v in first.get_description().variables.items()}
+    assert types == {"number": "Numeric", "date": "DateTime", "flag": "Boolean"}
+    assert types == {
+        k: v["type"] for k, v in second.get_description().variables.items()
+    }
+    assert len(get_type_cache(str(tmp_path), 10000)) == 3
+
+
+def test_type_cache_disabled(tmp_path):
+    config = Settings()
+    config.type_inference.cache_dir = str(tmp_path)
+    pandas_infer_type(config, ProfilingTypeSet(config), pd.Series(["1", "2"]))
+    assert not (tmp_path / "types.sqlite").exists()
@@ -7,6 +7,7 @@ from profunda.utils.compat import pandas_version_info
 from profunda.utils.dataframe import (
     expand_mixed,
     read_pandas,
+    read_pandas_chunks,
     uncompressed_extension,
     warn_read,
 )
@@ -72,6 +73,23 @@ def test_remove_unsupported_ext():
         read_pandas(Path("dataset.json.tar.gz"))
 
 
+@pytest.mark.parametrize("extension", [".csv", ".tsv", ".jsonl", ".parquet"])
+def test_read_pandas_chunks(tmp_path, extension):
+    df = pd.DataFrame({"a": range(10), "b": list("abcdefghij")})
+    file_name = tmp_path / f"dataset{extension}"
+    if extension == ".parquet":
+        df.to_parquet(file_name)
+    elif extension == ".jsonl":
+        df.to_json(file_name, orient="records", lines=True)
+    else:
+        df.to_csv(file_name, sep="\t" if extension == ".tsv" else ",", index=False)
+
+    chunks = list(read_pandas_chunks(file_name, 4))
+
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
 def patch_arg(d, new_name):
     """Patch until this PR is released: https://github.com/dylan-profiler/visions/pull/172"""
     if isinstance(d["argnames"], str):